@@ -0,0 +1,39 @@
+"""
+Compare la recherche naïve des mots interdits avec l'automate Aho-Corasick.
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m benchmarks.bench_matcher
+"""
+import random
+import string
+import timeit
+
+from utils.matcher import BannedWordMatcher
+
+SIZES = (10, 1_000, 50_000)
+MESSAGE = (
+    "salut tout le monde, quelqu'un est chaud pour une partie ce soir ? "
+    "je lance le serveur vers 21h, ramenez vos potes et votre bonne humeur !"
+)
+
+
+def random_words(count, seed=42):
+    rng = random.Random(seed)
+    return {"".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10))) for _ in range(count)}
+
+
+def main():
+    print(f"{'mots':>8} | {'naïf (µs)':>12} | {'aho-corasick (µs)':>18} | gain")
+    for size in SIZES:
+        words = list(random_words(size))
+        matcher = BannedWordMatcher(words)
+        matcher.search("")  # Construit les liens d'échec hors chronométrage
+
+        runs = max(10, 20_000 // size)
+        naive = timeit.timeit(lambda: any(word in MESSAGE for word in words), number=runs) / runs
+        compiled = timeit.timeit(lambda: matcher.search(MESSAGE), number=runs) / runs
+        print(f"{size:>8} | {naive * 1e6:>12.1f} | {compiled * 1e6:>18.1f} | x{naive / compiled:.1f}")
+
+
+if __name__ == "__main__":
+    main()
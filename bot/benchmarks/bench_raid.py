@@ -0,0 +1,48 @@
+"""
+Compare le calcul SimHash bit par bit (64 passes sur les jetons) avec l'accumulation
+par tables d'octets de `utils.raid.simhash`.
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m benchmarks.bench_raid
+"""
+import random
+import string
+import timeit
+
+from utils.raid import MAX_TOKENS, SHINGLE, SIMHASH_BITS, _hash64, simhash
+
+LENGTHS = (30, 100, 300)
+RUNS = 2_000
+
+
+def naive_simhash(tokens):
+    hashes = [_hash64(token) for token in set(tokens)]
+    threshold = len(hashes) / 2
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        mask = 1 << bit
+        if sum(1 for h in hashes if h & mask) > threshold:
+            fingerprint |= mask
+    return fingerprint
+
+
+def shingles(text):
+    return [text[i:i + SHINGLE] for i in range(min(len(text) - SHINGLE + 1, MAX_TOKENS))]
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'longueur':>8} | {'bit par bit (µs)':>17} | {'tables (µs)':>12} | gain")
+    for length in LENGTHS:
+        messages = [
+            shingles("".join(rng.choices(string.ascii_lowercase, k=length))) for _ in range(RUNS)
+        ]
+        assert all(naive_simhash(tokens) == simhash(tokens) for tokens in messages)
+
+        naive = timeit.timeit(lambda: [naive_simhash(tokens) for tokens in messages], number=1) / RUNS
+        tables = timeit.timeit(lambda: [simhash(tokens) for tokens in messages], number=1) / RUNS
+        print(f"{length:>8} | {naive * 1e6:>17.1f} | {tables * 1e6:>12.1f} | x{naive / tables:.1f}")
+
+
+if __name__ == "__main__":
+    main()
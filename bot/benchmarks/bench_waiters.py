@@ -0,0 +1,68 @@
+"""
+Compare le coût d'un message entrant selon le nombre d'attentes en cours :
+parcours de tous les prédicats (comportement de `bot.wait_for`) contre le
+registre indexé par (salon, auteur).
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m benchmarks.bench_waiters
+"""
+import asyncio
+import timeit
+
+from utils.waiters import WaiterRegistry
+
+SIZES = (10, 100, 1_000, 10_000)
+
+
+class _Snowflake:
+    __slots__ = ("id",)
+
+    def __init__(self, id):
+        self.id = id
+
+
+class _Message:
+    __slots__ = ("author", "channel", "content")
+
+    def __init__(self, author_id, channel_id, content):
+        self.author = _Snowflake(author_id)
+        self.channel = _Snowflake(channel_id)
+        self.content = content
+
+
+def linear_scan(listeners, message):
+    """Reproduit `ConnectionState.dispatch` : chaque prédicat est évalué pour chaque message."""
+    for future, check in listeners:
+        if future.done():
+            continue
+        if check(message):
+            return True
+    return False
+
+
+async def run():
+    loop = asyncio.get_running_loop()
+    # Message d'un utilisateur qui ne joue pas : pire cas pour le parcours linéaire
+    message = _Message(author_id=-1, channel_id=-1, content="salut")
+
+    print(f"{'attentes':>9} | {'wait_for (µs)':>14} | {'registre (µs)':>14}")
+    for size in SIZES:
+        listeners = []
+        registry = WaiterRegistry()
+        for player in range(size):
+            channel_id = player % 50
+
+            def check(m, player=player, channel_id=channel_id):
+                return m.channel.id == channel_id and m.author.id == player
+
+            listeners.append((loop.create_future(), check))
+            registry.register(player, channel_id)
+
+        runs = 2_000
+        linear = timeit.timeit(lambda: linear_scan(listeners, message), number=runs) / runs
+        indexed = timeit.timeit(lambda: registry.resolve(message), number=runs) / runs
+        print(f"{size:>9} | {linear * 1e6:>14.2f} | {indexed * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -2,6 +2,7 @@ import discord
 import random
 from discord.ext import commands
 from utils.logger import logger
+from utils.router import MessageContext
 
 class Bingo(commands.Cog):
     def __init__(self, bot):
@@ -9,6 +10,16 @@ class Bingo(commands.Cog):
         self.current_bingo = None
         self.players = []
 
+    def cog_unload(self):
+        self.bot.message_router.unwatch_all(self.handle_guess)
+
+    def end_game(self):
+        """Termine la partie en cours et cesse d'écouter le salon de jeu."""
+        if self.current_bingo:
+            self.bot.message_router.unwatch_channel(self.current_bingo["channel_id"], self.handle_guess)
+        self.current_bingo = None
+        self.players = []
+
     @commands.hybrid_command(name="bingo", help="Commandes pour gérer le jeu de Bingo.")
     async def bingo(self, ctx):
         """
@@ -53,9 +64,12 @@ class Bingo(commands.Cog):
             "guesses": [],
             "max_number": max_number,
             "hints": hints,
-            "start_time": discord.utils.utcnow()
+            "start_time": discord.utils.utcnow(),
+            "channel_id": ctx.channel.id
         }
         self.players = []
+        # Seuls les messages du salon de jeu sont transmis au Bingo
+        self.bot.message_router.watch_channel(ctx.channel.id, self.handle_guess)
 
         embed = discord.Embed(
             title="✨ Bingo lancé !",
@@ -114,18 +128,17 @@ class Bingo(commands.Cog):
         )
         embed.add_field(name="🎯 Nombre à trouver", value=str(self.current_bingo["number"]), inline=False)
         await ctx.send(embed=embed)
-        self.current_bingo = None
-        self.players = []
+        self.end_game()
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if not self.current_bingo or message.author.bot:
+    async def handle_guess(self, context: MessageContext):
+        """Traite une proposition envoyée dans le salon de la partie en cours."""
+        if not self.current_bingo:
             return
 
-        try:
-            guess = int(message.content)
-        except ValueError:
+        guess = context.int_value
+        if guess is None:
             return
+        message = context.message
 
         if guess in self.current_bingo["guesses"]:
             await message.channel.send(f"{message.author.mention}, ce nombre a déjà été proposé !", delete_after=5)
@@ -143,8 +156,7 @@ class Bingo(commands.Cog):
             embed.add_field(name="🎯 Nombre trouvé", value=str(self.current_bingo["number"]), inline=False)
             embed.set_footer(text=f"Le nombre a été trouvé en {elapsed_time} secondes !", icon_url=self.bot.user.avatar.url)
             await message.channel.send(embed=embed)
-            self.current_bingo = None
-            self.players = []
+            self.end_game()
             return
 
         if self.current_bingo["hints"] and self.current_bingo["max_number"] > 200:
@@ -1,5 +1,4 @@
 import os
-import json
 from discord.ext import commands
 from discord import ui, ButtonStyle
 from blagues_api import BlaguesAPI
@@ -15,19 +14,8 @@ if not token:
 
 blagues = BlaguesAPI(token)
 
-# Charger ou créer le fichier de configuration des catégories autorisées
-CONFIG_FILE = "blague_config.json"
-def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, "r", encoding="utf-8") as file:
-            return json.load(file)
-    return {"allowed_categories": []}  # Par défaut, aucune restriction
-
-def save_config(config):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as file:
-        json.dump(config, file, ensure_ascii=False, indent=4)
-
-config = load_config()
+# Configuration des catégories autorisées, chargée depuis la base de données
+config = {"allowed_categories": []}  # Par défaut, aucune restriction
 
 # Créer une vue interactive pour les blagues
 class JokeView(ui.View):
@@ -51,6 +39,9 @@ class JokeCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def cog_load(self):
+        config.update(await self.bot.storage.get_namespace("blague"))
+
     @commands.hybrid_command(name="blague", description="Obtenez une blague aléatoire.")
     async def joke(self, ctx):
         """Commande principale pour obtenir une blague aléatoire."""
@@ -81,7 +72,7 @@ class JokeCommands(commands.Cog):
 
         # Sauvegarder la configuration
         config["allowed_categories"] = allowed_categories
-        save_config(config)
+        await self.bot.storage.set_value("blague", "allowed_categories", allowed_categories)
 
 async def setup(bot):
     await bot.add_cog(JokeCommands(bot))
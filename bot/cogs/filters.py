@@ -1,99 +1,282 @@
 import asyncio
-import json
 import os
+from datetime import datetime, timedelta, timezone
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from utils.logger import logger
+from utils.matcher import BannedWordMatcher
+from utils.normalize import normalize_word
+from utils.purge import BurstPurger
+from utils.raid import RaidDetector, author_weight
+from utils.router import MessageContext
+from utils.spam import SpamTracker
+
+RAID_TIMEOUT = timedelta(minutes=10)
+RAID_SLOWMODE = 30
+RAID_SLOWMODE_DURATION = 600  # Durée minimale du mode lent ; il est levé une fois le raid terminé
+
+# `banned_words` à None : le serveur utilise la liste globale par défaut
+DEFAULT_CONFIG = {"banned_words": None, "spam_threshold": None, "raid_threshold": None}
+
 
 class Filters(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.user_messages = {}
-        self.banned_words_file = "data/banned_words.json"  # Nouveau chemin
-        self.banned_words = self.load_banned_words()
-
-    def load_banned_words(self):
-        """Charge la liste des mots interdits depuis un fichier JSON."""
-        os.makedirs("data", exist_ok=True)  # Crée le dossier data s'il n'existe pas
-        if not os.path.exists(self.banned_words_file):
-            logger.warning(f"Fichier '{self.banned_words_file}' introuvable. Création avec des valeurs par défaut.")
-            default_words = ["spam", "insulte", "mot_interdit"]
-            with open(self.banned_words_file, "w") as file:
-                json.dump(default_words, file, indent=4)
-            return default_words
+        self.spam_tracker = SpamTracker()
+        self.purger = BurstPurger()
+        self.raid_detector = RaidDetector()
+        self.slowmodes = {}  # channel_id -> (mode lent d'origine, tâche de rétablissement)
+        self.banned_words = []  # Liste globale, utilisée par les serveurs sans liste propre
+        self.matcher = BannedWordMatcher()
+        self.guild_matchers = {}  # guild_id -> automate des serveurs ayant leur propre liste
+        self.bot.guild_config.register("filters", DEFAULT_CONFIG)
+        self.bot.guild_config.subscribe("filters", self.apply_config)
+        self.sweep_spam_tracker.start()
+        self.bot.message_router.subscribe(self.handle_message)
 
-        try:
-            with open(self.banned_words_file, "r") as file:
-                return json.load(file)
-        except Exception as e:
-            logger.error(f"Erreur lors du chargement des mots interdits : {e}")
-            return []
-
-    def save_banned_words(self):
-        """Sauvegarde la liste des mots interdits dans un fichier JSON."""
-        try:
-            with open(self.banned_words_file, "w") as file:
-                json.dump(self.banned_words, file, indent=4)
-            logger.info(f"Liste des mots interdits sauvegardée avec succès dans '{self.banned_words_file}'.")
-        except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde des mots interdits : {e}")
+    async def cog_load(self):
+        """Charge la liste globale des mots interdits depuis la base de données."""
+        self.banned_words = await self.bot.storage.banned_words()
+        self.matcher = BannedWordMatcher(normalize_word(word) for word in self.banned_words)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Filtre les messages interdits et détecte le spam."""
-        if message.author.bot:
-            return
+    async def cog_unload(self):
+        self.sweep_spam_tracker.cancel()
+        self.bot.message_router.unwatch_all(self.handle_message)
+        self.bot.guild_config.unsubscribe("filters", self.apply_config)
+        await self.purger.close()
+        # Les salons encore en mode lent retrouvent leur réglage d'origine
+        for channel_id, (_, task) in list(self.slowmodes.items()):
+            task.cancel()
+            await self.restore_slowmode(channel_id)
+
+    def apply_config(self, guild_id, config):
+        """Applique la configuration d'un serveur (appelé au chargement et à chaque modification)."""
+        words = config["banned_words"]
+        if words is None:
+            self.guild_matchers.pop(guild_id, None)
+        else:
+            keys = {normalize_word(word) for word in words}
+            matcher = self.guild_matchers.get(guild_id)
+            if matcher is None:
+                self.guild_matchers[guild_id] = BannedWordMatcher(keys)
+            else:
+                # Mise à jour incrémentale de l'automate plutôt qu'une reconstruction complète
+                for key in list(matcher.words - keys):
+                    matcher.remove(key)
+                for key in list(keys - matcher.words):
+                    matcher.add(key)
+
+        spam = config["spam_threshold"]
+        if spam:
+            self.spam_tracker.set_threshold(guild_id, spam["max_messages"], spam["window"])
+        else:
+            self.spam_tracker.clear_threshold(guild_id)
+
+        raid = config["raid_threshold"]
+        if raid:
+            self.raid_detector.set_threshold(guild_id, raid["min_authors"], raid["window"])
+        else:
+            self.raid_detector.clear_threshold(guild_id)
+
+    async def get_banned_words(self, guild_id):
+        config = await self.bot.guild_config.get(guild_id, "filters")
+        words = config["banned_words"]
+        return self.banned_words if words is None else words
+
+    @tasks.loop(minutes=1)
+    async def sweep_spam_tracker(self):
+        """Oublie les utilisateurs inactifs pour borner la mémoire du détecteur de spam."""
+        now = asyncio.get_running_loop().time()
+        self.purger.sweep(now)
+        evicted = self.spam_tracker.sweep(now)
+        if evicted:
+            logger.debug(f"{evicted} utilisateur(s) inactif(s) retiré(s) du détecteur de spam.")
+
+    async def handle_message(self, context: MessageContext):
+        """Filtre les messages interdits et détecte le spam. Retourne True si le message est supprimé."""
+        message = context.message
+        guild_id = context.guild_id
+        # Premier message d'un serveur : sa configuration est chargée une fois, puis lue en mémoire
+        if guild_id is not None and self.bot.guild_config.peek(guild_id, "filters") is None:
+            await self.bot.guild_config.get(guild_id, "filters")
+        # Normalisation unique, partagée par toutes les règles et tous les cogs
+        normalized = context.normalized
+        if await self.check_banned_words(message, normalized):
+            return True
+        if message.guild and await self.check_raid(message, normalized):
+            return True
+        return await self.check_spam(message)
+
+    async def check_banned_words(self, message: discord.Message, normalized):
+        """Supprime le message s'il contient un mot interdit. Retourne True si c'est le cas."""
+        matcher = self.guild_matchers.get(message.guild.id, self.matcher) if message.guild else self.matcher
+        if not matcher.search(normalized.compact):
+            return False
+
+        # En pleine rafale, la suppression est groupée et un seul récapitulatif est envoyé
+        if message.guild and self.purger.flag(message, "mot interdit"):
+            return True
+
+        await message.delete()
+
+        # Chargement de l'image locale pour l'embed
+        image_path = "assets/lldd_bot_dsgn.jpg"
+        if not os.path.exists(image_path):
+            logger.warning(f"⚠️ L'image '{image_path}' est introuvable.")
+            file = None
+        else:
+            file = discord.File(image_path, filename="lldd_bot_dsgn.jpg")
+
+        embed = discord.Embed(
+            title="🚫 Message supprimé",
+            description=f"**{message.author.mention}**, ton message contenait un mot interdit !",
+            color=discord.Color.dark_embed(),
+        )
+        if file:
+            embed.set_thumbnail(url="attachment://lldd_bot_dsgn.jpg")
+
+        await message.channel.send(file=file, embed=embed, delete_after=5)
+        logger.info(f"Message supprimé : '{message.content}' de {message.author}.")
+        return True
+
+    async def check_raid(self, message: discord.Message, normalized):
+        """Détecte un même contenu publié par plusieurs comptes. Retourne True si le message est un raid."""
+        author = message.author
+        # Les modérateurs ne sont jamais comptés ni sanctionnés
+        if isinstance(author, discord.Member) and author.guild_permissions.manage_messages:
+            return False
+        now = asyncio.get_running_loop().time()
+        alert = self.raid_detector.observe(
+            message.guild.id, author.id, normalized, now, (message.channel.id, message.id), self.raid_weight(author)
+        )
+        if alert is None:
+            return False
+
+        if alert.new:
+            await self.lockdown(message, alert)
+        else:
+            # Raid déjà signalé : on supprime et on isole les nouveaux participants
+            if not self.purger.flag(message, "raid"):
+                await message.delete()
+            await self.timeout_raiders(message.guild, alert.authors)
+        return True
+
+    @staticmethod
+    def raid_weight(author):
+        """Poids d'un auteur pour la détection des raids : les comptes et arrivées récents comptent davantage."""
+        now = datetime.now(timezone.utc)
+        account_age = (now - author.created_at).total_seconds()
+        joined_at = getattr(author, "joined_at", None)
+        member_age = (now - joined_at).total_seconds() if joined_at else None
+        return author_weight(account_age, member_age)
 
-        # Détection des mots interdits
-        lowered_content = message.content.lower()
-        if any(word in lowered_content for word in self.banned_words):
-            await message.delete()
+    async def lockdown(self, message: discord.Message, alert):
+        """Supprime les messages du raid, isole ses auteurs et active le mode lent du salon."""
+        guild = message.guild
+        by_channel = {}
+        for channel_id, message_id in alert.messages:
+            by_channel.setdefault(channel_id, []).append(discord.Object(id=message_id))
+        for channel_id, objects in by_channel.items():
+            channel = guild.get_channel(channel_id)
+            if channel is None:
+                continue
+            try:
+                for start in range(0, len(objects), 100):
+                    await channel.delete_messages(objects[start:start + 100], reason="Raid détecté")
+            except discord.HTTPException as e:
+                logger.error(f"❌ Impossible de supprimer les messages du raid dans '{channel}' : {e}")
 
-            # Chargement de l'image locale pour l'embed
-            image_path = "assets/lldd_bot_dsgn.jpg"
-            if not os.path.exists(image_path):
-                logger.warning(f"⚠️ L'image '{image_path}' est introuvable.")
-                file = None
+        await self.timeout_raiders(guild, alert.authors)
+
+        channel = message.channel
+        if (
+            channel.id not in self.slowmodes
+            and channel.permissions_for(guild.me).manage_channels
+            and channel.slowmode_delay < RAID_SLOWMODE
+        ):
+            previous = channel.slowmode_delay
+            try:
+                await channel.edit(slowmode_delay=RAID_SLOWMODE, reason="Raid détecté")
+            except discord.HTTPException as e:
+                logger.error(f"❌ Impossible d'activer le mode lent dans '{channel}' : {e}")
             else:
-                file = discord.File(image_path, filename="lldd_bot_dsgn.jpg")
+                task = asyncio.create_task(self.end_slowmode(guild.id, channel.id))
+                self.slowmodes[channel.id] = (previous, task)
 
-            embed = discord.Embed(
-                title="🚫 Message supprimé",
-                description=f"**{message.author.mention}**, ton message contenait un mot interdit !",
-                color=discord.Color.dark_embed(),
-            )
-            if file:
-                embed.set_thumbnail(url="attachment://lldd_bot_dsgn.jpg")
+        min_authors, window = self.raid_detector.get_threshold(guild.id)
+        embed = discord.Embed(
+            title="🚨 Raid détecté",
+            description=(
+                f"Le même contenu a été publié par **{len(alert.authors)}** comptes "
+                f"en moins de **{int(window)}** secondes.\n"
+                f"🔇 Les auteurs ont été isolés et le mode lent est activé ({RAID_SLOWMODE}s)."
+            ),
+            color=discord.Color.dark_embed(),
+        )
+        await channel.send(embed=embed)
+        logger.warning(f"🚨 Raid détecté sur '{guild.name}' : {len(alert.authors)} auteurs dans '{channel}'.")
 
-            await message.channel.send(file=file, embed=embed, delete_after=5)
-            logger.info(f"Message supprimé : '{message.content}' de {message.author}.")
+    async def end_slowmode(self, guild_id, channel_id):
+        """Rétablit le mode lent d'origine une fois le raid terminé."""
+        await asyncio.sleep(RAID_SLOWMODE_DURATION)
+        _, window = self.raid_detector.get_threshold(guild_id)
+        while self.raid_detector.active(guild_id, asyncio.get_running_loop().time()):
+            await asyncio.sleep(window)
+        await self.restore_slowmode(channel_id)
+
+    async def restore_slowmode(self, channel_id):
+        previous, _ = self.slowmodes.pop(channel_id, (None, None))
+        channel = self.bot.get_channel(channel_id)
+        if previous is None or channel is None:
             return
+        try:
+            await channel.edit(slowmode_delay=previous, reason="Fin du raid")
+            logger.info(f"Mode lent de '{channel}' rétabli à {previous}s après le raid.")
+        except discord.HTTPException as e:
+            logger.error(f"❌ Impossible de rétablir le mode lent dans '{channel}' : {e}")
 
-        # Détection de spam
-        now = asyncio.get_event_loop().time()
-        if message.author.id not in self.user_messages:
-            self.user_messages[message.author.id] = []
-        self.user_messages[message.author.id].append(now)
-        self.user_messages[message.author.id] = [t for t in self.user_messages[message.author.id] if now - t < 10]
-
-        if len(self.user_messages[message.author.id]) > 5:
-            await message.delete()
-            if not getattr(message.author, "spam_warning_sent", False):
-                embed = discord.Embed(
-                    title="⚠️ Avertissement de spam",
-                    description=f"**{message.author.mention}**, arrête de spammer !",
-                    color=discord.Color.dark_purple(),
-                )
-                await message.channel.send(embed=embed, delete_after=5)
-                setattr(message.author, "spam_warning_sent", True)
-            logger.info(f"Spam détecté et message supprimé pour {message.author}.")
+    async def timeout_raiders(self, guild: discord.Guild, author_ids):
+        """Isole temporairement les auteurs d'un raid."""
+        if not guild.me.guild_permissions.moderate_members:
+            return
+        members = [guild.get_member(author_id) for author_id in author_ids]
+        results = await asyncio.gather(*(
+            member.timeout(RAID_TIMEOUT, reason="Participation à un raid")
+            for member in members
+            if member and not member.is_timed_out() and not member.guild_permissions.manage_messages
+        ), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"❌ Impossible d'isoler un participant au raid : {result}")
+
+    async def check_spam(self, message: discord.Message):
+        """Détecte le spam d'un utilisateur sur une fenêtre glissante."""
+        now = asyncio.get_running_loop().time()
+        guild_id = message.guild.id if message.guild else None
+        is_spam, should_warn = self.spam_tracker.record(guild_id, message.author.id, now)
+        if not is_spam:
+            return False
+
+        if message.guild and self.purger.flag(message, "spam"):
+            return True
+
+        await message.delete()
+        if should_warn:
+            embed = discord.Embed(
+                title="⚠️ Avertissement de spam",
+                description=f"**{message.author.mention}**, arrête de spammer !",
+                color=discord.Color.dark_purple(),
+            )
+            await message.channel.send(embed=embed, delete_after=5)
+        logger.info(f"Spam détecté et message supprimé pour {message.author}.")
+        return True
 
     @commands.hybrid_command(name="add_banned_word", description="Ajoute un mot à la liste des mots interdits.")
     async def add_banned_word(self, ctx: commands.Context, word: str):
-        """Ajoute un mot à la liste des mots interdits."""
-        if word not in self.banned_words:
-            self.banned_words.append(word)
-            self.save_banned_words()
+        """Ajoute un mot à la liste des mots interdits du serveur."""
+        banned_words = await self.get_banned_words(ctx.guild.id)
+        if word not in banned_words:
+            await self.bot.guild_config.set(ctx.guild.id, "filters", "banned_words", banned_words + [word])
             await ctx.send(embed=discord.Embed(
                 title="☑️ Mot ajouté",
                 description=f"Le mot **{word}** a été ajouté à la liste des mots interdits.",
@@ -109,10 +292,11 @@ class Filters(commands.Cog):
 
     @commands.hybrid_command(name="remove_banned_word", description="Retire un mot de la liste des mots interdits.")
     async def remove_banned_word(self, ctx: commands.Context, word: str):
-        """Retire un mot de la liste des mots interdits."""
-        if word in self.banned_words:
-            self.banned_words.remove(word)
-            self.save_banned_words()
+        """Retire un mot de la liste des mots interdits du serveur."""
+        banned_words = await self.get_banned_words(ctx.guild.id)
+        if word in banned_words:
+            remaining = [other for other in banned_words if other != word]
+            await self.bot.guild_config.set(ctx.guild.id, "filters", "banned_words", remaining)
             await ctx.send(embed=discord.Embed(
                 title="☑️ Mot retiré",
                 description=f"Le mot **{word}** a été retiré de la liste des mots interdits.",
@@ -128,17 +312,68 @@ class Filters(commands.Cog):
 
     @commands.hybrid_command(name="list_banned_words", description="Affiche la liste des mots interdits.")
     async def list_banned_words(self, ctx: commands.Context):
-        """Affiche la liste des mots interdits."""
-        banned_words_list = ", ".join(self.banned_words)
+        """Affiche la liste des mots interdits du serveur."""
+        banned_words = await self.get_banned_words(ctx.guild.id)
         embed = discord.Embed(
             title="📜 Liste des mots interdits",
-            description=banned_words_list if self.banned_words else "Aucun mot interdit configuré.",
+            description=", ".join(banned_words) if banned_words else "Aucun mot interdit configuré.",
             color=discord.Color.dark_purple(),
         )
         embed.set_footer(text=f"Demandé par {ctx.author.name}", icon_url=ctx.author.avatar.url)
         await ctx.send(embed=embed)
         logger.info("Liste des mots interdits envoyée.")
 
+    @commands.hybrid_command(name="set_spam_threshold", description="Définit le seuil anti-spam du serveur.")
+    @commands.has_permissions(administrator=True)
+    async def set_spam_threshold(self, ctx: commands.Context, max_messages: int, window: int):
+        """Définit le nombre maximum de messages autorisés sur une fenêtre de `window` secondes."""
+        if max_messages < 1 or window < 1:
+            await ctx.send(embed=discord.Embed(
+                title="❌ Erreur",
+                description="Le nombre de messages et la fenêtre doivent être supérieurs à 0.",
+                color=discord.Color.dark_embed(),
+            ))
+            return
+
+        await self.bot.guild_config.set(
+            ctx.guild.id, "filters", "spam_threshold", {"max_messages": max_messages, "window": window}
+        )
+        await ctx.send(embed=discord.Embed(
+            title="☑️ Seuil anti-spam mis à jour",
+            description=f"Au-delà de **{max_messages}** messages en **{window}** secondes, les messages seront supprimés.",
+            color=discord.Color.dark_teal(),
+        ))
+        logger.info(f"Seuil anti-spam de '{ctx.guild.name}' : {max_messages} messages / {window}s.")
+
+    @commands.hybrid_command(name="set_raid_threshold", description="Définit le seuil de détection des raids du serveur.")
+    @commands.has_permissions(administrator=True)
+    async def set_raid_threshold(self, ctx: commands.Context, min_authors: int, window: int):
+        """Définit le nombre de comptes distincts publiant le même contenu en `window` secondes."""
+        if min_authors < 2 or window < 1:
+            await ctx.send(embed=discord.Embed(
+                title="❌ Erreur",
+                description="Il faut au moins 2 comptes et une fenêtre supérieure à 0.",
+                color=discord.Color.dark_embed(),
+            ))
+            return
+
+        await self.bot.guild_config.set(
+            ctx.guild.id, "filters", "raid_threshold", {"min_authors": min_authors, "window": window}
+        )
+        await ctx.send(embed=discord.Embed(
+            title="☑️ Seuil anti-raid mis à jour",
+            description=f"Un raid sera signalé dès que **{min_authors}** comptes publient le même contenu en **{window}** secondes.",
+            color=discord.Color.dark_teal(),
+        ))
+        logger.info(f"Seuil anti-raid de '{ctx.guild.name}' : {min_authors} comptes / {window}s.")
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.raid_detector.forget_guild(guild.id)
+        self.raid_detector.clear_threshold(guild.id)
+        self.spam_tracker.clear_threshold(guild.id)
+        self.guild_matchers.pop(guild.id, None)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Filters(bot))
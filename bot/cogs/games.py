@@ -28,12 +28,9 @@ class Games(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        def check(message):
-            return message.channel == ctx.channel and message.author == ctx.author
-
         while attempts > 0:
             try:
-                msg = await self.bot.wait_for("message", check=check, timeout=30.0)
+                msg = await self.bot.waiters.wait_for(ctx.author.id, channel_id=ctx.channel.id, timeout=30.0)
                 if msg.content.lower() == question["answer"].lower():
                     await ctx.send(embed=discord.Embed(
                         title="☑️ Bonne réponse !",
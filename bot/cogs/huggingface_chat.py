@@ -1,5 +1,4 @@
 import discord
-import aiohttp
 from discord.ext import commands
 from dotenv import load_dotenv
 import os
@@ -27,14 +26,13 @@ class HuggingFaceChat(commands.Cog):
         """
         Effectue une requête à un modèle Hugging Face et renvoie la réponse ou une erreur 503.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(model_url, headers=headers, json=payload) as response:
-                if response.status == 503:
-                    raise Exception("503")  # Modèle indisponible
-                elif response.status != 200:
-                    raise Exception(f"Erreur API : {response.status}")
-                result = await response.json()
-                return result[0].get('generated_text', 'Aucune réponse générée.')
+        async with self.bot.http_client.post(model_url, headers=headers, json=payload) as response:
+            if response.status == 503:
+                raise Exception("503")  # Modèle indisponible
+            elif response.status != 200:
+                raise Exception(f"Erreur API : {response.status}")
+            result = await response.json()
+            return result[0].get('generated_text', 'Aucune réponse générée.')
 
     @commands.hybrid_command(name="ask_hf", description="Pose une question à un modèle Hugging Face.")
     async def ask_hf(self, ctx: commands.Context, *, question: str):
@@ -1,5 +1,4 @@
 import discord
-import aiohttp
 import os
 from discord.ext import commands
 from dotenv import load_dotenv
@@ -9,6 +8,12 @@ load_dotenv(dotenv_path="config")
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 
+# Durées de cache des réponses (en secondes)
+WEATHER_TTL = 600
+WEATHER_STALE_TTL = 1200
+NEWS_TTL = 900
+NEWS_STALE_TTL = 3600
+
 
 class InteractiveContent(commands.Cog):
     """Cog pour les commandes interactives : Météo et Actualités Gaming."""
@@ -16,6 +21,13 @@ class InteractiveContent(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def fetch_json(self, url):
+        """Récupère une réponse JSON, ou None si l'API renvoie une erreur."""
+        async with self.bot.http_client.get(url) as resp:
+            if resp.status != 200:
+                return None
+            return await resp.json()
+
     @commands.hybrid_command(name="weather", description="Affiche la météo actuelle d'une ville.")
     async def weather(self, ctx, *, city: str):
         """Commande pour récupérer et afficher la météo d'une ville."""
@@ -24,12 +36,13 @@ class InteractiveContent(commands.Cog):
             return
 
         url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&units=metric&appid={OPENWEATHER_API_KEY}&lang=fr"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    await ctx.send("❌ Impossible de récupérer la météo. Vérifiez le nom de la ville.")
-                    return
-                data = await resp.json()
+        data = await self.bot.response_cache.get_or_fetch(
+            f"weather:{city.strip().lower()}", lambda: self.fetch_json(url),
+            ttl=WEATHER_TTL, stale_ttl=WEATHER_STALE_TTL
+        )
+        if not data:
+            await ctx.send("❌ Impossible de récupérer la météo. Vérifiez le nom de la ville.")
+            return
 
         weather_desc = data["weather"][0]["description"].capitalize()
         temp = data["main"]["temp"]
@@ -59,12 +72,12 @@ class InteractiveContent(commands.Cog):
             return
 
         url = f"https://newsapi.org/v2/everything?q=gaming&language=fr&sortBy=publishedAt&pageSize=5&apiKey={NEWS_API_KEY}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    await ctx.send("❌ Impossible de récupérer les actualités gaming.")
-                    return
-                data = await resp.json()
+        data = await self.bot.response_cache.get_or_fetch(
+            "news:gaming", lambda: self.fetch_json(url), ttl=NEWS_TTL, stale_ttl=NEWS_STALE_TTL
+        )
+        if not data:
+            await ctx.send("❌ Impossible de récupérer les actualités gaming.")
+            return
 
         articles = data.get("articles", [])
         if not articles:
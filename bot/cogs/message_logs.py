@@ -1,141 +1,339 @@
 import discord
-import json
-import os
-from discord.ext import commands
+import time
+from datetime import datetime, timezone
+from discord.ext import commands, tasks
+from utils.log_batcher import LogBatcher
 from utils.logger import logger
+from utils.message_store import DEFAULT_BUDGET, MessageStore
 
-# Chemin vers le fichier JSON dans le dossier 'data'
-CONFIG_DIR = "data"
-LOG_CONFIG_FILE = os.path.join(CONFIG_DIR, "log_config.json")
+MIN_BUFFER_KB = 16
+MAX_BUFFER_KB = 4096
+FIELD_LIMIT = 1024  # Longueur maximale de la valeur d'un champ d'embed
+BULK_DESCRIPTION_LIMIT = 3800  # Marge sous la limite de 4096 caractères d'une description
+BULK_LINE_LIMIT = 200
+
+EMBEDS_PER_MESSAGE = 10
+EMBED_CHARS_PER_MESSAGE = 6000  # Limite cumulée des embeds d'un même message
+LOG_FLUSH_DELAY = 3
+# Les URL d'attachement de Discord sont signées et expirent : l'icône est renvoyée de temps en temps
+ICON_URL_TTL = 12 * 3600
+LOG_RETENTION_DAYS = 90
+LOG_MAX_ROWS_PER_GUILD = 500_000
+INDEX_BATCH_SIZE = 500
+SEARCH_PAGE_SIZE = 8
+SEARCH_PREVIEW = 180  # Caractères de contenu affichés par résultat
+EDIT_ICON = "message_edit_icon.png"
+DELETE_ICON = "message_delete_icon.png"
+
+
+def truncate(content):
+    if not content:
+        return "*(vide)*"
+    return content if len(content) <= FIELD_LIMIT else content[:FIELD_LIMIT - 1] + "…"
 
 
 class MessageLogs(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.log_channel_id = self.load_config()
+        self.message_store = MessageStore(DEFAULT_BUDGET)
+        self.bot.guild_config.register("message_logs", {"log_channel_id": None, "buffer_kb": None})
+        self.bot.guild_config.subscribe("message_logs", self.apply_config)
+        self.bot.message_router.subscribe(self.remember_message)
+        self.icon_urls = {}  # nom de l'icône -> (URL, date d'envoi)
+        self.log_queue = LogBatcher(
+            self.send_logs,
+            max_items=EMBEDS_PER_MESSAGE,
+            max_weight=EMBED_CHARS_PER_MESSAGE,
+            weigh=lambda item: len(item[0]),
+            delay=LOG_FLUSH_DELAY,
+        )
+        # Les entrées de l'index de recherche sont écrites par lots, dans une seule transaction
+        self.index_queue = LogBatcher(self.write_index, max_items=INDEX_BATCH_SIZE, delay=LOG_FLUSH_DELAY)
+        self.indexed_guilds = set()  # Serveurs ayant reçu des entrées depuis la dernière rétention
+        self.prune_log_index.start()
 
-    def load_config(self):
-        """Charge et valide la configuration des logs."""
-        if not os.path.exists(CONFIG_DIR):
-            os.makedirs(CONFIG_DIR)
-            logger.info(f"📁 Dossier '{CONFIG_DIR}' créé.")
+    async def cog_unload(self):
+        self.prune_log_index.cancel()
+        self.bot.message_router.unwatch_all(self.remember_message)
+        self.bot.guild_config.unsubscribe("message_logs", self.apply_config)
+        await self.log_queue.close()
+        await self.index_queue.close()
 
-        if not os.path.exists(LOG_CONFIG_FILE):
-            logger.warning(f"⚠️ Fichier '{LOG_CONFIG_FILE}' manquant. Création avec des valeurs par défaut.")
-            return self.reset_config()
+    async def get_log_channel(self, guild):
+        """Retourne le canal de log configuré pour ce serveur, ou None."""
+        if guild is None:
+            return None
+        config = await self.bot.guild_config.get(guild.id, "message_logs")
+        log_channel_id = config.get("log_channel_id")
+        if not isinstance(log_channel_id, int):
+            return None
+        # Le canal doit appartenir au serveur : les logs d'un serveur ne partent jamais ailleurs
+        return guild.get_channel(log_channel_id)
 
-        try:
-            with open(LOG_CONFIG_FILE, "r") as file:
-                config = json.load(file)
-                # Vérifie si log_channel_id est présent et valide
-                if "log_channel_id" not in config or not isinstance(config["log_channel_id"], (int, type(None))):
-                    logger.warning("⚠️ Configuration invalide détectée. Réinitialisation en cours.")
-                    return self.reset_config()
-                return config["log_channel_id"]
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"❌ Erreur de lecture dans '{LOG_CONFIG_FILE}': {e}")
-            return self.reset_config()
-
-    def reset_config(self):
-        """Réinitialise la configuration avec des valeurs par défaut."""
-        default_config = {"log_channel_id": None}
-        with open(LOG_CONFIG_FILE, "w") as file:
-            json.dump(default_config, file, indent=4)
-        logger.info(f"☑️ Fichier '{LOG_CONFIG_FILE}' réinitialisé.")
-        return default_config["log_channel_id"]
-
-    def save_config(self, channel_id):
-        """Sauvegarde l'ID du canal de log dans un fichier JSON."""
-        try:
-            with open(LOG_CONFIG_FILE, "w") as file:
-                json.dump({"log_channel_id": channel_id}, file, indent=4)
-            logger.info(f"☑️ Configuration de log sauvegardée : Canal ID {channel_id}")
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la sauvegarde de '{LOG_CONFIG_FILE}' : {e}")
+    async def remember_message(self, context):
+        """Gestionnaire du routeur : conserve le contenu des messages des serveurs qui ont des logs."""
+        if context.is_dm:
+            return False
+        config = await self.bot.guild_config.get(context.guild_id, "message_logs")
+        if isinstance(config.get("log_channel_id"), int):
+            self.message_store.add(
+                context.guild_id, context.message.id, context.author_id, context.channel_id, context.message.content
+            )
+        return False
+
+    def apply_config(self, guild_id, config):
+        buffer_kb = config.get("buffer_kb")
+        self.message_store.set_budget(guild_id, buffer_kb * 1024 if isinstance(buffer_kb, int) else None)
+
+    async def get_writable_log_channel(self, guild_id, event):
+        guild = self.bot.get_guild(guild_id) if guild_id else None
+        log_channel = await self.get_log_channel(guild)
+        if not log_channel:
+            logger.debug(f"Aucun canal de log configuré. Ignorant l'événement {event}.")
+            return None
 
+        # Vérification des permissions avant d'envoyer le message
+        if not log_channel.permissions_for(log_channel.guild.me).send_messages:
+            logger.warning(f"⚠️ Permissions insuffisantes pour envoyer des messages dans '{log_channel.name}'.")
+            return None
+        return log_channel
 
     @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        """Logger les modifications de messages."""
-        if before.author.bot or before.content == after.content:
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        """Logger les modifications de messages, même absents du cache de discord.py."""
+        content = payload.data.get("content")
+        author = payload.data.get("author") or {}
+        if payload.guild_id is None or content is None or author.get("bot"):
             return
 
-        if not self.log_channel_id:
-            logger.warning("⚠️ Aucun canal de log configuré. Ignorant l'événement on_message_edit.")
+        stored = self.message_store.update(payload.guild_id, payload.message_id, content)
+        cached = payload.cached_message
+        if stored is not None:
+            before, author_id = stored.content, stored.author_id
+        elif cached is not None:
+            before, author_id = cached.content, cached.author.id
+        elif payload.data.get("edited_timestamp"):
+            before, author_id = None, int(author["id"]) if "id" in author else None
+        else:
+            return  # Mise à jour sans modification (aperçu de lien, épinglage…)
+        if before == content:
             return
+        await self.index_entries(payload.guild_id, [
+            (payload.channel_id, author_id, payload.message_id, "edit", before or "", content)
+        ])
 
-        log_channel = self.bot.get_channel(self.log_channel_id)
-        if log_channel:
-            # Vérification des permissions avant d'envoyer le message
-            if not log_channel.permissions_for(log_channel.guild.me).send_messages:
-                logger.warning(f"⚠️ Permissions insuffisantes pour envoyer des messages dans '{log_channel.name}'.")
-                return
+        log_channel = await self.get_writable_log_channel(payload.guild_id, "on_raw_message_edit")
+        if not log_channel:
+            return
 
-            try:
-                embed = discord.Embed(
-                    title="✏️ Message modifié",
-                    color=discord.Color.dark_purple(),
-                    timestamp=discord.utils.utcnow()
-                )
-                embed.add_field(name="Auteur", value=before.author.mention, inline=False)
-                embed.add_field(name="Canal", value=before.channel.mention, inline=False)
-                embed.add_field(name="Avant", value=before.content or "*(vide)*", inline=False)
-                embed.add_field(name="Après", value=after.content or "*(vide)*", inline=False)
-                embed.set_thumbnail(url="attachment://message_edit_icon.png")
-                embed.set_footer(text=f"Message ID : {before.id}")
-
-                # Envoi avec l'icône jointe
-                file = discord.File("assets/message_edit_icon.png", filename="message_edit_icon.png")
-                await log_channel.send(file=file, embed=embed)
-                logger.info(f"✏️ Modification de message loggée dans '{log_channel.name}'.")
-
-            except Exception as e:
-                logger.error(f"❌ Erreur lors de l'envoi du log dans '{log_channel.name}': {e}")
+        embed = discord.Embed(
+            title="✏️ Message modifié",
+            color=discord.Color.dark_purple(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Auteur", value=f"<@{author_id}>" if author_id else "*(inconnu)*", inline=False)
+        embed.add_field(name="Canal", value=f"<#{payload.channel_id}>", inline=False)
+        embed.add_field(
+            name="Avant", value=truncate(before) if before is not None else "*(contenu inconnu)*", inline=False
+        )
+        embed.add_field(name="Après", value=truncate(content), inline=False)
+        embed.set_footer(text=f"Message ID : {payload.message_id}")
+        self.queue_log(log_channel, embed, EDIT_ICON)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """Logger les suppressions de messages, même absents du cache de discord.py."""
+        if payload.guild_id is None:
+            return
+
+        stored = self.message_store.pop(payload.guild_id, payload.message_id)
+        cached = payload.cached_message
+        if stored is not None:
+            content, author_id = stored.content, stored.author_id
+        elif cached is not None and not cached.author.bot:
+            content, author_id = cached.content, cached.author.id
+        else:
+            return  # Message d'un bot, ou trop ancien pour être connu
+        await self.index_entries(payload.guild_id, [
+            (payload.channel_id, author_id, payload.message_id, "delete", content, None)
+        ])
+
+        log_channel = await self.get_writable_log_channel(payload.guild_id, "on_raw_message_delete")
+        if not log_channel:
+            return
 
+        embed = discord.Embed(
+            title="🗑️ Message supprimé",
+            color=discord.Color.dark_embed(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Auteur", value=f"<@{author_id}>", inline=False)
+        embed.add_field(name="Canal", value=f"<#{payload.channel_id}>", inline=False)
+        embed.add_field(name="Contenu", value=truncate(content), inline=False)
+        embed.set_footer(text=f"Message ID : {payload.message_id}")
+        self.queue_log(log_channel, embed, DELETE_ICON)
 
     @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message):
-        """Logger les suppressions de messages."""
-        if message.author.bot:
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        """Logger une suppression groupée (purge) en une seule entrée."""
+        if payload.guild_id is None:
             return
 
-        if not self.log_channel_id:
-            logger.warning("⚠️ Aucun canal de log configuré. Ignorant l'événement on_message_delete.")
+        cached = {message.id: message for message in payload.cached_messages}
+        known = []
+        for message_id in sorted(payload.message_ids):
+            stored = self.message_store.pop(payload.guild_id, message_id)
+            if stored is not None:
+                known.append((message_id, stored.author_id, stored.content))
+            elif message_id in cached and not cached[message_id].author.bot:
+                known.append((message_id, cached[message_id].author.id, cached[message_id].content))
+        await self.index_entries(payload.guild_id, [
+            (payload.channel_id, author_id, message_id, "delete", content, None)
+            for message_id, author_id, content in known
+        ])
+
+        log_channel = await self.get_writable_log_channel(payload.guild_id, "on_raw_bulk_message_delete")
+        if not log_channel:
             return
 
-        log_channel = self.bot.get_channel(self.log_channel_id)
-        if log_channel:
-            # Vérification des permissions avant d'envoyer le message
-            if not log_channel.permissions_for(log_channel.guild.me).send_messages:
-                logger.warning(f"⚠️ Permissions insuffisantes pour envoyer des messages dans '{log_channel.name}'.")
-                return
+        lines, length = [], 0
+        for _, author_id, content in known:
+            line = f"<@{author_id}> : {discord.utils.escape_markdown(content[:BULK_LINE_LIMIT]) or '*(vide)*'}"
+            if length + len(line) + 1 > BULK_DESCRIPTION_LIMIT:
+                lines.append(f"… et {len(known) - len(lines)} autre(s)")
+                break
+            lines.append(line)
+            length += len(line) + 1
 
-            try:
-                embed = discord.Embed(
-                    title="🗑️ Message supprimé",
-                    color=discord.Color.dark_embed(),
-                    timestamp=discord.utils.utcnow()
-                )
-                embed.add_field(name="Auteur", value=message.author.mention, inline=False)
-                embed.add_field(name="Canal", value=message.channel.mention, inline=False)
-                embed.add_field(name="Contenu", value=message.content or "*(vide)*", inline=False)
-                embed.set_thumbnail(url="attachment://message_delete_icon.png")
-                embed.set_footer(text=f"Message ID : {message.id}")
-
-                # Envoi avec l'icône jointe
-                file = discord.File("assets/message_delete_icon.png", filename="message_delete_icon.png")
-                await log_channel.send(file=file, embed=embed)
-                logger.info(f"🗑️ Suppression de message loggée dans '{log_channel.name}'.")
-
-            except Exception as e:
-                logger.error(f"❌ Erreur lors de l'envoi du log dans '{log_channel.name}': {e}")
+        embed = discord.Embed(
+            title=f"🧹 {len(payload.message_ids)} messages supprimés",
+            description="\n".join(lines) or "*(contenu inconnu)*",
+            color=discord.Color.dark_embed(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Canal", value=f"<#{payload.channel_id}>", inline=False)
+        unknown = len(payload.message_ids) - len(known)
+        if unknown:
+            embed.add_field(name="Sans contenu connu", value=f"{unknown} message(s) (bots ou trop anciens)", inline=False)
+        self.queue_log(log_channel, embed, DELETE_ICON)
+
+    def queue_log(self, log_channel, embed, icon):
+        """Met un log en file : il partira avec les autres logs du salon dans un même message."""
+        self.log_queue.push(log_channel.id, (embed, icon))
+
+    async def send_logs(self, channel_id, batch):
+        """Envoie un lot de logs (jusqu'à 10 embeds) en un seul message."""
+        log_channel = self.bot.get_channel(channel_id)
+        if log_channel is None:
+            return
+
+        # Chaque icône n'est jointe qu'une fois : les lots suivants réutilisent son URL
+        now = time.monotonic()
+        files, embeds = {}, []
+        for embed, icon in batch:
+            cached = self.icon_urls.get(icon)
+            if cached is not None and now - cached[1] < ICON_URL_TTL:
+                embed.set_thumbnail(url=cached[0])
+            else:
+                if icon not in files:
+                    files[icon] = discord.File(f"assets/{icon}", filename=icon)
+                embed.set_thumbnail(url=f"attachment://{icon}")
+            embeds.append(embed)
+
+        message = await log_channel.send(embeds=embeds, files=list(files.values()))
+        for attachment in message.attachments:
+            self.icon_urls[attachment.filename] = (attachment.url, now)
+        logger.info(f"📝 {len(embeds)} log(s) envoyé(s) dans '{log_channel.name}'.")
+
+    async def index_entries(self, guild_id, entries):
+        """Ajoute des entrées `(salon, auteur, message, type, contenu, nouveau contenu)` à l'index de recherche."""
+        config = await self.bot.guild_config.get(guild_id, "message_logs")
+        if not entries or not isinstance(config.get("log_channel_id"), int):
+            return
+        now = time.time()
+        for channel_id, author_id, message_id, kind, content, new_content in entries:
+            self.index_queue.push("index", (guild_id, channel_id, author_id, message_id, kind, content, new_content, now))
+        self.indexed_guilds.add(guild_id)
+
+    async def write_index(self, _, rows):
+        await self.bot.storage.append_message_logs(rows)
+
+    @tasks.loop(hours=1)
+    async def prune_log_index(self):
+        """Rétention de l'index : âge maximal, puis nombre maximal d'entrées par serveur."""
+        guild_ids, self.indexed_guilds = self.indexed_guilds, set()
+        deleted = await self.bot.storage.prune_message_logs(
+            LOG_RETENTION_DAYS * 86400, LOG_MAX_ROWS_PER_GUILD, guild_ids
+        )
+        if deleted:
+            logger.info(f"🧹 Index des logs : {deleted} entrée(s) expirée(s) supprimée(s).")
+
+    @prune_log_index.before_loop
+    async def before_prune_log_index(self):
+        await self.bot.wait_until_ready()
+
+    @commands.hybrid_command(name="search_logs", description="Recherche dans les messages modifiés ou supprimés.")
+    @commands.has_permissions(manage_messages=True)
+    async def search_logs(self, ctx: commands.Context, keywords: str = None, author: discord.User = None,
+                          channel: discord.TextChannel = None, since: str = None, until: str = None):
+        """Recherche dans l'index des logs par mots-clés, auteur, salon et période (dates AAAA-MM-JJ)."""
+        try:
+            start = parse_day(since)
+            end = parse_day(until) + 86400 if until else None  # Le dernier jour est inclus
+        except ValueError:
+            await ctx.send(embed=discord.Embed(
+                title="❌ Date invalide",
+                description="Les dates doivent être au format `AAAA-MM-JJ`.",
+                color=discord.Color.dark_embed()
+            ), ephemeral=True)
+            return
+
+        query = {
+            "terms": keywords.split() if keywords else None,
+            "author_id": author.id if author else None,
+            "channel_id": channel.id if channel else None,
+            "since": start,
+            "until": end,
+        }
+        view = LogSearchView(self.bot.storage, ctx.guild.id, query, ctx.author)
+        rows, has_next = await view.load()
+        if not rows:
+            await ctx.send(embed=discord.Embed(
+                title="🔍 Recherche dans les logs",
+                description="☑️ Aucune entrée ne correspond à ces critères.",
+                color=discord.Color.dark_teal()
+            ), ephemeral=True)
+            return
+        view.update_buttons(has_next)
+        view.message = await ctx.send(embed=view.build_embed(rows), view=view, ephemeral=True)
 
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.message_store.drop_guild(guild.id)
+
+    @commands.hybrid_command(name="set_log_buffer", description="Définit la mémoire réservée aux messages pour les logs (en Ko).")
+    @commands.has_permissions(administrator=True)
+    async def set_log_buffer(self, ctx: commands.Context, kilobytes: int):
+        """Définit le budget du tampon de messages de ce serveur."""
+        if not MIN_BUFFER_KB <= kilobytes <= MAX_BUFFER_KB:
+            await ctx.send(embed=discord.Embed(
+                title="❌ Valeur invalide",
+                description=f"Le budget doit être compris entre {MIN_BUFFER_KB} et {MAX_BUFFER_KB} Ko.",
+                color=discord.Color.dark_embed()
+            ))
+            return
+        await self.bot.guild_config.set(ctx.guild.id, "message_logs", "buffer_kb", kilobytes)
+        await ctx.send(embed=discord.Embed(
+            title="☑️ Tampon de messages configuré",
+            description=f"Les **{kilobytes} Ko** de messages les plus récents sont conservés pour les logs.",
+            color=discord.Color.dark_teal()
+        ))
+        logger.info(f"☑️ Tampon de messages de '{ctx.guild.name}' : {kilobytes} Ko.")
 
     @commands.hybrid_command(name="set_log_channel", description="Configure le canal de log des messages.")
     async def set_log_channel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Définit dynamiquement le canal de log."""
-        self.log_channel_id = channel.id
-        self.save_config(channel.id)
+        await self.bot.guild_config.set(ctx.guild.id, "message_logs", "log_channel_id", channel.id)
         await ctx.send(embed=discord.Embed(
             title="☑️ Canal de log configuré",
             description=f"Les logs seront envoyés dans {channel.mention}.",
@@ -148,15 +346,109 @@ class MessageLogs(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def reset_log_config(self, ctx: commands.Context):
         """Réinitialise la configuration de log."""
-        self.log_channel_id = self.reset_config()
+        await self.bot.guild_config.reset(ctx.guild.id, "message_logs", "log_channel_id")
         await ctx.send(embed=discord.Embed(
             title="🔄 Configuration réinitialisée",
-            description="Le fichier de configuration des logs a été réinitialisé avec succès.",
+            description="La configuration des logs a été réinitialisée avec succès.",
             color=discord.Color.dark_teal()
         ))
         logger.info(f"🔄 Configuration de log réinitialisée par {ctx.author.name}.")
 
 
+def parse_day(value):
+    """Date `AAAA-MM-JJ` (UTC) en horodatage, ou None."""
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp()
+
+
+class LogSearchView(discord.ui.View):
+    """Pagination des résultats de `/search_logs` par curseur (identifiant de la dernière entrée affichée)."""
+
+    def __init__(self, storage, guild_id, query, author: discord.abc.User):
+        super().__init__(timeout=300)
+        self.storage = storage
+        self.guild_id = guild_id
+        self.query = query
+        self.author = author
+        self.cursors = [None]  # Curseur de début de chaque page visitée
+        self.last_id = None
+        self.message = None
+
+    async def load(self):
+        rows = await self.storage.search_message_logs(
+            self.guild_id, before_id=self.cursors[-1], limit=SEARCH_PAGE_SIZE + 1, **self.query
+        )
+        return rows[:SEARCH_PAGE_SIZE], len(rows) > SEARCH_PAGE_SIZE
+
+    def update_buttons(self, has_next: bool):
+        self.previous_page.disabled = len(self.cursors) == 1
+        self.next_page.disabled = not has_next
+
+    def build_embed(self, rows) -> discord.Embed:
+        lines = []
+        for _, channel_id, author_id, message_id, kind, content, new_content, created_at in rows:
+            icon = "✏️" if kind == "edit" else "🗑️"
+            author = f"<@{author_id}>" if author_id else "*(inconnu)*"
+            line = f"{icon} <t:{int(created_at)}:f> · {author} dans <#{channel_id}>\n> {preview(content)}"
+            if new_content is not None:
+                line += f"\n> ➡️ {preview(new_content)}"
+            lines.append(line)
+        embed = discord.Embed(
+            title="🔍 Recherche dans les logs",
+            description="\n\n".join(lines),
+            color=discord.Color.dark_purple()
+        )
+        self.last_id = rows[-1][0]
+        embed.set_footer(text=f"Page {len(self.cursors)}")
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author.id:
+            await interaction.response.send_message("⚠️ Seul l'auteur de la recherche peut changer de page.", ephemeral=True)
+            return False
+        return True
+
+    async def show(self, interaction: discord.Interaction):
+        rows, has_next = await self.load()
+        if not rows and len(self.cursors) > 1:
+            # Entrées supprimées entre-temps par la rétention : revient à la page précédente
+            self.cursors.pop()
+            rows, has_next = await self.load()
+        if not rows:
+            await interaction.response.edit_message(content="☑️ Plus aucune entrée ne correspond.", embed=None, view=None)
+            return
+        self.update_buttons(has_next)
+        await interaction.response.edit_message(embed=self.build_embed(rows), view=self)
+
+    @discord.ui.button(label="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+        await self.show(interaction)
+
+    @discord.ui.button(label="▶️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.append(self.last_id)
+        await self.show(interaction)
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+
+def preview(content):
+    content = discord.utils.escape_markdown(content.replace("\n", " "))
+    if not content:
+        return "*(vide)*"
+    return content if len(content) <= SEARCH_PREVIEW else content[:SEARCH_PREVIEW - 1] + "…"
+
+
 async def setup(bot: commands.Bot):
     """Ajoute la cog au bot."""
     await bot.add_cog(MessageLogs(bot))
@@ -1,11 +1,30 @@
 import discord
+import fnmatch
+import re
+from datetime import timedelta
 from discord.ext import commands
+from utils.ban_list import BanList, BannedUser
+from utils.bulk import BulkJob
 from utils.logger import logger
 
+BANS_PER_PAGE = 15
+REASON_PREVIEW = 100  # Caractères de raison affichés par banni
+
+MASS_MAX_TARGETS = 1000
+MASS_CONCURRENCY = 5
+BULK_BAN_SIZE = 200  # Utilisateurs par requête de bannissement groupé (limite de l'API)
+MAX_TIMEOUT_MINUTES = 28 * 24 * 60  # Durée maximale d'une exclusion temporaire
+MASS_PREVIEW = 10  # Cibles citées dans la confirmation et le résumé
+ID_PATTERN = re.compile(r"\d{15,20}")
+MAX_NAME_PATTERN = 64  # Longueur maximale du motif de nom
+MAX_JOINED_WITHIN = 365 * 24 * 60  # Minutes
+MAX_ACCOUNT_AGE = 20 * 365  # Jours
+
 
 class Moderation(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.ban_lists = {}  # guild_id -> BanList (pages déjà chargées)
 
     @commands.hybrid_command(name="ban", description="Bannit un utilisateur avec une raison facultative.")
     @commands.has_permissions(ban_members=True)
@@ -51,10 +70,220 @@ class Moderation(commands.Cog):
             ))
             logger.error(f"Erreur lors de l'expulsion de {member} : {e}")
 
+    @commands.hybrid_command(name="mass_ban", description="Bannit plusieurs utilisateurs (identifiants ou filtres).")
+    @commands.has_permissions(ban_members=True)
+    async def mass_ban(self, ctx: commands.Context, ids: str = None, joined_within: int = None,
+                       account_age: int = None, name_pattern: str = None, *, reason: str = "Aucune raison spécifiée."):
+        """Bannit les utilisateurs listés ou les membres correspondant aux filtres (en préfixe, plusieurs identifiants entre guillemets : `"id1 id2"`)."""
+        # Le bannissement groupé exige aussi `manage_guild` : sans lui, chaque cible échouerait
+        permissions = ctx.guild.me.guild_permissions
+        if not (permissions.ban_members and permissions.manage_guild):
+            await ctx.send(embed=discord.Embed(
+                title="❌ Permissions insuffisantes",
+                description="Le bot a besoin des permissions **Bannir des membres** et **Gérer le serveur** "
+                            "pour les bannissements groupés.",
+                color=discord.Color.dark_embed()
+            ))
+            return
+        selection = await self.select_targets(ctx, ids, joined_within, account_age, name_pattern, allow_users=True)
+        if selection is None:
+            return
+
+        async def ban_batch(batch):
+            result = await ctx.guild.bulk_ban(batch, reason=reason, delete_message_seconds=0)
+            return result.banned, result.failed
+
+        await self.run_mass_action(ctx, selection, "🔨 Bannissement", ban_batch, batch_size=BULK_BAN_SIZE)
+
+    @commands.hybrid_command(name="mass_kick", description="Expulse plusieurs membres (identifiants ou filtres).")
+    @commands.has_permissions(kick_members=True)
+    async def mass_kick(self, ctx: commands.Context, ids: str = None, joined_within: int = None,
+                        account_age: int = None, name_pattern: str = None, *, reason: str = "Aucune raison spécifiée."):
+        """Expulse les membres listés ou correspondant aux filtres (en préfixe, plusieurs identifiants entre guillemets : `"id1 id2"`)."""
+        selection = await self.select_targets(ctx, ids, joined_within, account_age, name_pattern)
+        if selection is None:
+            return
+
+        async def kick_one(batch):
+            await batch[0].kick(reason=reason)
+            return batch, []
+
+        await self.run_mass_action(ctx, selection, "🚪 Expulsion", kick_one)
+
+    @commands.hybrid_command(name="mass_timeout", description="Exclut temporairement plusieurs membres (identifiants ou filtres).")
+    @commands.has_permissions(moderate_members=True)
+    async def mass_timeout(self, ctx: commands.Context, minutes: int, ids: str = None, joined_within: int = None,
+                           account_age: int = None, name_pattern: str = None, *, reason: str = "Aucune raison spécifiée."):
+        """Exclut temporairement les membres listés ou correspondant aux filtres (en préfixe, plusieurs identifiants entre guillemets : `"id1 id2"`)."""
+        if not 0 < minutes <= MAX_TIMEOUT_MINUTES:
+            await ctx.send(embed=discord.Embed(
+                title="❌ Durée invalide",
+                description=f"La durée doit être comprise entre 1 et {MAX_TIMEOUT_MINUTES} minutes (28 jours).",
+                color=discord.Color.dark_embed()
+            ))
+            return
+        selection = await self.select_targets(ctx, ids, joined_within, account_age, name_pattern)
+        if selection is None:
+            return
+        duration = timedelta(minutes=minutes)
+
+        async def timeout_one(batch):
+            await batch[0].timeout(duration, reason=reason)
+            return batch, []
+
+        await self.run_mass_action(ctx, selection, "⏳ Exclusion temporaire", timeout_one)
+
+    def can_moderate(self, ctx: commands.Context, member: discord.Member) -> bool:
+        """Vérifie que l'auteur et le bot sont au-dessus du membre dans la hiérarchie des rôles."""
+        guild = ctx.guild
+        if member.id in (ctx.author.id, guild.me.id, guild.owner_id):
+            return False
+        if ctx.author.id != guild.owner_id and member.top_role >= ctx.author.top_role:
+            return False
+        return member.top_role < guild.me.top_role
+
+    async def select_targets(self, ctx: commands.Context, ids, joined_within, account_age, name_pattern, allow_users=False):
+        """
+        Construit la liste des cibles à partir des identifiants et/ou des filtres (combinés).
+        Retourne `(cibles, message de confirmation)`, ou None (après avoir répondu)
+        si la sélection est invalide ou annulée.
+        """
+        async def refuse(description):
+            await ctx.send(embed=discord.Embed(title="❌ Sélection invalide", description=description,
+                                               color=discord.Color.dark_embed()))
+
+        if not any(value is not None for value in (ids, joined_within, account_age, name_pattern)):
+            await refuse("Indiquez des identifiants ou au moins un filtre "
+                         "(`joined_within` en minutes, `account_age` en jours, `name_pattern` avec jokers `*` et `?`).")
+            return None
+
+        # En commande préfixée, `ids` ne prend qu'un mot : `!mass_ban 111 222` lirait 222 comme
+        # `joined_within` et filtrerait la liste en silence. Une valeur hors bornes est refusée.
+        for name, value, maximum in (("joined_within", joined_within, MAX_JOINED_WITHIN),
+                                     ("account_age", account_age, MAX_ACCOUNT_AGE)):
+            if value is not None and not 0 < value <= maximum:
+                hint = ""
+                if ID_PATTERN.fullmatch(str(value)):
+                    hint = "\n💡 Plusieurs identifiants ? Mettez-les entre guillemets : `\"111 222 333\"`."
+                await refuse(f"`{name}` doit être compris entre 1 et {maximum}.{hint}")
+                return None
+
+        # Motif de type joker (`*`, `?`, `[...]`) plutôt qu'une expression régulière libre : la
+        # traduction de fnmatch ne peut pas boucler en retour arrière catastrophique sur chaque membre
+        pattern = None
+        if name_pattern is not None:
+            if len(name_pattern) > MAX_NAME_PATTERN:
+                await refuse(f"Le motif de nom ne doit pas dépasser {MAX_NAME_PATTERN} caractères.")
+                return None
+            pattern = re.compile(fnmatch.translate(name_pattern.lower()))
+
+        now = discord.utils.utcnow()
+        joined_after = now - timedelta(minutes=joined_within) if joined_within is not None else None
+        created_after = now - timedelta(days=account_age) if account_age is not None else None
+
+        def matches(member):
+            if joined_after is not None and (member.joined_at is None or member.joined_at < joined_after):
+                return False
+            if created_after is not None and member.created_at < created_after:
+                return False
+            if pattern is not None and not (
+                pattern.match(member.name.lower()) or pattern.match(member.display_name.lower())
+            ):
+                return False
+            return True
+
+        if ids is not None:
+            targets, skipped = [], 0
+            for user_id in dict.fromkeys(int(match) for match in ID_PATTERN.findall(ids)):
+                member = ctx.guild.get_member(user_id)
+                if member is None:
+                    # Un utilisateur absent du serveur peut encore être banni par identifiant
+                    if allow_users:
+                        targets.append(discord.Object(id=user_id))
+                    else:
+                        skipped += 1
+                elif matches(member) and self.can_moderate(ctx, member):
+                    targets.append(member)
+                else:
+                    skipped += 1
+        else:
+            members = [member for member in ctx.guild.members if not member.bot and matches(member)]
+            targets = [member for member in members if self.can_moderate(ctx, member)]
+            skipped = len(members) - len(targets)
+
+        if not targets:
+            await refuse("Aucune cible ne correspond à la sélection (ou toutes sont protégées par la hiérarchie des rôles).")
+            return None
+        if len(targets) > MASS_MAX_TARGETS:
+            await refuse(f"La sélection compte {len(targets)} cibles : le maximum est {MASS_MAX_TARGETS}. Affinez les filtres.")
+            return None
+
+        preview = ", ".join(
+            f"<@{target.id}>" for target in targets[:MASS_PREVIEW]
+        ) + (f" et {len(targets) - MASS_PREVIEW} autre(s)" if len(targets) > MASS_PREVIEW else "")
+        description = f"**{len(targets)}** cible(s) : {preview}"
+        if skipped:
+            description += f"\n⚠️ {skipped} ignorée(s) (hors filtres, absentes ou protégées)."
+        view = ConfirmView(ctx.author)
+        view.message = await ctx.send(embed=discord.Embed(
+            title="⚠️ Confirmer l'action de masse",
+            description=description,
+            color=discord.Color.dark_orange()
+        ), view=view)
+        await view.wait()
+        if not view.confirmed:
+            await view.message.edit(embed=discord.Embed(
+                title="🚫 Action annulée",
+                description="Aucune action n'a été effectuée.",
+                color=discord.Color.dark_embed()
+            ), view=None)
+            return None
+        return targets, view.message
+
+    async def run_mass_action(self, ctx: commands.Context, selection, title: str, action, batch_size=1):
+        """
+        Exécute `action(lot)` sur les cibles par lots de `batch_size`, avec une concurrence bornée.
+        `action` retourne `(réussies, échouées)` ; la progression est affichée dans un seul message.
+        """
+        targets, message = selection
+        batches = [targets[i:i + batch_size] for i in range(0, len(targets), batch_size)]
+        succeeded, failed = [], []
+
+        async def apply(batch):
+            ok, ko = await action(batch)
+            succeeded.extend(ok)
+            failed.extend(ko)
+
+        async def report(job):
+            errored = sum(len(batch) for batch, _ in job.failed)
+            done = len(succeeded) + len(failed) + errored
+            await message.edit(embed=discord.Embed(
+                title=f"{title} — en cours…",
+                description=f"⏳ {done}/{len(targets)} traité(s)",
+                color=discord.Color.dark_gold()
+            ), view=None)
+
+        job = await BulkJob(apply, batches, concurrency=MASS_CONCURRENCY, on_progress=report).run()
+
+        errors = {}
+        for batch, error in job.failed:
+            failed.extend(batch)
+            errors[type(error).__name__] = errors.get(type(error).__name__, 0) + len(batch)
+        description = f"☑️ {len(succeeded)} réussite(s)\n❌ {len(failed)} échec(s)"
+        if failed:
+            description += "\n" + ", ".join(f"<@{target.id}>" for target in failed[:MASS_PREVIEW])
+        if errors:
+            description += "\n📝 " + ", ".join(f"{name} × {count}" for name, count in errors.items())
+        embed = discord.Embed(title=f"{title} — bilan", description=description, color=discord.Color.dark_purple())
+        embed.set_footer(text=f"Action effectuée par {ctx.author.name}")
+        await message.edit(embed=embed, view=None)
+        logger.info(f"{title} de masse par {ctx.author} dans '{ctx.guild.name}' : "
+                    f"{len(succeeded)} réussite(s), {len(failed)} échec(s).")
+
     @commands.hybrid_command(name="banned_list", description="Affiche la liste des utilisateurs bannis du serveur.")
     @commands.has_permissions(ban_members=True)
-    async def banned_list(self, ctx: commands.Context):
-        """Liste les utilisateurs bannis du serveur."""
+    async def banned_list(self, ctx: commands.Context, *, search: str = None):
+        """Liste les utilisateurs bannis du serveur, page par page, avec une recherche facultative par nom."""
         try:
             # Vérifie que le bot a la permission "ban_members"
             if not ctx.guild.me.guild_permissions.ban_members:
@@ -65,31 +294,23 @@ class Moderation(commands.Cog):
                 ))
                 return
 
-            # Récupère la liste des bannis via une boucle asynchrone
-            banned_users = [entry async for entry in ctx.guild.bans()]
+            view = BannedListView(self.get_ban_list(ctx.guild), ctx.author, search)
+            entries, has_next = await view.load()
 
-            if not banned_users:
+            if not entries:
+                description = (
+                    f"☑️ Aucun utilisateur banni ne correspond à « {search} »." if search
+                    else "☑️ Aucun utilisateur n'est actuellement banni sur ce serveur."
+                )
                 await ctx.send(embed=discord.Embed(
                     title="🔍 Liste des bannis",
-                    description="☑️ Aucun utilisateur n'est actuellement banni sur ce serveur.",
+                    description=description,
                     color=discord.Color.dark_teal()
                 ))
                 return
 
-            # Crée l'affichage de la liste des bannis
-            banned_list = "\n".join([
-                f"**{ban.user}** - 📝 {ban.reason or 'Aucune raison spécifiée'}"
-                for ban in banned_users
-            ])
-
-            # Envoie l'embed avec les bannis
-            embed = discord.Embed(
-                title="🔍 Liste des utilisateurs bannis",
-                description=banned_list,
-                color=discord.Color.dark_purple()
-            )
-            embed.set_footer(text=f"Demandé par {ctx.author.name}", icon_url=ctx.author.avatar.url)
-            await ctx.send(embed=embed)
+            view.update_buttons(has_next)
+            view.message = await ctx.send(embed=view.build_embed(entries), view=view)
 
         except discord.Forbidden:
             await ctx.send(embed=discord.Embed(
@@ -105,6 +326,140 @@ class Moderation(commands.Cog):
             ))
             logger.error(f"Erreur lors de la récupération de la liste des bannis : {e}")
 
+    def get_ban_list(self, guild: discord.Guild) -> BanList:
+        """Liste des bannis en cache pour un serveur (créée vide, remplie à la demande)."""
+        ban_list = self.ban_lists.get(guild.id)
+        if ban_list is None:
+            async def fetch(after_id, limit):
+                options = {"after": discord.Object(id=after_id)} if after_id else {}
+                return [to_banned_user(entry) async for entry in guild.bans(limit=limit, **options)]
+
+            ban_list = self.ban_lists[guild.id] = BanList(fetch)
+        return ban_list
+
+    @commands.Cog.listener()
+    async def on_member_ban(self, guild: discord.Guild, user: discord.User):
+        # Pas de requête par bannissement (un `/mass_ban` en déclencherait des centaines) : si le
+        # banni tombe dans la partie chargée, la liste est oubliée et sera rechargée à la demande,
+        # raisons comprises ; au-delà du curseur, une requête ultérieure le renverra de toute façon
+        ban_list = self.ban_lists.get(guild.id)
+        if ban_list is not None and ban_list.covers(user.id):
+            del self.ban_lists[guild.id]
+
+    @commands.Cog.listener()
+    async def on_member_unban(self, guild: discord.Guild, user: discord.User):
+        ban_list = self.ban_lists.get(guild.id)
+        if ban_list is not None:
+            ban_list.remove(user.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.ban_lists.pop(guild.id, None)
+
+
+def to_banned_user(entry: discord.BanEntry) -> BannedUser:
+    return BannedUser(entry.user.id, str(entry.user), entry.reason, (entry.user.global_name,))
+
+
+class ConfirmView(discord.ui.View):
+    """Demande à l'auteur de la commande de confirmer une action de masse."""
+
+    def __init__(self, author: discord.abc.User):
+        super().__init__(timeout=60)
+        self.author = author
+        self.confirmed = False
+        self.message = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author.id:
+            await interaction.response.send_message("⚠️ Seul l'auteur de la commande peut confirmer.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Confirmer", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.confirmed = True
+        await interaction.response.defer()
+        self.stop()
+
+    @discord.ui.button(label="Annuler", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer()
+        self.stop()
+
+
+class BannedListView(discord.ui.View):
+    """Pagination de la liste des bannis : chaque page n'est chargée qu'au moment de l'afficher."""
+
+    def __init__(self, ban_list: BanList, author: discord.abc.User, query: str = None):
+        super().__init__(timeout=180)
+        self.ban_list = ban_list
+        self.author = author
+        self.query = query
+        self.index = 0
+        self.message = None
+
+    async def load(self):
+        return await self.ban_list.page(self.index, BANS_PER_PAGE, self.query)
+
+    def update_buttons(self, has_next: bool):
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = not has_next
+
+    def build_embed(self, entries) -> discord.Embed:
+        embed = discord.Embed(
+            title="🔍 Liste des utilisateurs bannis",
+            description="\n".join(
+                f"**{discord.utils.escape_markdown(user.name)}** - 📝 "
+                f"{(user.reason or 'Aucune raison spécifiée')[:REASON_PREVIEW]}"
+                for user in entries
+            ),
+            color=discord.Color.dark_purple()
+        )
+        total = self.ban_list.known_total(self.query)
+        footer = f"Page {self.index + 1}"
+        if total is not None:
+            footer += f"/{max(1, -(-total // BANS_PER_PAGE))} · {total} banni(s)"
+        if self.query:
+            footer += f" · Recherche : {self.query}"
+        embed.set_footer(text=footer)
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author.id:
+            await interaction.response.send_message("⚠️ Seul l'auteur de la commande peut changer de page.", ephemeral=True)
+            return False
+        return True
+
+    async def show(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+        entries, has_next = await self.load()
+        if not entries and self.index > 0:
+            # Des bannis ont été retirés entre-temps : revient à la dernière page non vide
+            self.index -= 1
+            entries, has_next = await self.load()
+        self.update_buttons(has_next)
+        await interaction.message.edit(embed=self.build_embed(entries), view=self)
+
+    @discord.ui.button(label="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index = max(0, self.index - 1)
+        await self.show(interaction)
+
+    @discord.ui.button(label="▶️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index += 1
+        await self.show(interaction)
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
 
 async def setup(bot: commands.Bot):
     """Ajoute la cog au bot."""
@@ -2,6 +2,7 @@ import discord
 from discord.ext import commands
 import random
 from utils.logger import logger
+from utils.router import MessageContext
 import asyncio
 
 import os
@@ -54,6 +55,14 @@ class PenduCog(commands.Cog):
             " +---+\n |   |\n O   |\n/|\\  |\n/ \\ |\n========="
         ]
 
+    def cog_unload(self):
+        self.bot.message_router.unwatch_all(self.handle_guess)
+
+    def end_game(self, author_id):
+        """Termine la partie d'un joueur et cesse d'écouter ses messages."""
+        self.active_games.pop(author_id, None)
+        self.bot.message_router.unwatch_author(author_id, self.handle_guess)
+
     @commands.hybrid_command(name="pendu", description="Lance une partie de Pendu.")
     async def pendu(self, ctx, mode: str = "random"):
         if ctx.author.id in self.active_games:
@@ -72,13 +81,10 @@ class PenduCog(commands.Cog):
                     f"❌ Le fichier de mots n'a pas été trouvé à `{word_list_path}`. Veuillez vérifier sa présence.")
                 return
         elif mode == "custom":
-            await ctx.author.send("Veuillez entrer un mot pour le jeu du pendu :")
-
-            def check(m):
-                return m.author == ctx.author and isinstance(m.channel, discord.DMChannel)
+            prompt = await ctx.author.send("Veuillez entrer un mot pour le jeu du pendu :")
 
             try:
-                msg = await self.bot.wait_for("message", check=check, timeout=60)
+                msg = await self.bot.waiters.wait_for(ctx.author.id, channel_id=prompt.channel.id, timeout=60)
                 word = msg.content.strip().lower()
                 if not word.isalpha() or len(word) < 3:
                     await ctx.author.send(
@@ -93,6 +99,8 @@ class PenduCog(commands.Cog):
 
         game = Pendu(word)
         self.active_games[ctx.author.id] = game
+        # Seuls les messages des joueurs ayant une partie en cours sont transmis au Pendu
+        self.bot.message_router.watch_author(ctx.author.id, self.handle_guess)
 
         await self.display_game(ctx, game)
 
@@ -111,17 +119,17 @@ class PenduCog(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.author.bot or message.author.id not in self.active_games:
+    async def handle_guess(self, context: MessageContext):
+        """Traite une lettre proposée par un joueur ayant une partie en cours."""
+        message = context.message
+        game = self.active_games.get(context.author_id)
+        if game is None:
             return
 
-        game = self.active_games[message.author.id]
-        letter = message.content.lower()
-
-        if len(letter) != 1 or not letter.isalpha():
+        if not context.is_single_letter:
             await message.channel.send("⚠️ Veuillez entrer une seule lettre valide.", delete_after=5)
             return
+        letter = context.lowered
 
         result = game.guess(letter)
 
@@ -129,12 +137,12 @@ class PenduCog(commands.Cog):
             await message.channel.send(
                 f"🎉 Félicitations {message.author.mention}, vous avez trouvé le mot : **{game.word}** !"
             )
-            del self.active_games[message.author.id]
+            self.end_game(message.author.id)
         elif result["status"] == "perdu":
             await message.channel.send(
                 f"💀 Partie terminée {message.author.mention}. Le mot était : **{game.word}**."
             )
-            del self.active_games[message.author.id]
+            self.end_game(message.author.id)
         else:
             await self.display_game(message.channel, game)
 
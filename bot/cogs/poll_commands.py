@@ -1,8 +1,24 @@
 import discord
 from discord.ext import commands
 from discord import ui, ButtonStyle
+from utils.charts import render_bars
 from utils.logger import logger
 from .poll_management import Poll
+import io
+
+
+async def results_chart(bot, poll, embed):
+    """Ajoute à l'embed le graphique des résultats et retourne la pièce jointe (liste vide sans graphique)."""
+    options = list(poll.votes)
+    counts = [poll.votes[option] for option in options]
+    chart = await bot.charts.render(
+        ("poll", poll.message.id if poll.message else id(poll)), tuple(counts),
+        lambda: (render_bars, (poll.question[:80], options, counts, True))
+    )
+    if chart is None:
+        return []
+    embed.set_image(url="attachment://poll.png")
+    return [discord.File(io.BytesIO(chart), filename="poll.png")]
 
 
 class PollView(ui.View):
@@ -70,7 +86,8 @@ class ClosePollButton(ui.Button):
         embed.title = "📊 Sondage terminé"
         embed.color = discord.Color.dark_teal()
         embed.description = f"**{self.poll.question}**\n\n{self.poll.render_results()}"
-        await interaction.message.edit(embed=embed, view=self.view)
+        attachments = await results_chart(interaction.client, self.poll, embed)
+        await interaction.message.edit(embed=embed, view=self.view, attachments=attachments)
         await interaction.response.send_message("☑️ Le sondage a été clôturé.")
 
 
@@ -141,7 +158,8 @@ class PollCommands(commands.Cog):
             description=f"**{poll.question}**\n\n{poll.render_results()}",
             color=discord.Color.green()
         )
-        await poll.message.edit(embed=embed, view=None)
+        attachments = await results_chart(self.bot, poll, embed)
+        await poll.message.edit(embed=embed, view=None, attachments=attachments)
         await ctx.send("☑️ Le sondage a été clôturé.")
 
 
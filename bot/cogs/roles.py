@@ -1,6 +1,4 @@
 import discord
-import json
-import os
 from discord.ext import commands
 from utils.logger import logger
 
@@ -8,47 +6,26 @@ from utils.logger import logger
 class Roles(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.roles_file = "data/default_roles.json"  # Nouveau chemin
-        self.default_roles = self.load_roles()
+        self.bot.guild_config.register("roles", {"default_roles": []})
 
-    def load_roles(self):
-        """Charge les rôles par défaut depuis un fichier JSON."""
-        os.makedirs("data", exist_ok=True)  # Crée le dossier data s'il n'existe pas
-        if not os.path.exists(self.roles_file):
-            logger.info(f"Fichier '{self.roles_file}' introuvable. Création avec une liste vide par défaut.")
-            with open(self.roles_file, "w") as file:
-                json.dump([], file, indent=4)  # Initialisation avec une liste vide
-            return []
-
-        try:
-            with open(self.roles_file, "r") as file:
-                return json.load(file)
-        except Exception as e:
-            logger.error(f"Erreur lors du chargement des rôles par défaut : {e}")
-            return []
-
-    def save_roles(self):
-        """Sauvegarde les rôles par défaut dans un fichier JSON."""
-        try:
-            with open(self.roles_file, "w") as file:
-                json.dump(self.default_roles, file, indent=4)
-            logger.info(f"Rôles par défaut sauvegardés dans '{self.roles_file}'.")
-        except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde des rôles par défaut : {e}")
+    async def get_default_roles(self, guild):
+        config = await self.bot.guild_config.get(guild.id, "roles")
+        return config["default_roles"]
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         """Attribue automatiquement les rôles par défaut aux nouveaux membres."""
         guild = member.guild
+        default_roles = await self.get_default_roles(guild)
 
         # Vérifie que des rôles par défaut sont configurés
-        if not self.default_roles:
-            logger.warning("Aucun rôle par défaut configuré.")
+        if not default_roles:
+            logger.warning(f"Aucun rôle par défaut configuré sur '{guild.name}'.")
             return
 
         # Recherche des rôles existants sur le serveur
         roles_to_add = []
-        for role_name in self.default_roles:
+        for role_name in default_roles:
             role = discord.utils.get(guild.roles, name=role_name)
             if role:
                 roles_to_add.append(role)
@@ -85,8 +62,7 @@ class Roles(commands.Cog):
     async def set_default_roles(self, ctx: commands.Context, *, roles: str):
         """Définit les rôles par défaut via une commande hybride."""
         role_names = [role.strip() for role in roles.split(",")]
-        self.default_roles = role_names
-        self.save_roles()
+        await self.bot.guild_config.set(ctx.guild.id, "roles", "default_roles", role_names)
 
         embed = discord.Embed(
             title="☑️ Rôles par défaut mis à jour",
@@ -99,10 +75,11 @@ class Roles(commands.Cog):
     @commands.hybrid_command(name="show_default_roles", description="Affiche les rôles par défaut actuels.")
     async def show_default_roles(self, ctx: commands.Context):
         """Affiche les rôles par défaut via une commande hybride."""
-        if self.default_roles:
+        default_roles = await self.get_default_roles(ctx.guild)
+        if default_roles:
             embed = discord.Embed(
                 title="📋 Rôles par défaut",
-                description=f"Les rôles suivants seront attribués automatiquement :\n**{', '.join(self.default_roles)}**",
+                description=f"Les rôles suivants seront attribués automatiquement :\n**{', '.join(default_roles)}**",
                 color=discord.Color.dark_teal()
             )
         else:
@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
 import random
+import asyncio
 from utils.logger import logger
 
 class RPS(commands.Cog):
@@ -35,12 +36,12 @@ class RPS(commands.Cog):
             choix_bot = self.get_bot_choice(difficulte, list(choix.keys()))
 
             def check(m):
-                return m.author == ctx.author and m.content.capitalize() in choix
+                return m.content.capitalize() in choix
 
             await ctx.send("🎮 Pierre-Feuille-Ciseaux ! Tapez votre choix (Pierre 🪨, Feuille 🍁, Ciseaux ✂️) :")
 
             try:
-                user_msg = await self.bot.wait_for("message", check=check, timeout=30.0)
+                user_msg = await self.bot.waiters.wait_for(ctx.author.id, channel_id=ctx.channel.id, check=check, timeout=30.0)
                 choix_joueur = user_msg.content.capitalize()
                 resultat = self.determine_winner(choix_joueur, choix_bot)
 
@@ -53,7 +54,7 @@ class RPS(commands.Cog):
 
                 if "Match nul" not in resultat:
                     break
-            except TimeoutError:
+            except asyncio.TimeoutError:
                 await ctx.send("⏰ Vous avez pris trop de temps pour répondre. Partie terminée !")
                 break
 
@@ -62,19 +63,21 @@ class RPS(commands.Cog):
         choix = {"Pierre": "🪨", "Feuille": "🍁", "Ciseaux": "✂️"}
 
         while True:
-            def check(auteur):
-                return lambda m: m.author == auteur and m.content.capitalize() in choix
+            def check(m):
+                return m.content.capitalize() in choix
 
             await ctx.send(f"🎮 Pierre-Feuille-Ciseaux ! {ctx.author.mention} vs {adversaire.mention}.\n\nLes deux joueurs, envoyez-moi vos choix en DM !")
 
             try:
-                await ctx.author.send("Tapez votre choix (Pierre, Feuille, Ciseaux) :")
-                choix_joueur_task = self.bot.wait_for("message", check=check(ctx.author), timeout=30.0)
+                prompt_joueur = await ctx.author.send("Tapez votre choix (Pierre, Feuille, Ciseaux) :")
+                choix_joueur_task = self.bot.waiters.wait_for(
+                    ctx.author.id, channel_id=prompt_joueur.channel.id, check=check, timeout=30.0)
 
-                await adversaire.send("Tapez votre choix (Pierre, Feuille, Ciseaux) :")
-                choix_adversaire_task = self.bot.wait_for("message", check=check(adversaire), timeout=30.0)
+                prompt_adversaire = await adversaire.send("Tapez votre choix (Pierre, Feuille, Ciseaux) :")
+                choix_adversaire_task = self.bot.waiters.wait_for(
+                    adversaire.id, channel_id=prompt_adversaire.channel.id, check=check, timeout=30.0)
 
-                choix_joueur, choix_adversaire = await discord.utils.gather(choix_joueur_task, choix_adversaire_task)
+                choix_joueur, choix_adversaire = await asyncio.gather(choix_joueur_task, choix_adversaire_task)
                 choix_joueur, choix_adversaire = choix_joueur.content.capitalize(), choix_adversaire.content.capitalize()
 
                 resultat = self.determine_winner(choix_joueur, choix_adversaire)
@@ -88,7 +91,7 @@ class RPS(commands.Cog):
 
                 if "Match nul" not in resultat:
                     break
-            except TimeoutError:
+            except asyncio.TimeoutError:
                 await ctx.send("⏰ Un des joueurs a pris trop de temps pour répondre. Partie terminée !")
                 break
 
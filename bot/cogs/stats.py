@@ -1,12 +1,143 @@
 import discord
-from discord.ext import commands
+import io
+import math
+import re
+import time
+from discord.ext import commands, tasks
+from utils.activity import ActivityStore, DAY, HOUR, covered_start
+from utils.charts import render_timeline
 from utils.logger import logger
 from datetime import datetime
 
+MAX_ACTIVITY_DAYS = 365
+GROWTH_DAYS = 90
+PERIOD_PATTERN = re.compile(r"^(\d+)\s*([hdj])$", re.IGNORECASE)
+
+
+def coverage_note(since, start, now):
+    """Précision ajoutée au titre d'un champ dont les données ne remontent pas jusqu'à `start`."""
+    if since <= start:
+        return ""
+    return f" ({math.ceil((now - since) / DAY)} derniers jours)"
+
 
 class Stats(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.activity = ActivityStore()
+
+    async def cog_load(self):
+        """Recharge les séries d'activité et commence à compter les messages."""
+        rows = await self.bot.storage.activity_series()
+        self.activity.load(rows)
+        logger.info(f"☑️ Activité rechargée : {len(self.activity)} série(s).")
+        self.bot.message_router.subscribe(self.record_activity)
+        self.save_activity.start()
+
+    async def cog_unload(self):
+        self.bot.message_router.unwatch_all(self.record_activity)
+        self.save_activity.cancel()
+        await self.flush_activity()
+
+    async def record_activity(self, context):
+        """Gestionnaire du routeur : compte le message (ne le consomme jamais)."""
+        if not context.is_dm:
+            self.activity.record(context.guild_id, context.channel_id, context.author_id)
+        return False
+
+    async def flush_activity(self):
+        rows = self.activity.pop_dirty()
+        if rows:
+            await self.bot.storage.save_activity(rows)
+
+    @tasks.loop(minutes=5)
+    async def save_activity(self):
+        """Enregistre périodiquement les séries modifiées et supprime celles qui n'ont plus d'activité."""
+        stale = self.activity.evict_stale()
+        if stale:
+            await self.bot.storage.delete_activity_series(stale)
+            logger.debug(f"{len(stale)} série(s) d'activité inactive(s) supprimée(s).")
+        await self.flush_activity()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.activity.record_member(member.guild.id, joined=True)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.activity.record_member(member.guild.id, joined=False)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.activity.drop_guild(guild.id)
+        await self.bot.storage.delete_activity(guild.id)
+
+    @commands.hybrid_command(name="activity", description="Affiche l'activité du serveur sur une période (ex. 24h, 7d, 30d).")
+    async def activity_command(self, ctx: commands.Context, period: str = "7d"):
+        """Salons et membres les plus actifs, et heures les plus chargées, sur la période demandée."""
+        match = PERIOD_PATTERN.match(period.strip())
+        seconds = int(match.group(1)) * (HOUR if match.group(2).lower() == "h" else DAY) if match else 0
+        if not 0 < seconds <= MAX_ACTIVITY_DAYS * DAY:
+            await ctx.send(embed=discord.Embed(
+                title="❌ Période invalide",
+                description=f"Indiquez une durée comme `12h`, `7d` ou `30d` (au plus {MAX_ACTIVITY_DAYS} jours).",
+                color=discord.Color.dark_embed()
+            ))
+            return
+
+        now = time.time()
+        start = now - seconds
+        guild_id = ctx.guild.id
+        total = self.activity.total(guild_id, start, now)
+        embed = discord.Embed(
+            title=f"📈 Activité de {ctx.guild.name} ({period})",
+            description=f"💬 **{total}** message(s) sur la période.",
+            color=discord.Color.dark_purple(),
+            timestamp=datetime.utcnow()
+        )
+
+        channels = self.activity.top(guild_id, "channel", start, now)
+        posters = self.activity.top(guild_id, "user", start, now)
+        hours = self.activity.busiest_hours(guild_id, start, now)
+        busiest = sorted((count, hour) for hour, count in enumerate(hours) if count)[-3:][::-1]
+        embed.add_field(
+            name="🏆 Salons les plus actifs" + coverage_note(covered_start("channel", start, now), start, now),
+            value="\n".join(f"<#{channel_id}> — {count}" for channel_id, count in channels) or "*(aucun)*",
+            inline=True
+        )
+        embed.add_field(
+            name="🗣️ Membres les plus actifs" + coverage_note(covered_start("user", start, now), start, now),
+            value="\n".join(f"<@{user_id}> — {count}" for user_id, count in posters) or "*(aucun)*",
+            inline=True
+        )
+        embed.add_field(
+            name="⏰ Heures les plus chargées (UTC)" + coverage_note(covered_start("guild", start, now, HOUR), start, now),
+            value="\n".join(f"{hour:02d}h–{(hour + 1) % 24:02d}h — {count}" for count, hour in busiest) or "*(aucune)*",
+            inline=False
+        )
+        embed.set_footer(text=f"Demandé par {ctx.author.name}", icon_url=ctx.author.display_avatar.url)
+
+        chart = await self.bot.charts.render(
+            (guild_id, "activity", period), self.activity.versions.get(guild_id, 0),
+            lambda: (render_timeline, (f"Messages ({period})", self.activity.timeline(guild_id, start, now)))
+        )
+        if chart is None:
+            await ctx.send(embed=embed)
+            return
+        embed.set_image(url="attachment://activity.png")
+        await ctx.send(embed=embed, file=discord.File(io.BytesIO(chart), filename="activity.png"))
+
+    async def member_growth_chart(self, guild: discord.Guild):
+        """Graphique de l'évolution des membres (arrivées et départs), rendu de nouveau seulement s'ils ont changé."""
+        members = self.bot.presence.members(guild.id) or guild.member_count
+
+        def build():
+            points = self.activity.member_history(guild.id, members, GROWTH_DAYS)
+            days = max(round((points[-1][0] - points[0][0]) / DAY), 1)
+            return render_timeline, (f"Membres ({days} jour(s) suivis)", points)
+
+        version = (members, self.activity.member_versions.get(guild.id, 0))
+        return await self.bot.charts.render((guild.id, "members"), version, build)
 
     @commands.hybrid_command(name="server_stats", description="Affiche les statistiques du serveur.")
     async def server_stats(self, ctx: commands.Context):
@@ -23,8 +154,10 @@ class Stats(commands.Cog):
             return
 
         # Calcul des statistiques
-        total_members = guild.member_count
-        online_members = sum(1 for member in guild.members if member.status != discord.Status.offline)
+        total_members = self.bot.presence.members(guild.id) or guild.member_count
+        online_members = self.bot.presence.online(guild.id)
+        if online_members is None:
+            online_members = "—"  # Serveur pas encore compté (démarrage en cours)
         text_channels = len(guild.text_channels)
         voice_channels = len(guild.voice_channels)
         total_channels = len(guild.channels)
@@ -50,9 +183,15 @@ class Stats(commands.Cog):
 
         embed.set_footer(text=f"Demandé par {ctx.author.name}", icon_url=ctx.author.avatar.url)
 
+        files = [file]
+        chart = await self.member_growth_chart(guild)
+        if chart is not None:
+            files.append(discord.File(io.BytesIO(chart), filename="members.png"))
+            embed.set_image(url="attachment://members.png")
+
         # Envoie de l'embed
         if isinstance(ctx, commands.Context):
-            await ctx.send(file=file,embed=embed)
+            await ctx.send(files=files, embed=embed)
         else:
             await ctx.interaction.response.send_message(embed=embed)
 
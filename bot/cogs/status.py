@@ -19,7 +19,7 @@ class Status(commands.Cog):
         uptime_str = str(uptime).split('.')[0]  # Supprime les microsecondes
 
         # Nombre total d'utilisateurs sur tous les serveurs
-        total_members = sum(guild.member_count for guild in self.bot.guilds)
+        total_members = self.bot.presence.total_members
 
         # Création de l'embed avec le style Demon Slayer
         embed = discord.Embed(
@@ -50,6 +50,50 @@ class Status(commands.Cog):
         else:
             await ctx.interaction.response.send_message(file=file, embed=embed)
 
+    @commands.hybrid_command(name="http_stats", description="Affiche les statistiques des appels aux API externes.")
+    @commands.is_owner()
+    async def http_stats(self, ctx: commands.Context):
+        """Affiche, par hôte, le nombre de requêtes, d'erreurs et la latence des API externes."""
+        stats = self.bot.http_client.stats
+        embed = discord.Embed(
+            title="🌐 Statistiques HTTP",
+            color=discord.Color.dark_purple(),
+            timestamp=datetime.datetime.utcnow()
+        )
+        if not stats:
+            embed.description = "Aucune requête effectuée depuis le démarrage."
+        for host, host_stats in sorted(stats.items(), key=lambda item: item[1].requests, reverse=True)[:25]:
+            embed.add_field(
+                name=f"🔹 {host}",
+                value=(
+                    f"Requêtes : {host_stats.requests} (erreurs : {host_stats.errors})\n"
+                    f"Latence moy. : {host_stats.average_latency * 1000:.0f} ms\n"
+                    f"Latence max. : {host_stats.max_latency * 1000:.0f} ms"
+                ),
+                inline=True
+            )
+        embed.set_footer(text=f"Demandé par {ctx.author}", icon_url=ctx.author.avatar.url)
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="cache_stats", description="Affiche les statistiques du cache des API externes.")
+    @commands.is_owner()
+    async def cache_stats(self, ctx: commands.Context):
+        """Affiche le taux de succès et l'occupation du cache des réponses d'API."""
+        stats = self.bot.response_cache.stats()
+        embed = discord.Embed(
+            title="🗃️ Statistiques du cache",
+            color=discord.Color.dark_purple(),
+            timestamp=datetime.datetime.utcnow()
+        )
+        embed.add_field(name="🔹 Entrées", value=f"{stats['entries']}/{self.bot.response_cache.max_entries}", inline=True)
+        embed.add_field(name="🔹 Taux de succès", value=f"{stats['hit_rate'] * 100:.1f} %", inline=True)
+        embed.add_field(name="🔹 Succès", value=f"{stats['hits']} (+{stats['stale_hits']} périmés)", inline=True)
+        embed.add_field(name="🔹 Échecs", value=f"{stats['misses']} (dont {stats['coalesced']} fusionnés)", inline=True)
+        embed.add_field(name="🔹 Rafraîchissements", value=f"{stats['refreshes']}", inline=True)
+        embed.add_field(name="🔹 Évictions", value=f"{stats['evictions']}", inline=True)
+        embed.set_footer(text=f"Demandé par {ctx.author}", icon_url=ctx.author.avatar.url)
+        await ctx.send(embed=embed)
+
     @status.error
     async def handle_command_errors(self, ctx: commands.Context, error):
         """Gestion des erreurs pour la commande hybride."""
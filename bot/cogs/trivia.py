@@ -1,43 +1,58 @@
 import discord
 import random
-import json
-import os
-import aiohttp
 import html
-from discord.ext import commands
+from discord.ext import commands, tasks
+from utils.leaderboard import Leaderboard
 from utils.logger import logger
+from utils.trivia_pool import TriviaPool
 
-LEADERBOARD_FILE = "data/leaderboard.json"
-TRIVIA_API_URL = "https://opentdb.com/api.php?amount=50&category=15&type=multiple"
+TRIVIA_POOL_FILE = "data/trivia_pool.json"
+TRIVIA_API_URL = "https://opentdb.com/api.php?amount=50&category={category}&type=multiple"
+TRIVIA_CATEGORY = 15  # Jeux vidéo
 
-def load_leaderboard():
-    os.makedirs("data", exist_ok=True)
-    if not os.path.exists(LEADERBOARD_FILE):
-        with open(LEADERBOARD_FILE, "w") as file:
-            json.dump({}, file)
-    with open(LEADERBOARD_FILE, "r") as file:
-        return json.load(file)
-
-def save_leaderboard(leaderboard):
-    with open(LEADERBOARD_FILE, "w") as file:
-        json.dump(leaderboard, file, indent=4)
 
 class Trivia(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.trivia_active = {}
-
-    async def fetch_trivia_question(self):
-        """Récupère des questions Trivia depuis l'API OpenTDB."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(TRIVIA_API_URL) as resp:
-                if resp.status == 200:
-                    logger.info("☑️ Questions Trivia récupérées avec succès depuis l'API.")
-                    data = await resp.json()
-                    if data["response_code"] == 0:
-                        return data["results"]
-                logger.error("❌ Impossible de récupérer les questions Trivia.")
-                return None
+        # Réserve locale de questions, rechargée en arrière-plan et sauvegardée sur disque
+        self.pool = TriviaPool(self.fetch_trivia_questions, TRIVIA_POOL_FILE)
+        self.pool.load()
+        # Classement gardé en mémoire, enregistré par lots (écriture différée)
+        self.leaderboard = Leaderboard()
+
+    async def cog_load(self):
+        self.leaderboard = Leaderboard(await self.bot.storage.scores())
+        self.flush_leaderboard.start()
+        self.pool.schedule_refill(TRIVIA_CATEGORY)
+
+    async def cog_unload(self):
+        self.flush_leaderboard.cancel()
+        self.pool.save()
+        await self.save_leaderboard()
+
+    async def save_leaderboard(self):
+        """Enregistre uniquement les scores modifiés depuis la dernière écriture."""
+        changes = self.leaderboard.pop_dirty()
+        if not changes:
+            return
+        await self.bot.storage.update_scores(changes)
+        logger.info(f"☑️ Classement Trivia sauvegardé ({len(changes)} score(s) modifié(s)).")
+
+    @tasks.loop(seconds=30)
+    async def flush_leaderboard(self):
+        await self.save_leaderboard()
+
+    async def fetch_trivia_questions(self, category):
+        """Récupère un lot de questions Trivia depuis l'API OpenTDB."""
+        async with self.bot.http_client.get(TRIVIA_API_URL.format(category=category)) as resp:
+            if resp.status == 200:
+                logger.info("☑️ Questions Trivia récupérées avec succès depuis l'API.")
+                data = await resp.json()
+                if data["response_code"] == 0:
+                    return data["results"]
+            logger.error("❌ Impossible de récupérer les questions Trivia.")
+            return None
 
     @commands.hybrid_command(name="trivia", help="Réponds à une question sur le gaming et gagne des points.")
     async def trivia(self, ctx):
@@ -46,14 +61,16 @@ class Trivia(commands.Cog):
             await ctx.send("⚠️ Tu as déjà une question en cours ! Réponds-y d'abord.")
             return
 
-        # Récupérer les questions Trivia
-        questions = await self.fetch_trivia_question()
-        if not questions:
+        # Servir une question depuis la réserve locale ; au premier lancement, attendre son chargement
+        question_data = self.pool.take(TRIVIA_CATEGORY, ctx.author.id)
+        if question_data is None:
+            await self.pool.schedule_refill(TRIVIA_CATEGORY)
+            question_data = self.pool.take(TRIVIA_CATEGORY, ctx.author.id)
+        if question_data is None:
             await ctx.send("❌ Erreur : Impossible de récupérer les questions Trivia.")
             return
 
-        # Choisir une question aléatoire et décoder les entités HTML
-        question_data = random.choice(questions)
+        # Décoder les entités HTML
         question = html.unescape(question_data["question"])  # Décodage des entités HTML
         correct_answer = html.unescape(question_data["correct_answer"])  # Décodage des entités HTML
         options = [html.unescape(option) for option in
@@ -100,9 +117,7 @@ class Trivia(commands.Cog):
         options = game["options"]
 
         if 1 <= response <= len(options) and options[response - 1].lower() == correct_answer:
-            leaderboard = load_leaderboard()
-            leaderboard[str(ctx.author.id)] = leaderboard.get(str(ctx.author.id), 0) + 1
-            save_leaderboard(leaderboard)
+            score = self.leaderboard.add_points(str(ctx.author.id))
 
             embed = discord.Embed(
                 title="🎉 Bonne réponse ! 🎉",
@@ -110,7 +125,7 @@ class Trivia(commands.Cog):
                 color=discord.Color.dark_teal()
             )
             await ctx.send(embed=embed)
-            logger.info(f"☑️ {ctx.author} a répondu correctement. Nouveau score : {leaderboard[str(ctx.author.id)]}")
+            logger.info(f"☑️ {ctx.author} a répondu correctement. Nouveau score : {score}")
         else:
             embed = discord.Embed(
                 title="❌ Mauvaise réponse ! ❌",
@@ -122,15 +137,59 @@ class Trivia(commands.Cog):
 
     @commands.hybrid_command(name="my_trivia_score", help="Affiche ton score actuel dans le Trivia Gaming.")
     async def my_trivia_score(self, ctx):
-        leaderboard = load_leaderboard()
-        user_score = leaderboard.get(str(ctx.author.id), 0)
+        user_score = self.leaderboard.get(str(ctx.author.id))
+        rank = self.leaderboard.rank(str(ctx.author.id))
+        description = f"**{ctx.author.mention}**, tu as actuellement **{user_score} point(s)** dans le Trivia Gaming !"
+        if rank is not None:
+            description += f"\nTu es **#{rank}** sur {len(self.leaderboard)} joueur(s)."
         embed = discord.Embed(
             title="🎮 Mon Score Trivia 🎮",
-            description=f"**{ctx.author.mention}**, tu as actuellement **{user_score} point(s)** dans le Trivia Gaming !",
+            description=description,
             color=discord.Color.dark_teal()
         )
         await ctx.send(embed=embed)
         logger.info(f"📊 {ctx.author} a demandé son score Trivia : {user_score} point(s).")
 
+    @commands.hybrid_command(name="trivia_top", help="Affiche les meilleurs joueurs du Trivia Gaming.")
+    async def trivia_top(self, ctx, limit: int = 10):
+        limit = max(1, min(limit, 25))
+        top = self.leaderboard.top(limit)
+        if not top:
+            await ctx.send("📭 Aucun joueur n'a encore marqué de point au Trivia.")
+            return
+
+        medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+        lines = [
+            f"{medals.get(rank, f'**#{rank}**')} <@{user_id}> — **{score} point(s)**"
+            for user_id, score, rank in top
+        ]
+        embed = discord.Embed(
+            title="🏆 Classement Trivia 🏆",
+            description="\n".join(lines),
+            color=discord.Color.dark_gold()
+        )
+        embed.set_footer(text=f"{len(self.leaderboard)} joueur(s) classé(s)")
+        await ctx.send(embed=embed)
+        logger.info(f"📊 {ctx.author} a consulté le top {limit} du Trivia.")
+
+    @commands.hybrid_command(name="trivia_rank", help="Affiche le rang d'un membre dans le Trivia Gaming.")
+    async def trivia_rank(self, ctx, member: discord.Member = None):
+        member = member or ctx.author
+        rank = self.leaderboard.rank(str(member.id))
+        if rank is None:
+            await ctx.send(f"📭 {member.mention} n'a encore marqué aucun point au Trivia.")
+            return
+
+        embed = discord.Embed(
+            title="🏅 Rang Trivia 🏅",
+            description=(
+                f"{member.mention} est **#{rank}** sur {len(self.leaderboard)} joueur(s) "
+                f"avec **{self.leaderboard.get(str(member.id))} point(s)**."
+            ),
+            color=discord.Color.dark_teal()
+        )
+        await ctx.send(embed=embed)
+        logger.info(f"📊 {ctx.author} a consulté le rang Trivia de {member} : #{rank}.")
+
 async def setup(bot):
     await bot.add_cog(Trivia(bot))
@@ -1,7 +1,6 @@
-import aiohttp
 import asyncio
-import json
 import os
+import time
 import discord
 from discord.ext import commands
 from utils.logger import logger
@@ -12,51 +11,22 @@ load_dotenv(dotenv_path="config")
 TWITCH_CLIENT_ID = os.getenv("TWITCH_CLIENT_ID")
 TWITCH_CLIENT_SECRET = os.getenv("TWITCH_CLIENT_SECRET")
 
-# Chemin vers le fichier JSON dans le dossier 'data'
-CONFIG_DIR = "data"
-CONFIG_FILE = os.path.join(CONFIG_DIR, "twitch_config.json")
+HELIX_BATCH_SIZE = 100  # Identifiants maximum par requête Helix
+MAX_CONCURRENT_BATCHES = 4
+PROFILE_TTL = 24 * 3600  # Les images de profil changent rarement
 
 
 class Twitch(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.config = self.load_config()
-        self.streamers_status = {streamer: False for streamer in self.config["streamers"]}
+        self.bot.guild_config.register("twitch", {"streamers": [], "notification_channel_id": None})
+        self.streamers_status = {}
+        self.profiles = {}  # login -> (profil, date de récupération)
         self.headers = {}
         self.twitch_api_url = "https://api.twitch.tv/helix/"
-        self.bot.loop.create_task(self.initialize())  # Appel au démarrage
 
-    def load_config(self):
-        """Charge la configuration depuis un fichier JSON dans 'data'. Crée le fichier s'il est manquant."""
-        # Crée le dossier 'data' s'il n'existe pas
-        if not os.path.exists(CONFIG_DIR):
-            os.makedirs(CONFIG_DIR)
-            logger.info(f"📁 Dossier '{CONFIG_DIR}' créé.")
-
-        # Crée le fichier JSON par défaut s'il n'existe pas
-        if not os.path.exists(CONFIG_FILE):
-            logger.warning(f"⚠️ Fichier de configuration Twitch manquant. Création de '{CONFIG_FILE}' avec des valeurs par défaut.")
-            default_config = {"streamers": [], "notification_channel_id": None}
-            with open(CONFIG_FILE, "w") as file:
-                json.dump(default_config, file, indent=4)
-            return default_config
-
-        # Charge la configuration existante
-        try:
-            with open(CONFIG_FILE, "r") as file:
-                return json.load(file)
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Erreur de lecture dans '{CONFIG_FILE}' : {e}")
-            return {"streamers": [], "notification_channel_id": None}
-
-    def save_config(self, data):
-        """Sauvegarde la configuration dans un fichier JSON."""
-        try:
-            with open(CONFIG_FILE, "w") as file:
-                json.dump(data, file, indent=4)
-            logger.info(f"☑️ Configuration Twitch sauvegardée dans '{CONFIG_FILE}'.")
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la sauvegarde dans '{CONFIG_FILE}' : {e}")
+    async def cog_load(self):
+        self.bot.loop.create_task(self.initialize())  # Appel au démarrage
 
     async def initialize(self):
         """Initialise le token et la tâche de vérification."""
@@ -71,91 +41,142 @@ class Twitch(commands.Cog):
             "client_secret": TWITCH_CLIENT_SECRET,
             "grant_type": "client_credentials",
         }
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self.headers = {
-                            "Client-ID": TWITCH_CLIENT_ID,
-                            "Authorization": f"Bearer {data['access_token']}",
-                        }
-                        logger.info("☑️ Token Twitch récupéré avec succès.")
-                    else:
-                        logger.error(f"❌ Erreur API Twitch (Token): {resp.status}")
-            except Exception as e:
-                logger.error(f"❌ Erreur lors de l'obtention du token Twitch : {e}")
+        try:
+            async with self.bot.http_client.post(url, params=params) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    self.headers = {
+                        "Client-ID": TWITCH_CLIENT_ID,
+                        "Authorization": f"Bearer {data['access_token']}",
+                    }
+                    logger.info("☑️ Token Twitch récupéré avec succès.")
+                else:
+                    logger.error(f"❌ Erreur API Twitch (Token): {resp.status}")
+        except Exception as e:
+            logger.error(f"❌ Erreur lors de l'obtention du token Twitch : {e}")
 
     async def check_streams_task(self):
-        """Tâche pour vérifier régulièrement si les streamers sont en live."""
+        """Tâche pour vérifier régulièrement si les streamers suivis par chaque serveur sont en live."""
         await self.bot.wait_until_ready()
         while not self.bot.is_closed():
-            channel_id = self.config.get("notification_channel_id")
-            if not channel_id:
-                logger.warning("⚠️ Aucun canal de notification configuré pour Twitch.")
+            # Streamer -> salons de notification des serveurs qui le suivent
+            followers = {}
+            for guild in self.bot.guilds:
+                config = await self.bot.guild_config.get(guild.id, "twitch")
+                channel_id = config.get("notification_channel_id")
+                channel = guild.get_channel(channel_id) if channel_id else None
+                if not channel:
+                    continue
+                for streamer in config["streamers"]:
+                    followers.setdefault(streamer, []).append(channel)
+
+            if not followers:
+                logger.debug("Aucun serveur n'a configuré de notifications Twitch.")
                 await asyncio.sleep(60)
                 continue
 
-            channel = self.bot.get_channel(channel_id)
-            if not channel:
-                logger.warning(f"⚠️ Le canal avec l'ID {channel_id} est introuvable.")
-                await asyncio.sleep(60)
-                continue
-
-            for streamer in self.config["streamers"]:
-                stream_data = await self.fetch_stream_data(streamer)
-                if stream_data and not self.streamers_status.get(streamer, False):
-                    self.streamers_status[streamer] = True
-                    embed = discord.Embed(
-                        title=f"🟣 {streamer} est en live !",
-                        description=f"**{stream_data['title']}**\n🎮 **Jeu** : {stream_data['game_name']}",
-                        url=f"https://www.twitch.tv/{streamer}",
-                        color=discord.Color.dark_purple(),
-                    )
-                    embed.set_thumbnail(url=stream_data.get("profile_image_url"))
-                    embed.set_image(url=stream_data.get("thumbnail_url").replace("{width}x{height}", "1280x720"))
-                    embed.set_footer(text="Rejoins le stream maintenant ! 🚀")
+            live, checked = await self.fetch_live_streams(list(followers))
+            newly_live = [
+                streamer for streamer in followers
+                if streamer.lower() in live and not self.streamers_status.get(streamer, False)
+            ]
+            profiles = await self.fetch_profiles([streamer.lower() for streamer in newly_live])
+
+            for streamer in newly_live:
+                self.streamers_status[streamer] = True
+                stream_data = {**live[streamer.lower()], **profiles.get(streamer.lower(), {})}
+                embed = discord.Embed(
+                    title=f"🟣 {streamer} est en live !",
+                    description=f"**{stream_data['title']}**\n🎮 **Jeu** : {stream_data['game_name']}",
+                    url=f"https://www.twitch.tv/{streamer}",
+                    color=discord.Color.dark_purple(),
+                )
+                embed.set_thumbnail(url=stream_data.get("profile_image_url"))
+                embed.set_image(url=stream_data.get("thumbnail_url").replace("{width}x{height}", "1280x720"))
+                embed.set_footer(text="Rejoins le stream maintenant ! 🚀")
+                for channel in followers[streamer]:
                     await channel.send(embed=embed)
-                elif not stream_data and self.streamers_status.get(streamer, False):
+
+            for streamer in followers:
+                # Un streamer dont le lot a échoué garde son état jusqu'au prochain cycle
+                if streamer.lower() in checked and streamer.lower() not in live:
                     self.streamers_status[streamer] = False
             await asyncio.sleep(120)
 
-    async def fetch_stream_data(self, streamer):
-        """Récupère les informations sur le stream en cours et l'utilisateur."""
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            try:
-                stream_url = f"{self.twitch_api_url}streams?user_login={streamer}"
-                async with session.get(stream_url) as stream_resp:
-                    stream_data = await stream_resp.json()
-                    if not stream_data.get("data"):
+    async def helix_get(self, endpoint, params):
+        """Requête GET sur l'API Helix ; le token est renouvelé une fois s'il a expiré. Retourne `data` ou None."""
+        for attempt in range(2):
+            async with self.bot.http_client.get(
+                f"{self.twitch_api_url}{endpoint}", params=params, headers=self.headers
+            ) as resp:
+                if resp.status == 401 and attempt == 0:
+                    logger.warning("⚠️ Token Twitch expiré, renouvellement.")
+                else:
+                    if resp.status != 200:
+                        logger.error(f"❌ Erreur API Twitch ({endpoint}) : {resp.status}")
                         return None
-
-                user_url = f"{self.twitch_api_url}users?login={streamer}"
-                async with session.get(user_url) as user_resp:
-                    user_data = await user_resp.json()
-                    return {**stream_data["data"][0], **user_data["data"][0]}
-            except Exception as e:
-                logger.error(f"❌ Erreur lors de la récupération des données Twitch pour {streamer} : {e}")
-                return None
+                    return (await resp.json()).get("data", [])
+            await self.fetch_twitch_token()
+        return None
+
+    async def fetch_batches(self, endpoint, key, logins, extra=()):
+        """
+        Interroge `endpoint` par lots de 100 identifiants (`key=login&key=…`), avec au plus
+        `MAX_CONCURRENT_BATCHES` lots en vol. Retourne `{lot: données ou None}`.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+        batches = [tuple(logins[i:i + HELIX_BATCH_SIZE]) for i in range(0, len(logins), HELIX_BATCH_SIZE)]
+
+        async def fetch(batch):
+            async with semaphore:
+                try:
+                    return await self.helix_get(endpoint, [(key, login) for login in batch] + list(extra))
+                except Exception as e:
+                    logger.error(f"❌ Erreur lors de la requête Twitch ({endpoint}, {len(batch)} comptes) : {e}")
+                    return None
+
+        return dict(zip(batches, await asyncio.gather(*(fetch(batch) for batch in batches))))
+
+    async def fetch_live_streams(self, streamers):
+        """Retourne `(streams en cours par login, logins vérifiés avec succès)`."""
+        logins = list(dict.fromkeys(streamer.lower() for streamer in streamers))
+        live, checked = {}, set()
+        for batch, streams in (await self.fetch_batches("streams", "user_login", logins, [("first", str(HELIX_BATCH_SIZE))])).items():
+            if streams is None:
+                continue
+            checked.update(batch)
+            for stream in streams:
+                live[stream["user_login"].lower()] = stream
+        return live, checked
+
+    async def fetch_profiles(self, logins):
+        """Profils (`users`) des logins demandés ; ils changent rarement et sont gardés `PROFILE_TTL` secondes."""
+        now = time.monotonic()
+        missing = [login for login in logins if now - self.profiles.get(login, (None, -PROFILE_TTL))[1] >= PROFILE_TTL]
+        if missing:
+            for users in (await self.fetch_batches("users", "login", missing)).values():
+                for user in users or []:
+                    self.profiles[user["login"].lower()] = (user, now)
+        return {login: self.profiles[login][0] for login in logins if login in self.profiles}
 
     @commands.hybrid_command(name="set_twitch_channel", help="Définit le salon pour les notifications Twitch.")
     async def set_twitch_channel(self, ctx: commands.Context, channel: discord.TextChannel):
-        self.config["notification_channel_id"] = channel.id
-        self.save_config(self.config)
+        await self.bot.guild_config.set(ctx.guild.id, "twitch", "notification_channel_id", channel.id)
         await ctx.send(f"☑️ Les notifications Twitch seront envoyées dans {channel.mention}.")
 
     @commands.hybrid_command(name="add_twitch_streamer", help="Ajoute un streamer à la liste.")
     async def add_streamer(self, ctx: commands.Context, streamer: str):
-        if streamer not in self.config["streamers"]:
-            self.config["streamers"].append(streamer)
-            self.save_config(self.config)
+        config = await self.bot.guild_config.get(ctx.guild.id, "twitch")
+        if streamer not in config["streamers"]:
+            await self.bot.guild_config.set(ctx.guild.id, "twitch", "streamers", config["streamers"] + [streamer])
             await ctx.send(f"☑️ **{streamer}** a été ajouté à la liste des streamers.")
         else:
             await ctx.send(f"⚠️ **{streamer}** est déjà dans la liste.")
 
     @commands.hybrid_command(name="list_twitch_streamers", help="Affiche la liste des streamers suivis.")
     async def list_streamers(self, ctx: commands.Context):
-        streamers = self.config["streamers"]
+        config = await self.bot.guild_config.get(ctx.guild.id, "twitch")
+        streamers = config["streamers"]
         description = "\n".join(streamers) if streamers else "Aucun streamer suivi."
         await ctx.send(embed=discord.Embed(
             title="📜 Liste des streamers suivis",
@@ -1,82 +1,101 @@
 import discord
-import json
-import os
-from discord.ext import commands
+from datetime import timedelta
+from discord.ext import commands, tasks
+from utils.bulk import BulkJob
 from utils.logger import logger
+from utils.scheduler import ExpiryScheduler
+from utils.warning_journal import WarningJournal
 
-# Chemin vers le fichier JSON dans le dossier 'data'
-CONFIG_DIR = "data"
-WARNINGS_FILE = os.path.join(CONFIG_DIR, "warnings.json")
+# `decay_days` à 0 : les avertissements n'expirent jamais
+DEFAULT_CONFIG = {"max_warnings": 3, "decay_days": 0}
+# Exclusion native appliquée immédiatement, le temps que le rôle Muted soit en place partout
+SANCTION_TIMEOUT = timedelta(hours=1)
+PROVISIONING_CONCURRENCY = 5
+# Espace de stockage des rôles Muted posés par la sanction (clé "guild_id:user_id")
+SANCTION_ROLES_NAMESPACE = "warning_sanction_roles"
 
 
 class Warnings(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.warnings = self.load_warnings()
-        self.max_warnings = 3
-
-    def load_warnings(self):
-        """Charge les avertissements depuis un fichier JSON dans 'data'. Crée le fichier s'il est manquant."""
-        # Crée le dossier 'data' s'il n'existe pas
-        if not os.path.exists(CONFIG_DIR):
-            os.makedirs(CONFIG_DIR)
-            logger.info(f"📁 Dossier '{CONFIG_DIR}' créé.")
-
-        # Crée le fichier JSON par défaut s'il n'existe pas
-        if not os.path.exists(WARNINGS_FILE):
-            logger.warning(f"⚠️ Fichier 'warnings.json' manquant. Création avec des valeurs par défaut.")
-            with open(WARNINGS_FILE, "w") as file:
-                json.dump({}, file, indent=4)
-            return {}
-
-        # Charge les avertissements existants
-        try:
-            with open(WARNINGS_FILE, "r") as file:
-                return json.load(file)
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Erreur lors de la lecture de '{WARNINGS_FILE}' : {e}")
-            return {}
-
-    def save_warnings(self):
-        """Sauvegarde les avertissements dans un fichier JSON."""
-        try:
-            with open(WARNINGS_FILE, "w") as file:
-                json.dump(self.warnings, file, indent=4)
-            logger.info(f"☑️ Avertissements sauvegardés dans '{WARNINGS_FILE}'.")
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la sauvegarde dans '{WARNINGS_FILE}' : {e}")
+        self.warnings = WarningJournal(bot.storage)
+        # Une seule tâche pour toutes les expirations d'avertissements
+        self.expiries = ExpiryScheduler(self.on_warning_expired)
+        self.bot.guild_config.register("warnings", DEFAULT_CONFIG)
+        self.provisioning = {}  # guild_id -> tâche de configuration du rôle Muted
+        # (guild_id, user_id) -> fin de l'exclusion posée par ce cog : les autres (raid, modérateurs) ne sont jamais levées
+        self.sanction_timeouts = {}
+        # (guild_id, user_id) dont le rôle Muted a été ajouté par ce cog : un rôle posé à la main n'est jamais retiré
+        self.sanction_roles = set()
+
+    async def cog_load(self):
+        """Reconstruit les avertissements en rejouant le journal et replanifie leurs échéances."""
+        await self.warnings.load()
+        roles = await self.bot.storage.get_namespace(SANCTION_ROLES_NAMESPACE)
+        self.sanction_roles = {tuple(int(part) for part in key.split(":")) for key in roles}
+        for warning in self.warnings.expiring():
+            self.expiries.schedule(warning.id, warning.expires_at)
+        self.expiries.start()
+        self.compact_journal.start()
+
+    async def cog_unload(self):
+        self.expiries.stop()
+        for task in self.provisioning.values():
+            task.cancel()
+        self.compact_journal.cancel()
+        await self.warnings.compact()
+
+    @tasks.loop(minutes=30)
+    async def compact_journal(self):
+        """Reporte périodiquement le journal des avertissements dans l'instantané."""
+        await self.warnings.compact()
 
     @commands.hybrid_command(name="warn", help="Avertit un utilisateur.")
     @commands.has_permissions(manage_messages=True)
     async def warn(self, ctx: commands.Context, member: discord.Member, *, reason: str = "Aucune raison spécifiée."):
         """Avertit un utilisateur via une commande hybride."""
-        if str(member.id) not in self.warnings:
-            self.warnings[str(member.id)] = []
-        self.warnings[str(member.id)].append(reason)
-        self.save_warnings()
+        config = await self.bot.guild_config.get(ctx.guild.id, "warnings")
+        lifetime = config["decay_days"] * 86400
+        warning = await self.warnings.warn(ctx.guild.id, member.id, ctx.author.id, reason, lifetime=lifetime)
+        if warning.expires_at:
+            self.expiries.schedule(warning.id, warning.expires_at)
 
-        total_warnings = len(self.warnings[str(member.id)])
+        total_warnings = len(self.warnings.get(ctx.guild.id, member.id))
+        max_warnings = config["max_warnings"]
+        description = (
+            f"**{member.mention}** a reçu un avertissement.\n"
+            f"📝 **Raison** : {reason}\n"
+            f"⚠️ **Total d'avertissements** : {total_warnings}/{max_warnings}"
+        )
+        if warning.expires_at:
+            description += f"\n⏳ **Expire** <t:{int(warning.expires_at)}:R>"
         embed = discord.Embed(
             title="⚠️ Avertissement",
-            description=(
-                f"**{member.mention}** a reçu un avertissement.\n"
-                f"📝 **Raison** : {reason}\n"
-                f"⚠️ **Total d'avertissements** : {total_warnings}/{self.max_warnings}"
-            ),
+            description=description,
             color=discord.Color.dark_embed(),
         )
         await ctx.send(embed=embed)
 
         # Vérification du seuil maximum
-        if total_warnings >= self.max_warnings:
-            await self.apply_sanction(ctx, member)
+        if total_warnings >= max_warnings:
+            await self.apply_sanction(ctx, member, max_warnings)
+
+    @staticmethod
+    def format_warning(number, warning):
+        """Ligne d'affichage d'un avertissement : raison, modérateur et date s'ils sont connus."""
+        line = f"{number}. {warning.reason}"
+        if warning.moderator_id:
+            line += f" — par <@{warning.moderator_id}>"
+        if warning.created_at:
+            line += f" <t:{int(warning.created_at)}:R>"
+        return line
 
     @commands.hybrid_command(name="warnings", help="Affiche les avertissements d'un utilisateur.")
     async def show_warnings(self, ctx: commands.Context, member: discord.Member):
         """Affiche les avertissements d'un utilisateur."""
-        warnings_list = self.warnings.get(str(member.id), [])
+        warnings_list = self.warnings.get(ctx.guild.id, member.id)
         if warnings_list:
-            warning_str = "\n".join([f"{i + 1}. {reason}" for i, reason in enumerate(warnings_list)])
+            warning_str = "\n".join([self.format_warning(i + 1, warning) for i, warning in enumerate(warnings_list)])
             embed = discord.Embed(
                 title=f"📋 Avertissements pour {member.name}",
                 description=warning_str,
@@ -94,9 +113,11 @@ class Warnings(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def clear_warnings(self, ctx: commands.Context, member: discord.Member):
         """Efface tous les avertissements d'un utilisateur."""
-        if str(member.id) in self.warnings:
-            del self.warnings[str(member.id)]
-            self.save_warnings()
+        cleared = await self.warnings.clear(ctx.guild.id, member.id, ctx.author.id)
+        for warning in cleared:
+            self.expiries.cancel(warning.id)
+        if cleared:
+            await self.lift_sanction(member, "Avertissements effacés")
             await ctx.send(embed=discord.Embed(
                 title="🧹 Avertissements effacés",
                 description=f"☑️ Tous les avertissements pour **{member.mention}** ont été supprimés.",
@@ -114,7 +135,7 @@ class Warnings(commands.Cog):
     async def set_max_warnings(self, ctx: commands.Context, number: int):
         """Définit le nombre maximum d'avertissements avant sanction."""
         if number > 0:
-            self.max_warnings = number
+            await self.bot.guild_config.set(ctx.guild.id, "warnings", "max_warnings", number)
             await ctx.send(embed=discord.Embed(
                 title="☑️ Configuration mise à jour",
                 description=f"⚠️ Le nombre maximum d'avertissements a été fixé à **{number}**.",
@@ -127,21 +148,158 @@ class Warnings(commands.Cog):
                 color=discord.Color.dark_embed()
             ))
 
-    async def apply_sanction(self, ctx: commands.Context, member: discord.Member):
+    @commands.hybrid_command(name="set_warning_decay", help="Définit après combien de jours un avertissement expire (0 = jamais).")
+    @commands.has_permissions(administrator=True)
+    async def set_warning_decay(self, ctx: commands.Context, days: int):
+        """Définit la durée de vie des nouveaux avertissements."""
+        if days < 0:
+            await ctx.send(embed=discord.Embed(
+                title="❌ Erreur",
+                description="La durée doit être positive (0 pour désactiver l'expiration).",
+                color=discord.Color.dark_embed()
+            ))
+            return
+
+        await self.bot.guild_config.set(ctx.guild.id, "warnings", "decay_days", days)
+        description = (
+            f"⏳ Les nouveaux avertissements expireront après **{days}** jour(s)."
+            if days else "⏳ Les nouveaux avertissements n'expireront plus."
+        )
+        await ctx.send(embed=discord.Embed(
+            title="☑️ Configuration mise à jour",
+            description=description,
+            color=discord.Color.dark_purple()
+        ))
+
+    async def on_warning_expired(self, warning_id):
+        """Retire un avertissement arrivé à échéance et lève la sanction si le membre repasse sous le seuil."""
+        warning = await self.warnings.expire(warning_id)
+        if warning is None or warning.guild_id is None:
+            return
+        logger.info(f"⏳ Avertissement {warning_id} de l'utilisateur {warning.user_id} expiré.")
+
+        guild = self.bot.get_guild(warning.guild_id)
+        member = guild.get_member(warning.user_id) if guild else None
+        if member is None:
+            return
+        config = await self.bot.guild_config.get(guild.id, "warnings")
+        if len(self.warnings.get(guild.id, member.id)) < config["max_warnings"]:
+            await self.lift_sanction(member, "Avertissements expirés")
+
+    def owns_timeout(self, member: discord.Member):
+        """Vrai si l'exclusion en cours du membre est celle posée par la sanction automatique."""
+        until = self.sanction_timeouts.get((member.guild.id, member.id))
+        current = member.timed_out_until
+        if until is None or current is None or not member.is_timed_out():
+            return False
+        # Discord peut tronquer la date renvoyée : une seconde d'écart est tolérée
+        return abs((current - until).total_seconds()) < 1
+
+    async def lift_sanction(self, member: discord.Member, reason: str):
+        """Retire le rôle Muted et l'exclusion temporaire posés par la sanction automatique."""
+        key = (member.guild.id, member.id)
+        muted_role = discord.utils.get(member.guild.roles, name="Muted")
+        has_role = key in self.sanction_roles and muted_role is not None and muted_role in member.roles
+        owns_timeout = self.owns_timeout(member)
+        self.sanction_timeouts.pop(key, None)
+        if key in self.sanction_roles:
+            self.sanction_roles.discard(key)
+            await self.bot.storage.delete_value(SANCTION_ROLES_NAMESPACE, f"{member.guild.id}:{member.id}")
+        if not has_role and not owns_timeout:
+            return
+        try:
+            if has_role:
+                await member.remove_roles(muted_role, reason=reason)
+            if owns_timeout:
+                await member.timeout(None, reason=reason)
+            logger.info(f"🔊 Sanction levée pour {member} dans '{member.guild.name}' : {reason}.")
+        except discord.HTTPException as e:
+            logger.error(f"❌ Impossible de lever la sanction de {member} : {e}")
+
+    async def apply_sanction(self, ctx: commands.Context, member: discord.Member, max_warnings: int):
         """Applique une sanction si le seuil maximum d'avertissements est atteint."""
-        muted_role = discord.utils.get(ctx.guild.roles, name="Muted")
-        if not muted_role:
-            muted_role = await ctx.guild.create_role(name="Muted")
-            for channel in ctx.guild.channels:
-                await channel.set_permissions(muted_role, send_messages=False)
+        # Exclusion native immédiate : le membre ne peut plus écrire, même pendant la configuration du rôle
+        now = discord.utils.utcnow()
+        until = now + SANCTION_TIMEOUT
+        self.sanction_timeouts = {key: end for key, end in self.sanction_timeouts.items() if end > now}
+        # Une exclusion plus longue déjà en cours (raid, modérateur) n'est pas écourtée
+        if not member.is_timed_out() or member.timed_out_until < until:
+            try:
+                await member.timeout(until, reason="Trop d'avertissements")
+                self.sanction_timeouts[(member.guild.id, member.id)] = until
+            except discord.HTTPException as e:
+                logger.error(f"❌ Impossible d'exclure temporairement {member} : {e}")
 
-        await member.add_roles(muted_role, reason="Trop d'avertissements")
+        muted_role = await self.ensure_muted_role(ctx.guild, ctx.channel)
+        # Un rôle Muted déjà posé par un modérateur reste le sien : il ne sera pas retiré à la levée
+        if muted_role not in member.roles:
+            await member.add_roles(muted_role, reason="Trop d'avertissements")
+            self.sanction_roles.add((member.guild.id, member.id))
+            await self.bot.storage.set_value(SANCTION_ROLES_NAMESPACE, f"{member.guild.id}:{member.id}", True)
         await ctx.send(embed=discord.Embed(
             title="🔇 Sanction appliquée",
-            description=f"**{member.mention}** a été mute automatiquement après {self.max_warnings} avertissements.",
+            description=f"**{member.mention}** a été mute automatiquement après {max_warnings} avertissements.",
             color=discord.Color.dark_embed(),
         ))
 
+    async def ensure_muted_role(self, guild: discord.Guild, progress_channel=None):
+        """Retourne le rôle Muted, en le créant si besoin, et complète ses permissions en arrière-plan."""
+        muted_role = discord.utils.get(guild.roles, name="Muted")
+        if muted_role is None:
+            muted_role = await guild.create_role(name="Muted", reason="Rôle de sanction des avertissements")
+            logger.info(f"🔇 Rôle Muted créé dans '{guild.name}'.")
+
+        task = self.provisioning.get(guild.id)
+        if task is None or task.done():
+            # Seuls les salons sans restriction sont traités : une configuration interrompue reprend où elle s'est arrêtée
+            channels = [
+                channel for channel in guild.channels
+                if channel.overwrites_for(muted_role).send_messages is not False
+            ]
+            if channels:
+                task = self.bot.loop.create_task(self.provision_muted_role(guild, muted_role, channels, progress_channel))
+                self.provisioning[guild.id] = task
+                task.add_done_callback(lambda _: self.provisioning.pop(guild.id, None))
+        return muted_role
+
+    async def provision_muted_role(self, guild, muted_role, channels, progress_channel=None):
+        """Applique les permissions du rôle Muted sur les salons avec une concurrence bornée."""
+        progress_message = None
+        if progress_channel is not None:
+            progress_message = await progress_channel.send(
+                f"🔧 Configuration du rôle Muted : 0/{len(channels)} salon(s)…"
+            )
+
+        async def report(job):
+            if progress_message is not None:
+                await progress_message.edit(
+                    content=f"🔧 Configuration du rôle Muted : {job.done}/{job.total} salon(s)…"
+                )
+
+        async def restrict(channel):
+            await channel.set_permissions(muted_role, send_messages=False, reason="Configuration du rôle Muted")
+
+        job = await BulkJob(restrict, channels, concurrency=PROVISIONING_CONCURRENCY, on_progress=report).run()
+        summary = f"☑️ Rôle Muted configuré sur {len(job.succeeded)}/{job.total} salon(s)."
+        if job.failed:
+            summary += f" ⚠️ {len(job.failed)} échec(s)."
+            for channel, error in job.failed:
+                logger.warning(f"⚠️ Permissions du rôle Muted non appliquées sur '{channel.name}' : {error}")
+        if progress_message is not None:
+            await progress_message.edit(content=summary)
+        logger.info(f"{summary} ('{guild.name}')")
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        """Applique les permissions du rôle Muted aux nouveaux salons."""
+        muted_role = discord.utils.get(channel.guild.roles, name="Muted")
+        if muted_role is None:
+            return
+        try:
+            await channel.set_permissions(muted_role, send_messages=False, reason="Configuration du rôle Muted")
+        except discord.HTTPException as e:
+            logger.warning(f"⚠️ Permissions du rôle Muted non appliquées sur '{channel.name}' : {e}")
+
 
 async def setup(bot: commands.Bot):
     """Ajoute la cog au bot."""
@@ -1,56 +1,22 @@
 import discord
-import json
 import os
 from discord.ext import commands
 from utils.logger import logger
 
-# Chemin vers le fichier JSON dans le dossier 'data'
-CONFIG_DIR = "data"
-WELCOME_CONFIG_FILE = os.path.join(CONFIG_DIR, "welcome_config.json")
+DEFAULT_CONFIG = {"rules_channel_id": None, "welcome_channel_id": "welcome"}
 
 
 class Welcome(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.config = self.load_config()
-
-    def load_config(self):
-        """Charge la configuration des salons depuis un fichier JSON dans 'data'. Crée le fichier s'il est manquant."""
-        # Crée le dossier 'data' s'il n'existe pas
-        if not os.path.exists(CONFIG_DIR):
-            os.makedirs(CONFIG_DIR)
-            logger.info(f"📁 Dossier '{CONFIG_DIR}' créé.")
-
-        # Crée le fichier JSON par défaut s'il n'existe pas
-        if not os.path.exists(WELCOME_CONFIG_FILE):
-            logger.warning(f"⚠️ Fichier 'welcome_config.json' manquant. Création avec des valeurs par défaut.")
-            default_config = {"rules_channel_id": None, "welcome_channel_id": "welcome"}
-            with open(WELCOME_CONFIG_FILE, "w") as file:
-                json.dump(default_config, file, indent=4)
-            return default_config
-
-        # Charge la configuration existante
-        try:
-            with open(WELCOME_CONFIG_FILE, "r") as file:
-                return json.load(file)
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Erreur lors de la lecture de '{WELCOME_CONFIG_FILE}' : {e}")
-            return {"rules_channel_id": None, "welcome_channel_id": "welcome"}
-
-    def save_config(self):
-        """Sauvegarde la configuration dans un fichier JSON."""
-        try:
-            with open(WELCOME_CONFIG_FILE, "w") as file:
-                json.dump(self.config, file, indent=4)
-            logger.info(f"☑️ Configuration sauvegardée dans '{WELCOME_CONFIG_FILE}'.")
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la sauvegarde de '{WELCOME_CONFIG_FILE}' : {e}")
+        self.bot.guild_config.register("welcome", DEFAULT_CONFIG)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         """Envoie un message de bienvenue lorsqu'un nouveau membre rejoint le serveur."""
         guild = member.guild
-        welcome_channel_id = self.config.get("welcome_channel_id", "welcome")
+        config = await self.bot.guild_config.get(guild.id, "welcome")
+        welcome_channel_id = config.get("welcome_channel_id") or "welcome"
 
         # Récupérer le salon de bienvenue
         welcome_channel = None
@@ -67,7 +33,7 @@ class Welcome(commands.Cog):
             return
 
         # Récupération du salon des règles
-        rules_channel_id = self.config.get("rules_channel_id")
+        rules_channel_id = config.get("rules_channel_id")
         rules_channel_mention = f"<#{rules_channel_id}>" if rules_channel_id else "le salon des règles"
 
         # Chemin des images locales
@@ -113,8 +79,7 @@ class Welcome(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def set_rules_channel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Définit le salon des règles."""
-        self.config["rules_channel_id"] = str(channel.id)
-        self.save_config()
+        await self.bot.guild_config.set(ctx.guild.id, "welcome", "rules_channel_id", str(channel.id))
         await ctx.send(embed=discord.Embed(
             title="☑️ Configuration mise à jour",
             description=f"Le salon des règles a été configuré sur {channel.mention}.",
@@ -125,8 +90,7 @@ class Welcome(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def set_welcome_channel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Définit le nom ou l'ID du salon de bienvenue."""
-        self.config["welcome_channel_id"] = str(channel.id)
-        self.save_config()
+        await self.bot.guild_config.set(ctx.guild.id, "welcome", "welcome_channel_id", str(channel.id))
         await ctx.send(embed=discord.Embed(
             title="☑️ Configuration mise à jour",
             description=f"Le salon de bienvenue a été configuré sur {channel.mention}.",
@@ -136,8 +100,9 @@ class Welcome(commands.Cog):
     @commands.hybrid_command(name="show_welcome_config", help="Affiche la configuration actuelle des messages de bienvenue.")
     async def show_welcome_config(self, ctx: commands.Context):
         """Affiche la configuration actuelle."""
-        rules_channel_id = self.config.get("rules_channel_id")
-        welcome_channel_id = self.config.get("welcome_channel_id")
+        config = await self.bot.guild_config.get(ctx.guild.id, "welcome")
+        rules_channel_id = config.get("rules_channel_id")
+        welcome_channel_id = config.get("welcome_channel_id")
 
         rules_channel_mention = f"<#{rules_channel_id}>" if rules_channel_id else "Non défini"
         welcome_channel_mention = f"<#{welcome_channel_id}>" if welcome_channel_id else "Non défini"
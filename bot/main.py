@@ -3,6 +3,14 @@ import asyncio
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
+from utils.cache import ResponseCache
+from utils.charts import ChartRenderer
+from utils.guild_config import GuildConfig
+from utils.http import HTTPClient
+from utils.presence import PresenceCounters
+from utils.router import MessageRouter
+from utils.storage import Storage
+from utils.waiters import WaiterRegistry
 
 
 load_dotenv(dotenv_path="config")
@@ -18,9 +26,35 @@ intents.messages = True
 intents.guilds = True
 intents.members = True
 intents.message_content = True
+intents.presences = True  # Intent privilégié : à activer aussi dans le portail développeur
 
 bot = commands.Bot(command_prefix="!", intents=intents)
 
+# Les attentes de réponse (quiz, chifoumi, pendu) sont indexées par (salon, auteur)
+bot.waiters = WaiterRegistry()
+# Routeur de messages partagé : chaque message est analysé une seule fois pour tous les cogs
+bot.message_router = MessageRouter(waiters=bot.waiters)
+bot.add_listener(bot.message_router.dispatch, "on_message")
+
+# Client HTTP partagé (pool de connexions) pour toutes les API externes
+bot.http_client = HTTPClient()
+# Cache des réponses d'API (TTL, rafraîchissement en arrière-plan, requêtes fusionnées)
+bot.response_cache = ResponseCache()
+# Stockage SQLite partagé (configuration, mots interdits, avertissements, classement)
+bot.storage = Storage()
+# Configuration par serveur, chargée à la demande et gardée en mémoire
+bot.guild_config = GuildConfig(bot.storage)
+bot.add_listener(bot.guild_config.on_guild_remove, "on_guild_remove")
+# Rendu des graphiques (matplotlib facultatif) dans un processus séparé, avec cache
+bot.charts = ChartRenderer()
+# Compteurs de membres et de présences par serveur, tenus à jour par les événements
+bot.presence = PresenceCounters(bot)
+for event in (
+    "on_ready", "on_guild_join", "on_guild_remove", "on_guild_available", "on_guild_unavailable",
+    "on_presence_update", "on_member_join", "on_member_remove",
+):
+    bot.add_listener(getattr(bot.presence, event), event)
+
 
 @bot.event
 async def on_ready():
@@ -73,8 +107,19 @@ async def unload_all_cogs():
 
 async def main():
     async with bot:
-        await load_cogs()
-        await bot.start(TOKEN)
+        # Le processus de rendu est créé avant les threads des autres services
+        await bot.charts.start()
+        await bot.storage.open()
+        await bot.http_client.start()
+        try:
+            await load_cogs()
+            await bot.start(TOKEN)
+        finally:
+            # Décharge les cogs (et leurs dernières écritures) avant de fermer les services partagés
+            await bot.close()
+            await bot.http_client.close()
+            await bot.storage.close()
+            bot.charts.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+"""
+Tests du classement indexé par un arbre de Fenwick.
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m unittest discover -s tests -t .
+"""
+import random
+import unittest
+
+from utils.leaderboard import Leaderboard
+
+
+def expected_rank(scores, user_id):
+    return 1 + sum(1 for score in scores.values() if score > scores[user_id])
+
+
+def expected_top(scores, limit):
+    ordered = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(user_id, score, expected_rank(scores, user_id)) for user_id, score in ordered]
+
+
+class LeaderboardTest(unittest.TestCase):
+    def test_rank_and_top_with_ties(self):
+        board = Leaderboard({"a": 5, "b": 5, "c": 3, "d": 0})
+
+        self.assertEqual([board.rank(user_id) for user_id in "abcd"], [1, 1, 3, 4])
+        self.assertIsNone(board.rank("inconnu"))
+        self.assertEqual(board.top(2), [("a", 5, 1), ("b", 5, 1)])
+        self.assertEqual(board.top(10), [("a", 5, 1), ("b", 5, 1), ("c", 3, 3), ("d", 0, 4)])
+        self.assertEqual(Leaderboard().top(), [])
+
+    def test_scores_beyond_initial_size(self):
+        board = Leaderboard({"a": 10, "b": 63})
+        self.assertEqual(board.add_points("c", 200), 200)
+        self.assertEqual(board.add_points("b", 1000), 1063)
+
+        self.assertGreaterEqual(board._index.size, 1064)
+        self.assertEqual([board.rank(user_id) for user_id in "abc"], [3, 1, 2])
+        self.assertEqual(board.top(3), [("b", 1063, 1), ("c", 200, 2), ("a", 10, 3)])
+
+    def test_negative_points_clamped_to_zero(self):
+        board = Leaderboard({"a": 2, "b": 1})
+        self.assertEqual(board.add_points("a", -5), 0)
+        self.assertEqual(board.add_points("c", -3), 0)
+        self.assertEqual(board.add_points("a", 4), 4)
+
+        self.assertEqual(board.top(), [("a", 4, 1), ("b", 1, 2), ("c", 0, 3)])
+        self.assertEqual(board.pop_dirty(), {"a": 4, "c": 0})
+        self.assertEqual(board.pop_dirty(), {})
+
+    def test_random_updates_match_brute_force(self):
+        rng = random.Random(42)
+        board = Leaderboard()
+        scores = {}
+        users = [f"u{i:02d}" for i in range(30)]
+        for step in range(3000):
+            user_id = rng.choice(users)
+            points = rng.choice((rng.randint(-15, 15), rng.randint(50, 400)))
+            scores[user_id] = max(scores.get(user_id, 0) + points, 0)
+
+            self.assertEqual(board.add_points(user_id, points), scores[user_id])
+            self.assertEqual(board.rank(user_id), expected_rank(scores, user_id))
+            if step % 50 == 0:
+                self.assertEqual(board.top(10), expected_top(scores, 10))
+                self.assertEqual(board.top(len(scores)), expected_top(scores, len(scores)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Tests de la file d'envoi regroupée.
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m unittest discover -s tests -t .
+"""
+import asyncio
+import unittest
+
+from utils.log_batcher import LogBatcher
+
+
+class LogBatcherTest(unittest.IsolatedAsyncioTestCase):
+    async def test_several_items_without_weight_limit(self):
+        sent = []
+
+        async def send(key, batch):
+            sent.append((key, batch))
+
+        batcher = LogBatcher(send, max_items=3, delay=0.01)
+        for item in range(5):
+            batcher.push("index", item)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(sent, [("index", [0, 1, 2]), ("index", [3, 4])])
+        self.assertEqual(len(batcher), 0)
+        await batcher.close()
+
+    async def test_weight_limit_cuts_batch(self):
+        sent = []
+
+        async def send(key, batch):
+            sent.append(batch)
+
+        batcher = LogBatcher(send, max_items=10, max_weight=5, delay=0.01)
+        for item in ("abc", "de", "fgh"):
+            batcher.push("logs", item)
+        await batcher.close()
+
+        self.assertEqual(sent, [["abc", "de"], ["fgh"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
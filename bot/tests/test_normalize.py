@@ -0,0 +1,52 @@
+"""
+Tests de la normalisation des messages et de la recherche des mots interdits.
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m unittest discover -s tests -t .
+"""
+import unittest
+
+from utils.matcher import BannedWordMatcher
+from utils.normalize import normalize_text, normalize_word
+
+
+def matches(banned, text):
+    return BannedWordMatcher(normalize_word(word) for word in banned).search(normalize_text(text).compact)
+
+
+class NormalizeTest(unittest.TestCase):
+    def test_leetspeak(self):
+        self.assertEqual(normalize_text("$p4m").compact, "spam")
+        self.assertTrue(matches(["spam"], "c'est du 5P@M"))
+
+    def test_fullwidth_and_accents(self):
+        self.assertEqual(normalize_text("\uff53\uff50\uff41\uff4d").compact, "spam")
+        self.assertEqual(normalize_text("Spâm").compact, "spam")
+
+    def test_zero_width_characters(self):
+        self.assertEqual(normalize_text("sp\u200bam").compact, "spam")
+        self.assertTrue(matches(["spam"], "s\u200dp\u2060a\ufeffm"))
+
+    def test_separated_single_letters(self):
+        self.assertEqual(normalize_text("s.p.a.m").compact, "spam")
+        self.assertEqual(normalize_text("s p a m").compact, "spam")
+        self.assertTrue(matches(["spam"], "voici du s-p-a-m"))
+
+    def test_word_boundaries_are_kept(self):
+        self.assertEqual(normalize_text("les pâmes").compact, "les pames")
+        self.assertIsNone(matches(["spam"], "les pâmes"))
+        self.assertTrue(matches(["gros mot"], "un gros-mot"))
+
+    def test_double_letters_are_kept(self):
+        self.assertEqual(normalize_word("pass"), "pass")
+        self.assertIsNone(matches(["pass"], "je ne sais pas"))
+        self.assertIsNone(matches(["cool"], "au collège"))
+        self.assertTrue(matches(["cool"], "trop cool"))
+
+    def test_long_repeats_are_shortened(self):
+        self.assertEqual(normalize_text("spaaaaam").compact, "spaam")
+        self.assertTrue(matches(["pass"], "passsss"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests de l'échéancier des expirations.
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m unittest discover -s tests -t .
+"""
+import asyncio
+import time
+import unittest
+
+from utils.scheduler import ExpiryScheduler
+
+
+class ExpirySchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.expired = []
+
+        async def callback(key):
+            self.expired.append(key)
+
+        self.scheduler = ExpiryScheduler(callback)
+
+    async def asyncTearDown(self):
+        self.scheduler.stop()
+
+    async def test_past_deadlines_expire_at_start(self):
+        now = time.time()
+        self.scheduler.schedule("b", now - 5)
+        self.scheduler.schedule("a", now - 10)
+        self.scheduler.start()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.expired, ["a", "b"])
+        self.assertEqual(len(self.scheduler), 0)
+
+    async def test_rescheduled_key_expires_once_at_new_deadline(self):
+        now = time.time()
+        self.scheduler.schedule("a", now + 0.05)
+        self.scheduler.schedule("a", now + 0.2)
+        self.scheduler.start()
+        await asyncio.sleep(0.1)
+        self.assertEqual(self.expired, [])
+        self.assertIn("a", self.scheduler)
+
+        await asyncio.sleep(0.2)
+        self.assertEqual(self.expired, ["a"])
+
+    async def test_cancel_entry_at_top_of_heap(self):
+        now = time.time()
+        self.scheduler.schedule("a", now + 0.05)
+        self.scheduler.schedule("b", now + 0.1)
+        self.scheduler.start()
+        await asyncio.sleep(0.01)
+        self.scheduler.cancel("a")
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(self.expired, ["b"])
+        self.assertEqual(len(self.scheduler), 0)
+
+    async def test_nearer_deadline_wakes_task_early(self):
+        self.scheduler.schedule("late", time.time() + 60)
+        self.scheduler.start()
+        await asyncio.sleep(0.01)  # La tâche attend l'échéance lointaine
+        self.scheduler.schedule("soon", time.time() + 0.05)
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(self.expired, ["soon"])
+        self.assertIn("late", self.scheduler)
+
+
+if __name__ == "__main__":
+    unittest.main()
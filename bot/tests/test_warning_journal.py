@@ -0,0 +1,115 @@
+"""
+Tests du journal des avertissements : rejeu et compaction sur une vraie base SQLite.
+
+Utilisation (depuis le dossier `bot/`) :
+    python -m unittest discover -s tests -t .
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from utils.storage import Storage
+from utils.warning_journal import WarningJournal
+
+GUILD, OTHER_GUILD = 1, 2
+USER, OTHER_USER = 42, 43
+MODERATOR = 7
+
+
+def state(journal):
+    """Contenu comparable d'un journal : un tuple par avertissement actif."""
+    return sorted(
+        (w.id, w.guild_id, w.user_id, w.moderator_id, w.reason, w.created_at, w.expires_at)
+        for w in journal._by_id.values()
+    )
+
+
+class WarningJournalTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # Les anciens fichiers JSON sont cherchés dans le dossier courant
+        self.directory = tempfile.TemporaryDirectory()
+        self.previous_cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        self.storage = None
+
+    async def asyncTearDown(self):
+        if self.storage is not None:
+            await self.storage.close()
+        os.chdir(self.previous_cwd)
+        self.directory.cleanup()
+
+    async def reopen(self):
+        """Ferme la base puis recharge le journal comme au redémarrage du bot."""
+        if self.storage is not None:
+            await self.storage.close()
+        self.storage = Storage(os.path.join(self.directory.name, "bot.db"))
+        await self.storage.open()
+        journal = WarningJournal(self.storage)
+        await journal.load()
+        return journal
+
+    async def test_snapshot_and_journal_replay(self):
+        journal = await self.reopen()
+        await journal.warn(GUILD, USER, MODERATOR, "spam")
+        await journal.warn(GUILD, USER, MODERATOR, "flood", lifetime=3600)
+        await journal.warn(GUILD, OTHER_USER, MODERATOR, "insulte")
+        self.assertEqual(await journal.compact(), 3)
+
+        # Après l'instantané : un événement de chaque sorte reste dans le journal
+        await journal.warn(OTHER_GUILD, USER, MODERATOR, "pub")
+        await journal.clear(GUILD, OTHER_USER, MODERATOR)
+        expected = state(journal)
+
+        reloaded = await self.reopen()
+        self.assertEqual(state(reloaded), expected)
+        self.assertEqual(reloaded.pending, 2)
+        self.assertEqual([w.reason for w in reloaded.get(GUILD, USER)], ["spam", "flood"])
+        self.assertEqual([w.reason for w in reloaded.get(OTHER_GUILD, USER)], ["pub"])
+        self.assertEqual(reloaded.get(GUILD, OTHER_USER), [])
+        self.assertEqual([w.reason for w in reloaded.expiring()], ["flood"])
+
+        await reloaded.compact()
+        self.assertEqual(state(await self.reopen()), expected)
+
+    async def test_clear_removes_legacy_warnings(self):
+        os.makedirs("data")
+        with open("data/warnings.json", "w", encoding="utf-8") as file:
+            json.dump({str(USER): ["ancien"]}, file)
+
+        journal = await self.reopen()
+        self.assertEqual([w.guild_id for w in journal.get(OTHER_GUILD, USER)], [None])
+        await journal.warn(GUILD, USER, MODERATOR, "récent")
+        self.assertEqual([w.reason for w in journal.get(GUILD, USER)], ["ancien", "récent"])
+
+        cleared = await journal.clear(GUILD, USER, MODERATOR)
+        self.assertEqual(sorted(w.reason for w in cleared), ["ancien", "récent"])
+        # Sans serveur, l'ancien avertissement comptait partout : il disparaît partout
+        self.assertEqual(journal.get(OTHER_GUILD, USER), [])
+
+        self.assertEqual(state(await self.reopen()), [])
+        journal = await self.reopen()
+        await journal.compact()
+        self.assertEqual(await self.storage.warning_snapshot(), [])
+        self.assertEqual(state(await self.reopen()), [])
+
+    async def test_expire_then_compact_then_reload(self):
+        journal = await self.reopen()
+        permanent = await journal.warn(GUILD, USER, MODERATOR, "spam")
+        expiring = await journal.warn(GUILD, USER, MODERATOR, "flood", lifetime=60)
+        await journal.compact()
+
+        expired = await journal.expire(expiring.id)
+        self.assertEqual(expired.reason, "flood")
+        self.assertIsNone(await journal.expire(expiring.id))
+        self.assertEqual(await journal.compact(), 1)
+
+        reloaded = await self.reopen()
+        self.assertEqual(reloaded.pending, 0)
+        self.assertEqual([w.id for w in reloaded.get(GUILD, USER)], [permanent.id])
+        self.assertEqual(reloaded.expiring(), [])
+        self.assertIsNone(await reloaded.expire(expiring.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
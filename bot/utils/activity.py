@@ -0,0 +1,276 @@
+import heapq
+import time
+from array import array
+
+MINUTE = 60
+HOUR = 3600
+DAY = 86400
+
+# Paliers (largeur d'un compartiment, nombre de compartiments) de chaque type de série.
+# Le total du serveur garde la minute sur 24 h ; salons et membres commencent à l'heure.
+TIERS = {
+    "guild": ((MINUTE, 24 * 60), (HOUR, 30 * 24), (DAY, 365)),
+    "channel": ((HOUR, 7 * 24), (DAY, 90)),
+    "user": ((HOUR, 7 * 24), (DAY, 90)),
+    # Arrivées et départs de membres par jour (clé 0), pour l'évolution du nombre de membres
+    "joins": ((DAY, 365),),
+    "leaves": ((DAY, 365),),
+}
+
+
+class RingSeries:
+    """
+    Compteurs par compartiment de temps dans un tableau circulaire de taille fixe.
+
+    `head` est le numéro (horodatage // largeur) du compartiment le plus récent : avancer
+    remet à zéro les compartiments sautés, qui réutilisent la place des plus anciens.
+    """
+
+    __slots__ = ("width", "size", "head", "data")
+
+    def __init__(self, width, size, head=0, data=None):
+        self.width = width
+        self.size = size
+        self.head = head
+        self.data = data if data is not None else array("I", bytes(4 * size))
+
+    def _advance(self, bucket):
+        if bucket <= self.head:
+            return
+        if bucket - self.head >= self.size:
+            self.data = array("I", bytes(4 * self.size))
+        else:
+            for skipped in range(self.head + 1, bucket + 1):
+                self.data[skipped % self.size] = 0
+        self.head = bucket
+
+    def add(self, timestamp, count=1):
+        bucket = int(timestamp // self.width)
+        self._advance(bucket)
+        if bucket > self.head - self.size:  # Trop ancien : déjà sorti de la fenêtre
+            self.data[bucket % self.size] += count
+
+    def span(self, now):
+        """Horodatage du début du plus ancien compartiment conservé."""
+        return (int(now // self.width) - self.size + 1) * self.width
+
+    def buckets(self, start, end):
+        """`(numéro, compte)` des compartiments qui recouvrent [start, end[, du plus ancien au plus récent."""
+        first = max(int(start // self.width), self.head - self.size + 1)
+        last = min(int((end - 1) // self.width), self.head)
+        return [(bucket, self.data[bucket % self.size]) for bucket in range(first, last + 1)]
+
+    def total(self, start, end):
+        first = max(int(start // self.width), self.head - self.size + 1)
+        last = min(int((end - 1) // self.width), self.head)
+        if first > last:
+            return 0
+        lo, hi = first % self.size, last % self.size
+        if lo <= hi:
+            return sum(self.data[lo:hi + 1])
+        return sum(self.data[lo:]) + sum(self.data[:hi + 1])
+
+
+def tier_index(kind, start, now):
+    """Indice du palier le plus fin qui couvre encore `start` (sinon le plus large)."""
+    for index, (width, size) in enumerate(TIERS[kind]):
+        if (int(now // width) - size + 1) * width <= start:
+            return index
+    return len(TIERS[kind]) - 1
+
+
+def covered_start(kind, start, now, width=None):
+    """
+    Début de la partie de [start, now[ réellement couverte par le palier de largeur `width`
+    (par défaut celui choisi par `tier_index`) : plus tard que `start` si la fenêtre
+    dépasse ce que le palier conserve.
+    """
+    if width is None:
+        width, size = TIERS[kind][tier_index(kind, start, now)]
+    else:
+        size = dict(TIERS[kind])[width]
+    return max(start, (int(now // width) - size + 1) * width)
+
+
+class ActivitySeries:
+    __slots__ = ("tiers",)
+
+    def __init__(self, kind):
+        self.tiers = [RingSeries(width, size) for width, size in TIERS[kind]]
+
+    def add(self, timestamp, count=1):
+        for tier in self.tiers:
+            tier.add(timestamp, count)
+
+    def tier_for(self, start, now):
+        """Palier le plus fin qui couvre encore `start` (sinon le plus large)."""
+        for tier in self.tiers:
+            if tier.span(now) <= start:
+                return tier
+        return self.tiers[-1]
+
+    def total(self, start, end, now=None):
+        return self.tier_for(start, now or time.time()).total(start, end)
+
+
+class ActivityStore:
+    """
+    Activité (nombre de messages) par serveur, salon et membre, en mémoire.
+
+    Chaque message incrémente directement tous les paliers de ses séries (minute, heure,
+    jour) : les agrégats sont toujours prêts et une requête sur 30 jours ne somme que
+    quelques dizaines de compteurs par série. Les séries modifiées sont marquées pour
+    être enregistrées périodiquement. Une fenêtre est arrondie au compartiment du
+    palier utilisé.
+    """
+
+    def __init__(self):
+        self._series = {}  # guild_id -> {type: {clé: ActivitySeries}}
+        self.dirty = set()  # (guild_id, type, clé)
+        self.versions = {}  # guild_id -> compteur de modifications (pour les caches de rendu)
+        self.member_versions = {}  # guild_id -> compteur d'arrivées et de départs enregistrés
+
+    def __len__(self):
+        return sum(len(series) for kinds in self._series.values() for series in kinds.values())
+
+    def _get(self, guild_id, kind, key):
+        kinds = self._series.setdefault(guild_id, {}).setdefault(kind, {})
+        series = kinds.get(key)
+        if series is None:
+            series = kinds[key] = ActivitySeries(kind)
+        return series
+
+    def _find(self, guild_id, kind, key=0):
+        return self._series.get(guild_id, {}).get(kind, {}).get(key)
+
+    def record(self, guild_id, channel_id, user_id, timestamp=None, count=1):
+        timestamp = timestamp or time.time()
+        for kind, key in (("guild", 0), ("channel", channel_id), ("user", user_id)):
+            self._get(guild_id, kind, key).add(timestamp, count)
+            self.dirty.add((guild_id, kind, key))
+        self.versions[guild_id] = self.versions.get(guild_id, 0) + 1
+
+    def record_member(self, guild_id, joined, timestamp=None):
+        """Compte une arrivée (`joined`) ou un départ de membre."""
+        kind = "joins" if joined else "leaves"
+        self._get(guild_id, kind, 0).add(timestamp or time.time())
+        self.dirty.add((guild_id, kind, 0))
+        self.member_versions[guild_id] = self.member_versions.get(guild_id, 0) + 1
+
+    def member_history(self, guild_id, members, days, now=None):
+        """
+        `[(horodatage, membres)]` au début de chaque jour, reconstitué à rebours depuis le nombre
+        actuel de membres et les arrivées/départs comptés. La courbe commence au premier jour
+        suivi (avant, les mouvements sont inconnus).
+        """
+        now = now or time.time()
+        joins, leaves = self._find(guild_id, "joins"), self._find(guild_id, "leaves")
+        start = now - days * DAY
+        moves = {}
+        for series, sign in ((joins, 1), (leaves, -1)):
+            if series is not None:
+                for bucket, count in series.tiers[0].buckets(start, now):
+                    if count:
+                        moves[bucket] = moves.get(bucket, 0) + sign * count
+        today = int(now // DAY)
+        first = min(moves, default=today)
+        points = [(now, members)]
+        for bucket in range(today, first - 1, -1):
+            members -= moves.get(bucket, 0)
+            points.append((bucket * DAY, members))
+        return points[::-1]
+
+    def total(self, guild_id, start, end=None):
+        series = self._find(guild_id, "guild")
+        end = end or time.time()
+        return series.total(start, end, end) if series else 0
+
+    def top(self, guild_id, kind, start, end=None, limit=5):
+        """Les `limit` salons ou membres les plus actifs : `[(clé, messages)]`."""
+        end = end or time.time()
+        # Toutes les séries d'un même type partagent la géométrie de leurs paliers : le choix est fait une fois
+        index = tier_index(kind, start, end)
+        width = TIERS[kind][index][0]
+        first = int(start // width)
+        totals = (
+            (key, series.tiers[index].total(start, end))
+            for key, series in self._series.get(guild_id, {}).get(kind, {}).items()
+            if series.tiers[index].head >= first  # Inactif sur la fenêtre : rien à sommer
+        )
+        return [item for item in heapq.nlargest(limit, totals, key=lambda item: item[1]) if item[1]]
+
+    def busiest_hours(self, guild_id, start, end=None, utc_offset=0):
+        """Messages par heure de la journée (24 valeurs), sur la partie de la fenêtre couverte à l'heure."""
+        end = end or time.time()
+        series = self._find(guild_id, "guild")
+        hours = [0] * 24
+        if series is None:
+            return hours
+        hourly = next(tier for tier in series.tiers if tier.width == HOUR)
+        for bucket, count in hourly.buckets(start, end):
+            hours[(bucket + utc_offset) % 24] += count
+        return hours
+
+    def timeline(self, guild_id, start, end=None):
+        """`[(horodatage, messages)]` du total du serveur, au palier le plus fin qui couvre la fenêtre."""
+        end = end or time.time()
+        series = self._find(guild_id, "guild")
+        if series is None:
+            return []
+        tier = series.tier_for(start, end)
+        return [(bucket * tier.width, count) for bucket, count in tier.buckets(start, end)]
+
+    def drop_guild(self, guild_id):
+        self._series.pop(guild_id, None)
+        self.versions.pop(guild_id, None)
+        self.member_versions.pop(guild_id, None)
+        self.dirty = {key for key in self.dirty if key[0] != guild_id}
+
+    def evict_stale(self, now=None):
+        """
+        Oublie les séries dont le compartiment le plus récent est sorti de leur palier le plus
+        large (toutes leurs valeurs sont à zéro). Retourne leurs `(guild_id, type, clé)`.
+        """
+        now = now or time.time()
+        stale = []
+        for guild_id, kinds in self._series.items():
+            for kind, series_by_key in kinds.items():
+                width, size = TIERS[kind][-1]
+                oldest = int(now // width) - size + 1
+                for key, series in series_by_key.items():
+                    if series.tiers[-1].head < oldest:
+                        stale.append((guild_id, kind, key))
+        for guild_id, kind, key in stale:
+            kinds = self._series[guild_id]
+            del kinds[kind][key]
+            self.dirty.discard((guild_id, kind, key))
+            if not kinds[kind]:
+                del kinds[kind]
+            if not kinds:
+                del self._series[guild_id]
+        return stale
+
+    # --- Persistance ------------------------------------------------------
+
+    def pop_dirty(self):
+        """Lignes `(guild_id, type, clé, palier, head, données)` des séries modifiées depuis le dernier appel."""
+        rows = []
+        for guild_id, kind, key in self.dirty:
+            series = self._find(guild_id, kind, key)
+            if series is None:
+                continue
+            for index, tier in enumerate(series.tiers):
+                rows.append((guild_id, kind, key, index, tier.head, tier.data.tobytes()))
+        self.dirty = set()
+        return rows
+
+    def load(self, rows):
+        for guild_id, kind, key, index, head, data in rows:
+            if kind not in TIERS or index >= len(TIERS[kind]):
+                continue
+            width, size = TIERS[kind][index]
+            values = array("I")
+            values.frombytes(data)
+            if len(values) != size:
+                continue  # Taille de palier modifiée depuis l'enregistrement : la série repart de zéro
+            self._get(guild_id, kind, key).tiers[index] = RingSeries(width, size, head, values)
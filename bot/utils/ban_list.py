@@ -0,0 +1,84 @@
+import asyncio
+import bisect
+
+# Nombre maximal de bannis renvoyés par une requête à l'API
+FETCH_SIZE = 1000
+
+
+class BannedUser:
+    __slots__ = ("id", "name", "reason", "key")
+
+    def __init__(self, id, name, reason=None, aliases=()):
+        self.id = id
+        self.name = name
+        self.reason = reason
+        self.key = " ".join([name, *filter(None, aliases)]).casefold()  # Texte de recherche
+
+
+class BanList:
+    """
+    Liste des bannis d'un serveur, chargée par pages à la demande.
+
+    L'API renvoie les bannis triés par identifiant : chaque requête reprend après
+    le dernier identifiant reçu (`after`). Seules les pages nécessaires à
+    l'affichage sont récupérées et gardées en mémoire. `remove` maintient la partie
+    déjà chargée à jour ; un banni au-delà du curseur sera de toute façon renvoyé
+    par une requête ultérieure.
+    """
+
+    def __init__(self, fetch, batch_size=FETCH_SIZE):
+        self.fetch = fetch  # coroutine(after_id, limit) -> [BannedUser] triés par identifiant
+        self.batch_size = batch_size
+        self.entries = []
+        self._ids = []
+        self.cursor = None  # Dernier identifiant récupéré
+        self.complete = False
+        self._lock = asyncio.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def covers(self, user_id):
+        """Indique si `user_id` tombe dans la partie déjà chargée de la liste."""
+        return self.complete or (self.cursor is not None and user_id <= self.cursor)
+
+    def remove(self, user_id):
+        index = bisect.bisect_left(self._ids, user_id)
+        if index < len(self._ids) and self._ids[index] == user_id:
+            del self._ids[index]
+            del self.entries[index]
+
+    async def _fetch_more(self):
+        async with self._lock:
+            if self.complete:
+                return
+            batch = await self.fetch(self.cursor, self.batch_size)
+            # Tous les identifiants reçus dépassent le curseur : ils s'ajoutent en fin de liste
+            self.entries.extend(batch)
+            self._ids.extend(user.id for user in batch)
+            if batch:
+                self.cursor = batch[-1].id
+            self.complete = len(batch) < self.batch_size
+
+    def _matching(self, query):
+        if not query:
+            return self.entries
+        query = query.casefold()
+        return [user for user in self.entries if query in user.key]
+
+    async def page(self, index, size, query=None):
+        """
+        Retourne `(bannis, suivante)` pour la page `index` (à partir de 0) ;
+        `suivante` indique s'il existe au moins une page après celle-ci.
+        """
+        needed = (index + 1) * size + 1
+        matches = self._matching(query)
+        while len(matches) < needed and not self.complete:
+            await self._fetch_more()
+            matches = self._matching(query)
+        start = index * size
+        return matches[start:start + size], len(matches) > start + size
+
+    def known_total(self, query=None):
+        """Nombre total de bannis (correspondants), ou None tant que la liste n'est pas complète."""
+        return len(self._matching(query)) if self.complete else None
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+from utils.logger import logger
+
+
+class BulkJob:
+    """
+    Applique une action à de nombreuses cibles avec une concurrence bornée.
+
+    Au plus `concurrency` appels sont en vol à la fois : la file de discord.py
+    répartit ces requêtes sur ses compartiments de limite de débit par route sans
+    qu'une rafale ne déclenche la limite globale. Une réponse 429 qui remonte malgré
+    tout est réessayée après le délai indiqué. `on_progress(job)` est appelé au plus
+    toutes les `progress_interval` secondes, puis une dernière fois à la fin.
+    """
+
+    def __init__(self, action, targets, concurrency=5, retries=3, on_progress=None, progress_interval=2.0):
+        self.action = action  # coroutine(cible)
+        self.targets = list(targets)
+        self.concurrency = concurrency
+        self.retries = retries
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.succeeded = []
+        self.failed = []  # (cible, erreur)
+        self._last_report = 0.0
+
+    @property
+    def total(self):
+        return len(self.targets)
+
+    @property
+    def done(self):
+        return len(self.succeeded) + len(self.failed)
+
+    async def _attempt(self, target):
+        for attempt in range(self.retries + 1):
+            try:
+                return await self.action(target)
+            except Exception as e:
+                if getattr(e, "status", None) != 429 or attempt == self.retries:
+                    raise
+                retry_after = getattr(e, "retry_after", None) or 2 ** attempt
+                await asyncio.sleep(retry_after)
+
+    async def _worker(self, queue):
+        while True:
+            try:
+                target = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await self._attempt(target)
+                self.succeeded.append(target)
+            except Exception as e:
+                self.failed.append((target, e))
+            await self._report()
+
+    async def _report(self, final=False):
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if not final and now - self._last_report < self.progress_interval:
+            return
+        self._last_report = now
+        try:
+            await self.on_progress(self)
+        except Exception as e:
+            logger.warning(f"⚠️ Impossible de mettre à jour la progression : {e}")
+
+    async def run(self):
+        queue = asyncio.Queue()
+        for target in self.targets:
+            queue.put_nowait(target)
+        workers = min(self.concurrency, len(self.targets))
+        await asyncio.gather(*(self._worker(queue) for _ in range(workers)))
+        await self._report(final=True)
+        return self
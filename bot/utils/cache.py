@@ -0,0 +1,103 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+from utils.logger import logger
+
+
+class _Entry:
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value, fresh_until, stale_until):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    """
+    Cache asynchrone des réponses d'API externes.
+
+    - Chaque appel précise sa durée de fraîcheur (`ttl`) et sa période de grâce (`stale_ttl`) :
+      pendant la grâce, l'ancienne valeur est servie immédiatement et rafraîchie en tâche de fond.
+    - Les requêtes simultanées pour une même clé partagent un seul appel en cours.
+    - La mémoire est bornée par une éviction LRU sur le nombre d'entrées.
+    - `fetch` retourne None en cas d'échec : rien n'est alors mis en cache.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get_or_fetch(self, key, fetch, ttl, stale_ttl=0.0):
+        """Retourne la valeur en cache pour `key`, ou l'obtient via la coroutine `fetch()`."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self.hits += 1
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self.refreshes += 1
+                    self._start_fetch(key, fetch, ttl, stale_ttl)
+                return entry.value
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, fetch, ttl, stale_ttl)
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+    def _start_fetch(self, key, fetch, ttl, stale_ttl):
+        task = asyncio.create_task(self._load(key, fetch, ttl, stale_ttl))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _load(self, key, fetch, ttl, stale_ttl):
+        try:
+            value = await fetch()
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du chargement de '{key}' : {e}")
+            return None
+        if value is None:
+            return None
+
+        now = time.monotonic()
+        self._entries[key] = _Entry(value, now + ttl, now + ttl + stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def stats(self):
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,159 @@
+import asyncio
+import importlib.util
+import io
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.logger import logger
+
+# matplotlib est facultatif : sans lui, les commandes s'affichent simplement sans graphique
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+BACKGROUND = "#2b2d31"
+FOREGROUND = "#dbdee1"
+ACCENT = "#9b59b6"
+
+
+# --- Rendu (exécuté dans le processus de rendu) ----------------------------
+
+def _figure(title):
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(8, 3.6), dpi=100, facecolor=BACKGROUND)
+    axes = figure.add_subplot()
+    axes.set_facecolor(BACKGROUND)
+    axes.set_title(title, color=FOREGROUND)
+    axes.tick_params(colors=FOREGROUND, labelsize=8)
+    for spine in axes.spines.values():
+        spine.set_color(FOREGROUND)
+    return figure, axes
+
+
+def _png(figure):
+    buffer = io.BytesIO()
+    figure.tight_layout()
+    figure.savefig(buffer, format="png", facecolor=figure.get_facecolor())
+    return buffer.getvalue()
+
+
+def render_timeline(title, points):
+    """Courbe `[(horodatage, valeur)]` en PNG."""
+    from datetime import datetime, timezone
+
+    figure, axes = _figure(title)
+    times = [datetime.fromtimestamp(timestamp, timezone.utc) for timestamp, _ in points]
+    values = [value for _, value in points]
+    axes.plot(times, values, color=ACCENT, linewidth=1.5)
+    axes.fill_between(times, values, color=ACCENT, alpha=0.25)
+    axes.set_ylim(bottom=0)
+    figure.autofmt_xdate()
+    return _png(figure)
+
+
+def render_bars(title, labels, values, horizontal=False):
+    """Histogramme en PNG."""
+    figure, axes = _figure(title)
+    if horizontal:
+        axes.barh(labels[::-1], values[::-1], color=ACCENT)
+    else:
+        axes.bar(labels, values, color=ACCENT)
+    return _png(figure)
+
+
+def _warm_up():
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure  # noqa: F401 (import à l'avance)
+
+
+# --- Service ---------------------------------------------------------------
+
+class ChartRenderer:
+    """
+    Rendu des graphiques dans un processus séparé, avec cache.
+
+    Le rendu matplotlib est coûteux en CPU et garde le GIL : fait dans la boucle (ou un
+    thread), il retarderait le heartbeat de la passerelle. Les images sont gardées par
+    clé `(serveur, requête)` avec la version des données qui les a produites : une
+    demande identique réutilise les octets en cache si la version n'a pas changé, ou
+    si l'image a moins de `refresh` secondes. Les rendus simultanés d'une même clé
+    sont fusionnés.
+    """
+
+    def __init__(self, max_entries=128, refresh=60):
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self._cache = OrderedDict()  # clé -> (version, date de rendu, octets)
+        self._pending = {}           # clé -> tâche de rendu en cours
+        self._executor = None
+
+    @property
+    def available(self):
+        return self._executor is not None
+
+    async def start(self):
+        """Démarre le processus de rendu (à appeler avant tout autre thread : il est créé par fork si possible)."""
+        if not HAS_MATPLOTLIB or self._executor is not None:
+            if not HAS_MATPLOTLIB:
+                logger.warning("⚠️ matplotlib n'est pas installé : les graphiques sont désactivés.")
+            return
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            context = multiprocessing.get_context("spawn")  # Windows : pas de fork
+        self._executor = ProcessPoolExecutor(max_workers=1, mp_context=context)
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._executor, _warm_up)
+        except Exception as e:
+            logger.error(f"❌ Impossible de démarrer le processus de rendu, graphiques désactivés : {e}")
+            self.close()
+            return
+        logger.info("☑️ Processus de rendu des graphiques démarré.")
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _cached(self, key, version):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        cached_version, rendered_at, data = entry
+        if cached_version != version and time.monotonic() - rendered_at >= self.refresh:
+            return None
+        self._cache.move_to_end(key)
+        return data
+
+    async def render(self, key, version, build):
+        """
+        Retourne le PNG de `key` (ou None si les graphiques sont désactivés). `build()` n'est
+        appelé qu'en cas d'absence du cache et retourne `(fonction de rendu, arguments)`.
+        """
+        if self._executor is None:
+            return None
+        data = self._cached(key, version)
+        if data is not None:
+            return data
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.create_task(self._render(key, version, build))
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du rendu du graphique {key} : {e}")
+            return None
+
+    async def _render(self, key, version, build):
+        func, args = build()
+        data = await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        self._cache[key] = (version, time.monotonic(), data)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return data
@@ -0,0 +1,122 @@
+import asyncio
+
+from utils.logger import logger
+
+
+class GuildConfig:
+    """
+    Configuration par serveur, gardée en mémoire.
+
+    Chaque cog déclare une section avec ses valeurs par défaut. La configuration d'un
+    serveur est chargée depuis le stockage au premier événement qui la demande (les
+    chargements simultanés sont fusionnés), puis servie depuis la mémoire jusqu'à ce
+    que le bot quitte le serveur. Les modifications passent par `set`/`reset`, qui
+    écrivent une ligne en base et notifient les abonnés de la section : les cogs ne
+    relisent jamais le stockage sur le chemin critique.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._defaults = {}     # section -> valeurs par défaut
+        self._legacy = {}       # section -> ancienne configuration globale (repli)
+        self._guilds = {}       # guild_id -> {section: {clé: valeur}}
+        self._loading = {}      # guild_id -> tâche de chargement en cours
+        self._subscribers = {}  # section -> callbacks(guild_id, config)
+
+    def __len__(self):
+        return len(self._guilds)
+
+    def register(self, section, defaults):
+        """Déclare une section et ses valeurs par défaut."""
+        self._defaults[section] = dict(defaults)
+
+    def subscribe(self, section, callback):
+        """
+        `callback(guild_id, config)` est appelé au chargement et à chaque modification de la
+        section, et tout de suite pour les serveurs déjà chargés (un cog rechargé retrouve
+        ainsi leur configuration).
+        """
+        self._subscribers.setdefault(section, []).append(callback)
+        for guild_id, sections in list(self._guilds.items()):
+            config = sections.get(section)
+            if config is not None:
+                self._call(callback, guild_id, section, config)
+
+    def unsubscribe(self, section, callback):
+        callbacks = self._subscribers.get(section, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def peek(self, guild_id, section):
+        """Configuration déjà chargée, ou None (ne déclenche aucun accès au stockage)."""
+        sections = self._guilds.get(guild_id)
+        return sections.get(section) if sections is not None else None
+
+    async def get(self, guild_id, section):
+        """Configuration d'une section pour un serveur (à ne pas modifier directement)."""
+        sections = self._guilds.get(guild_id)
+        if sections is None:
+            sections = await self._load(guild_id)
+        config = sections.get(section)
+        if config is None:
+            config = sections[section] = self._base(section)
+        return config
+
+    async def set(self, guild_id, section, key, value):
+        """Modifie une valeur pour un serveur, l'enregistre et notifie les abonnés."""
+        config = await self.get(guild_id, section)
+        config[key] = value
+        await self.storage.set_guild_value(guild_id, section, key, value)
+        self._notify(guild_id, section, config)
+
+    async def reset(self, guild_id, section, key):
+        """Rétablit la valeur par défaut d'une clé pour un serveur."""
+        config = await self.get(guild_id, section)
+        config[key] = self._base(section).get(key)
+        await self.storage.delete_guild_value(guild_id, section, key)
+        self._notify(guild_id, section, config)
+
+    def evict(self, guild_id):
+        """Oublie la configuration d'un serveur (elle reste en base)."""
+        self._guilds.pop(guild_id, None)
+
+    async def on_guild_remove(self, guild):
+        self.evict(guild.id)
+
+    def _base(self, section):
+        config = dict(self._defaults.get(section, {}))
+        config.update(self._legacy.get(section, {}))
+        return config
+
+    async def _load(self, guild_id):
+        task = self._loading.get(guild_id)
+        if task is None:
+            task = self._loading[guild_id] = asyncio.create_task(self._fetch(guild_id))
+            task.add_done_callback(lambda _: self._loading.pop(guild_id, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, guild_id):
+        # L'ancienne configuration globale sert de repli tant qu'un serveur n'a pas la sienne
+        for section in self._defaults:
+            if section not in self._legacy:
+                self._legacy[section] = await self.storage.get_namespace(section)
+        rows = await self.storage.guild_values(guild_id)
+        sections = {section: self._base(section) for section in self._defaults}
+        for section, key, value in rows:
+            sections.setdefault(section, self._base(section))[key] = value
+        self._guilds[guild_id] = sections
+        logger.debug(f"Configuration du serveur {guild_id} chargée ({len(rows)} valeur(s)).")
+        for section, config in sections.items():
+            self._notify(guild_id, section, config)
+        return sections
+
+    def _notify(self, guild_id, section, config):
+        for callback in self._subscribers.get(section, ()):
+            self._call(callback, guild_id, section, config)
+
+    @staticmethod
+    def _call(callback, guild_id, section, config):
+        try:
+            callback(guild_id, config)
+        except Exception as e:
+            logger.error(f"❌ Erreur dans un abonné de la configuration '{section}' : {e}")
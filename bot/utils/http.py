@@ -0,0 +1,86 @@
+import time
+from contextlib import asynccontextmanager
+
+import aiohttp
+from yarl import URL
+from utils.logger import logger
+
+
+class HostStats:
+    __slots__ = ("requests", "errors", "total_latency", "max_latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def average_latency(self):
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+class HTTPClient:
+    """
+    Client HTTP partagé par tous les cogs.
+
+    Une seule `aiohttp.ClientSession` est ouverte au démarrage du bot : les connexions
+    (DNS, TCP, TLS) sont réutilisées d'un appel à l'autre, bornées par hôte, et chaque
+    requête alimente des compteurs et des statistiques de latence par hôte.
+    """
+
+    def __init__(self, limit=100, limit_per_host=10, timeout=15, keepalive_timeout=30, dns_ttl=300):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.session = None
+        self.stats = {}  # hôte -> HostStats
+
+    async def start(self):
+        if self.session is not None and not self.session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        logger.info("☑️ Client HTTP partagé démarré.")
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+            logger.info("☑️ Client HTTP partagé fermé.")
+
+    @asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        """Effectue une requête via la session partagée et mesure sa latence (jusqu'aux en-têtes)."""
+        host = URL(url).host
+        stats = self.stats.get(host)
+        if stats is None:
+            stats = self.stats[host] = HostStats()
+
+        failed = True
+        latency = None
+        start = time.perf_counter()
+        try:
+            async with self.session.request(method, url, **kwargs) as resp:
+                latency = time.perf_counter() - start
+                failed = resp.status >= 400
+                yield resp
+        finally:
+            if latency is None:
+                latency = time.perf_counter() - start
+            stats.requests += 1
+            stats.errors += failed
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
@@ -0,0 +1,126 @@
+import heapq
+
+
+class _Fenwick:
+    """Arbre de Fenwick : nombre de joueurs par score, sommes préfixes en O(log n)."""
+
+    __slots__ = ("size", "tree")
+
+    def __init__(self, size=64):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def _grow(self, position):
+        size = self.size
+        while size < position:
+            size *= 2
+        counts = [self.prefix(i) - self.prefix(i - 1) for i in range(1, self.size + 1)]
+        self.size = size
+        self.tree = [0] * (size + 1)
+        for i, count in enumerate(counts, start=1):
+            if count:
+                self.add(i, count)
+
+    def add(self, position, delta):
+        if position > self.size:
+            self._grow(position)
+        tree = self.tree
+        while position <= self.size:
+            tree[position] += delta
+            position += position & -position
+
+    def prefix(self, position):
+        position = min(position, self.size)
+        total = 0
+        tree = self.tree
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def find(self, k):
+        """Plus petite position dont la somme préfixe atteint `k`."""
+        position = 0
+        step = 1 << self.size.bit_length()
+        tree = self.tree
+        while step:
+            nxt = position + step
+            if nxt <= self.size and tree[nxt] < k:
+                position = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return position + 1
+
+
+class Leaderboard:
+    """
+    Classement en mémoire avec index ordonné.
+
+    Les scores (entiers positifs) sont indexés par un arbre de Fenwick : le rang d'un
+    joueur et le k-ième meilleur score s'obtiennent en O(log n), sans trier le classement.
+    Les joueurs modifiés sont marqués « sales » pour une écriture différée par lots.
+    """
+
+    def __init__(self, scores=None):
+        self.scores = {}
+        self._buckets = {}  # score -> ensemble des joueurs ayant ce score
+        self._index = _Fenwick()
+        self.dirty = set()
+        for user_id, score in (scores or {}).items():
+            self._place(user_id, score)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def _place(self, user_id, score):
+        self.scores[user_id] = score
+        self._buckets.setdefault(score, set()).add(user_id)
+        self._index.add(score + 1, 1)
+
+    def _unplace(self, user_id):
+        score = self.scores.pop(user_id)
+        bucket = self._buckets[score]
+        bucket.discard(user_id)
+        if not bucket:
+            del self._buckets[score]
+        self._index.add(score + 1, -1)
+
+    def get(self, user_id):
+        return self.scores.get(user_id, 0)
+
+    def add_points(self, user_id, points=1):
+        """Ajoute des points à un joueur et retourne son nouveau score."""
+        score = self.get(user_id) + points
+        if user_id in self.scores:
+            self._unplace(user_id)
+        self._place(user_id, max(score, 0))
+        self.dirty.add(user_id)
+        return self.scores[user_id]
+
+    def rank(self, user_id):
+        """Rang du joueur (1 = meilleur, ex æquo partagés), ou None s'il n'est pas classé."""
+        if user_id not in self.scores:
+            return None
+        better = len(self.scores) - self._index.prefix(self.scores[user_id] + 1)
+        return better + 1
+
+    def top(self, limit=10):
+        """Retourne les `limit` meilleurs joueurs sous forme de (user_id, score, rang)."""
+        result = []
+        total = len(self.scores)
+        k = 1
+        while len(result) < limit and k <= total:
+            # Le k-ième meilleur est le (total - k + 1)-ième dans l'ordre croissant
+            score = self._index.find(total - k + 1) - 1
+            bucket = self._buckets[score]
+            # Départage par identifiant sans trier tout le groupe d'ex æquo (souvent énorme à 0 ou 1 point)
+            for user_id in heapq.nsmallest(limit - len(result), bucket):
+                result.append((user_id, score, k))
+            k += len(bucket)
+        return result
+
+    def pop_dirty(self):
+        """Retourne les scores modifiés depuis la dernière écriture et les marque propres."""
+        changes = {user_id: self.scores.get(user_id, 0) for user_id in self.dirty}
+        self.dirty.clear()
+        return changes
@@ -0,0 +1,90 @@
+import asyncio
+from collections import deque
+
+from utils.logger import logger
+
+
+class _Queue:
+    __slots__ = ("items", "full", "task")
+
+    def __init__(self):
+        self.items = deque()
+        self.full = asyncio.Event()
+        self.task = None
+
+
+class LogBatcher:
+    """
+    File d'envoi regroupée par destination (par exemple un salon de logs).
+
+    Les éléments poussés pour une même clé sont envoyés ensemble par `send(clé, lot)` :
+    au plus `max_items` éléments dont le poids cumulé (`weigh`) ne dépasse pas
+    `max_weight`. Un lot part dès qu'il est plein, sinon `delay` secondes après le
+    premier élément en attente. Une seule tâche d'envoi par clé : les lots d'une
+    même destination restent dans l'ordre.
+    """
+
+    def __init__(self, send, max_items=10, max_weight=None, weigh=len, delay=3.0):
+        self.send = send  # coroutine(clé, [éléments])
+        self.max_items = max_items
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.delay = delay
+        self._queues = {}  # clé -> _Queue
+        self._closing = False
+
+    def __len__(self):
+        return sum(len(queue.items) for queue in self._queues.values())
+
+    def push(self, key, item):
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _Queue()
+        queue.items.append(item)
+        if len(queue.items) >= self.max_items:
+            queue.full.set()
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.create_task(self._drain(key, queue))
+
+    def _take(self, queue):
+        batch, weight, cut = [], 0, False
+        while queue.items and len(batch) < self.max_items:
+            item_weight = self.weigh(queue.items[0]) if self.max_weight is not None else 0
+            if batch and self.max_weight is not None and weight + item_weight > self.max_weight:
+                cut = True  # Lot plein en poids : la suite part sans attendre
+                break
+            batch.append(queue.items.popleft())
+            weight += item_weight
+        if cut or len(queue.items) >= self.max_items:
+            queue.full.set()
+        else:
+            queue.full.clear()
+        return batch
+
+    async def _send(self, key, batch):
+        try:
+            await self.send(key, batch)
+        except Exception as e:
+            logger.error(f"❌ Erreur lors de l'envoi d'un lot de {len(batch)} élément(s) vers '{key}' : {e}")
+
+    async def _drain(self, key, queue):
+        while queue.items:
+            if not queue.full.is_set() and not self._closing:
+                try:
+                    await asyncio.wait_for(queue.full.wait(), self.delay)
+                except asyncio.TimeoutError:
+                    pass
+            await self._send(key, self._take(queue))
+        # Rien ne peut être poussé entre la fin de la boucle et ce retrait (pas d'attente)
+        if self._queues.get(key) is queue:
+            del self._queues[key]
+
+    async def close(self):
+        """Envoie immédiatement tout ce qui reste en attente."""
+        self._closing = True
+        tasks = []
+        for queue in self._queues.values():
+            queue.full.set()
+            if queue.task is not None:
+                tasks.append(queue.task)
+        await asyncio.gather(*tasks)
@@ -0,0 +1,127 @@
+from collections import deque
+
+
+class _Node:
+    __slots__ = ("children", "fail", "output", "word")
+
+    def __init__(self):
+        self.children = {}
+        self.fail = None
+        self.output = None  # Nœud terminal le plus proche via les liens d'échec
+        self.word = None    # Mot se terminant exactement sur ce nœud
+
+
+class BannedWordMatcher:
+    """
+    Automate Aho-Corasick pour rechercher plusieurs mots interdits en une seule passe.
+
+    Le coût d'une recherche dépend de la longueur du message et non du nombre de mots.
+    Les ajouts et retraits modifient le trie directement ; seuls les liens d'échec
+    sont recalculés, une fois, à la recherche suivante.
+    """
+
+    def __init__(self, words=()):
+        self.root = _Node()
+        self.words = set()
+        self._dirty = False
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def add(self, word):
+        """Ajoute un mot à l'automate. Retourne False si le mot était déjà présent."""
+        if not word or word in self.words:
+            return False
+        node = self.root
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+        node.word = word
+        self.words.add(word)
+        self._dirty = True
+        return True
+
+    def remove(self, word):
+        """Retire un mot de l'automate et élague les branches devenues inutiles."""
+        if word not in self.words:
+            return False
+        path = [self.root]
+        for char in word:
+            path.append(path[-1].children[char])
+        path[-1].word = None
+        # Élague les nœuds sans enfant ni mot en remontant depuis la fin
+        for depth in range(len(word), 0, -1):
+            node = path[depth]
+            if node.children or node.word is not None:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+        self.words.discard(word)
+        self._dirty = True
+        return True
+
+    def _build(self):
+        """Recalcule les liens d'échec et de sortie par un parcours en largeur."""
+        root = self.root
+        root.fail = root
+        root.output = None
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            child.output = None
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in node.children.items():
+                fail = node.fail
+                while fail is not root and char not in fail.children:
+                    fail = fail.fail
+                target = fail.children.get(char)
+                child.fail = target if target is not None and target is not child else root
+                child.output = child.fail if child.fail.word is not None else child.fail.output
+                queue.append(child)
+        self._dirty = False
+
+    def _step(self, node, char):
+        root = self.root
+        while node is not root and char not in node.children:
+            node = node.fail
+        return node.children.get(char, root)
+
+    def search(self, text):
+        """Retourne le premier mot interdit trouvé dans `text`, ou None."""
+        if not self.words:
+            return None
+        if self._dirty:
+            self._build()
+        node = self.root
+        for char in text:
+            node = self._step(node, char)
+            if node.word is not None:
+                return node.word
+            if node.output is not None:
+                return node.output.word
+        return None
+
+    def find_all(self, text):
+        """Retourne l'ensemble des mots interdits présents dans `text`."""
+        found = set()
+        if not self.words:
+            return found
+        if self._dirty:
+            self._build()
+        node = self.root
+        for char in text:
+            node = self._step(node, char)
+            match = node if node.word is not None else node.output
+            while match is not None:
+                found.add(match.word)
+                match = match.output
+        return found
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+
+# Coût fixe estimé d'une entrée (objet, identifiants, place dans le dictionnaire)
+ENTRY_OVERHEAD = 160
+DEFAULT_BUDGET = 256 * 1024
+
+
+class StoredMessage:
+    __slots__ = ("id", "author_id", "channel_id", "content", "size")
+
+    def __init__(self, id, author_id, channel_id, content):
+        self.id = id
+        self.author_id = author_id
+        self.channel_id = channel_id
+        self.content = content
+        self.size = ENTRY_OVERHEAD + len(content.encode("utf-8"))
+
+
+class _GuildBuffer:
+    __slots__ = ("entries", "size", "budget")
+
+    def __init__(self, budget):
+        self.entries = OrderedDict()  # message_id -> StoredMessage, du plus ancien au plus récent
+        self.size = 0
+        self.budget = budget
+
+    def trim(self):
+        while self.size > self.budget and self.entries:
+            _, oldest = self.entries.popitem(last=False)
+            self.size -= oldest.size
+
+
+class MessageStore:
+    """
+    Contenu des derniers messages de chaque serveur, dans un tampon circulaire borné en octets.
+
+    Le cache de discord.py ne conserve que les messages récents de tous les serveurs
+    confondus : au-delà, une suppression ou une modification arrive sans l'ancien contenu.
+    Ce tampon ne garde que le strict nécessaire aux logs et évince les messages les plus
+    anciens d'un serveur dès que son budget est dépassé.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.default_budget = budget
+        self._guilds = {}  # guild_id -> _GuildBuffer
+
+    def __len__(self):
+        return sum(len(buffer.entries) for buffer in self._guilds.values())
+
+    @property
+    def size(self):
+        return sum(buffer.size for buffer in self._guilds.values())
+
+    def set_budget(self, guild_id, budget):
+        """Modifie le budget d'un serveur (None : budget par défaut)."""
+        buffer = self._guilds.get(guild_id)
+        if buffer is None:
+            if budget is None:
+                return
+            buffer = self._guilds[guild_id] = _GuildBuffer(budget)
+        buffer.budget = self.default_budget if budget is None else budget
+        buffer.trim()
+
+    def add(self, guild_id, message_id, author_id, channel_id, content):
+        buffer = self._guilds.get(guild_id)
+        if buffer is None:
+            buffer = self._guilds[guild_id] = _GuildBuffer(self.default_budget)
+        entry = StoredMessage(message_id, author_id, channel_id, content)
+        previous = buffer.entries.pop(message_id, None)
+        if previous is not None:
+            buffer.size -= previous.size
+        buffer.entries[message_id] = entry
+        buffer.size += entry.size
+        buffer.trim()
+
+    def get(self, guild_id, message_id):
+        buffer = self._guilds.get(guild_id)
+        return buffer.entries.get(message_id) if buffer is not None else None
+
+    def update(self, guild_id, message_id, content):
+        """Remplace le contenu d'un message conservé et retourne l'ancienne entrée (ou None)."""
+        buffer = self._guilds.get(guild_id)
+        previous = buffer.entries.get(message_id) if buffer is not None else None
+        if previous is None:
+            return None
+        entry = StoredMessage(message_id, previous.author_id, previous.channel_id, content)
+        buffer.entries[message_id] = entry  # Garde sa place : l'ordre d'éviction suit l'envoi
+        buffer.size += entry.size - previous.size
+        buffer.trim()
+        return previous
+
+    def pop(self, guild_id, message_id):
+        buffer = self._guilds.get(guild_id)
+        entry = buffer.entries.pop(message_id, None) if buffer is not None else None
+        if entry is not None:
+            buffer.size -= entry.size
+        return entry
+
+    def drop_guild(self, guild_id):
+        self._guilds.pop(guild_id, None)
@@ -0,0 +1,113 @@
+import re
+import string
+import unicodedata
+
+# Plages Unicode repliées à l'avance via NFKD : latin accentué, lettres encerclées,
+# exposants/indices, caractères pleine chasse et alphanumériques mathématiques.
+_NFKD_RANGES = (
+    (0x00A0, 0x024F),
+    (0x1E00, 0x1EFF),
+    (0x2070, 0x209F),
+    (0x2100, 0x214F),
+    (0x2460, 0x24FF),
+    (0xFF00, 0xFFEF),
+    (0x1D400, 0x1D7FF),
+)
+
+# Homoglyphes cyrilliques/grecs courants utilisés pour contourner les filtres
+_CONFUSABLES = {
+    "а": "a", "в": "b", "е": "e", "ё": "e", "к": "k", "м": "m", "н": "h", "о": "o",
+    "р": "p", "с": "c", "т": "t", "у": "y", "х": "x", "і": "i", "ї": "i", "ј": "j",
+    "ѕ": "s", "ԁ": "d", "ɡ": "g", "α": "a", "β": "b", "ε": "e", "η": "n", "ι": "i",
+    "κ": "k", "ν": "v", "ο": "o", "ρ": "p", "τ": "t", "υ": "u", "χ": "x", "ω": "w",
+    "ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d", "ł": "l", "ı": "i",
+}
+
+# Substitutions leetspeak
+_LEET = {
+    "0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t", "8": "b",
+    "@": "a", "$": "s", "€": "e", "£": "l",
+}
+
+# Caractères invisibles supprimés dans toutes les formes
+_INVISIBLE = "­͏᠎​‌‍‎‏⁠⁡⁢⁣⁤﻿"
+
+# Séparateurs de la forme compacte : supprimés entre lettres isolées (`s.p.a.m` -> `spam`),
+# réduits à une espace entre les mots (`les pâmes` ne devient pas `lespames`)
+_SEPARATORS = "".join(sorted(set(string.punctuation + string.whitespace) - set(_LEET)))
+
+_TOKENS = re.compile(f"[^{re.escape(_SEPARATORS)}]+")
+# Trois répétitions ou plus sont ramenées à deux (`spaaam` -> `spaam`) : les doubles lettres
+# ordinaires sont conservées, sinon « pass » deviendrait « pas » et « cool » « col »
+_REPEATS = re.compile(r"(.)\1{2,}", re.DOTALL)
+
+
+def _build_fold_table():
+    """Construit la table de repli : NFKD sans diacritiques, homoglyphes puis leetspeak."""
+    table = {}
+    for start, end in _NFKD_RANGES:
+        for code in range(start, end + 1):
+            char = chr(code)
+            decomposed = unicodedata.normalize("NFKD", char)
+            folded = "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+            if folded != char:
+                table[code] = folded
+    for source, target in _CONFUSABLES.items():
+        table[ord(source)] = target
+    for source, target in _LEET.items():
+        table[ord(source)] = target
+    for char in _INVISIBLE:
+        table[ord(char)] = None
+    # Les remplacements eux-mêmes doivent être déjà repliés (ex. ｓ -> s, ① -> 1 -> i)
+    for code, target in list(table.items()):
+        if target:
+            table[code] = "".join(_LEET.get(c, c) for c in target)
+    return table
+
+
+FOLD_TABLE = _build_fold_table()
+
+
+class NormalizedText:
+    """Formes normalisées d'un message, calculées une seule fois et partagées par les règles."""
+
+    __slots__ = ("raw", "folded", "compact")
+
+    def __init__(self, raw, folded, compact):
+        self.raw = raw
+        self.folded = folded      # Minuscules, accents/homoglyphes/leet repliés, espaces conservés
+        self.compact = compact    # `folded` en mots séparés d'une espace, lettres isolées regroupées, répétitions limitées à deux
+
+    def __repr__(self):
+        return f"NormalizedText(folded={self.folded!r}, compact={self.compact!r})"
+
+
+def normalize_text(text):
+    """Normalise un texte en temps linéaire à l'aide des tables précalculées."""
+    folded = text.lower().translate(FOLD_TABLE)
+    return NormalizedText(text, folded, _compact(folded))
+
+
+def _compact(folded):
+    """
+    Mots de `folded` séparés d'une seule espace. Une suite d'au moins deux caractères isolés
+    (`s p a m`, `s.p.a.m`) est recollée en un mot ; les séparateurs entre vrais mots sont
+    conservés, pour qu'un mot interdit ne soit pas trouvé à cheval sur deux mots.
+    """
+    words, letters = [], []
+    for token in _TOKENS.findall(folded):
+        if len(token) == 1:
+            letters.append(token)
+            continue
+        if letters:
+            words.append("".join(letters))
+            letters = []
+        words.append(token)
+    if letters:
+        words.append("".join(letters))
+    return _REPEATS.sub(r"\1\1", " ".join(words))
+
+
+def normalize_word(word):
+    """Forme compacte d'un mot interdit, comparable à `NormalizedText.compact`."""
+    return normalize_text(word).compact
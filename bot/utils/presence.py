@@ -0,0 +1,88 @@
+import discord
+
+from utils.logger import logger
+
+
+class PresenceCounters:
+    """
+    Nombre de membres et de membres en ligne par serveur, tenus à jour par les événements.
+
+    Chaque serveur est compté une seule fois (au démarrage, à l'arrivée du bot ou quand il
+    redevient disponible), puis les changements de présence, arrivées et départs ajustent
+    les compteurs : les commandes de statistiques lisent leurs chiffres en O(1) au lieu de
+    parcourir tous les membres. Les événements d'un serveur pas encore compté sont ignorés.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._online = {}   # guild_id -> membres dont le statut n'est pas « hors ligne »
+        self._members = {}  # guild_id -> nombre de membres
+        self.total_members = 0
+
+    def __len__(self):
+        return len(self._members)
+
+    def online(self, guild_id):
+        return self._online.get(guild_id)
+
+    def members(self, guild_id):
+        return self._members.get(guild_id)
+
+    def seed(self, guild: discord.Guild):
+        """Compte un serveur en un seul passage sur ses membres."""
+        self.drop(guild.id)
+        online = sum(1 for member in guild.members if member.status != discord.Status.offline)
+        members = guild.member_count or len(guild.members)
+        self._online[guild.id] = online
+        self._members[guild.id] = members
+        self.total_members += members
+
+    def drop(self, guild_id):
+        self._online.pop(guild_id, None)
+        self.total_members -= self._members.pop(guild_id, 0)
+
+    async def on_ready(self):
+        for guild in self.bot.guilds:
+            self.seed(guild)
+        logger.info(f"☑️ Compteurs de présence initialisés pour {len(self)} serveur(s).")
+
+    async def on_guild_join(self, guild: discord.Guild):
+        self.seed(guild)
+
+    async def on_guild_available(self, guild: discord.Guild):
+        # Serveur indisponible au démarrage (ou après une panne) : compté à son retour
+        self.seed(guild)
+
+    async def on_guild_unavailable(self, guild: discord.Guild):
+        # Plus aucun événement n'arrive pendant la panne : les compteurs ne seraient plus justes
+        self.drop(guild.id)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.drop(guild.id)
+
+    async def on_presence_update(self, before: discord.Member, after: discord.Member):
+        guild_id = after.guild.id
+        if guild_id not in self._online:
+            return
+        was_online = before.status != discord.Status.offline
+        is_online = after.status != discord.Status.offline
+        if was_online != is_online:
+            self._online[guild_id] += 1 if is_online else -1
+
+    async def on_member_join(self, member: discord.Member):
+        guild_id = member.guild.id
+        if guild_id not in self._members:
+            return
+        self._members[guild_id] += 1
+        self.total_members += 1
+        if member.status != discord.Status.offline:
+            self._online[guild_id] += 1
+
+    async def on_member_remove(self, member: discord.Member):
+        guild_id = member.guild.id
+        if guild_id not in self._members:
+            return
+        self._members[guild_id] -= 1
+        self.total_members -= 1
+        if member.status != discord.Status.offline:
+            self._online[guild_id] = max(self._online[guild_id] - 1, 0)
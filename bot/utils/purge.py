@@ -0,0 +1,118 @@
+import asyncio
+from collections import Counter
+
+import discord
+from utils.logger import logger
+
+BULK_DELETE_LIMIT = 100
+
+
+class _Burst:
+    __slots__ = ("channel", "message_ids", "authors", "reasons", "handle")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.message_ids = []
+        self.authors = set()
+        self.reasons = Counter()
+        self.handle = None
+
+
+class BurstPurger:
+    """
+    Regroupe les suppressions de messages signalés lors d'une rafale (raid, spam massif).
+
+    Le premier message signalé dans un salon calme est traité normalement par l'appelant.
+    Les suivants, tant que le salon reste « chaud », sont collectés puis supprimés par
+    `TextChannel.delete_messages` (100 messages par appel) avec un seul embed récapitulatif.
+    """
+
+    def __init__(self, window=3.0):
+        self.window = window
+        self._hot_until = {}  # channel_id -> instant de fin de rafale
+        self._bursts = {}     # channel_id -> _Burst
+        self._tasks = set()   # Suppressions en cours (référence gardée jusqu'à leur fin)
+        self.coalesced = 0    # Suppressions regroupées depuis le démarrage
+        self.requests = 0     # Appels de suppression groupée effectués
+
+    def flag(self, message: discord.Message, reason: str) -> bool:
+        """
+        Signale un message à supprimer.
+
+        Returns:
+            bool: True si le message est pris en charge par une rafale en cours,
+            False si l'appelant doit le supprimer lui-même.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        channel_id = message.channel.id
+        hot = self._hot_until.get(channel_id, 0.0) > now
+        self._hot_until[channel_id] = now + self.window
+        if not hot:
+            return False
+
+        burst = self._bursts.get(channel_id)
+        if burst is None:
+            burst = self._bursts[channel_id] = _Burst(message.channel)
+            burst.handle = loop.call_later(self.window, self._schedule_flush, channel_id)
+        burst.message_ids.append(message.id)
+        burst.authors.add(message.author.id)
+        burst.reasons[reason] += 1
+
+        if len(burst.message_ids) >= BULK_DELETE_LIMIT:
+            burst.handle.cancel()
+            self._schedule_flush(channel_id)
+        return True
+
+    def sweep(self, now):
+        """Oublie les salons dont la rafale est terminée."""
+        expired = [channel_id for channel_id, until in self._hot_until.items() if until <= now]
+        for channel_id in expired:
+            del self._hot_until[channel_id]
+
+    def _schedule_flush(self, channel_id):
+        burst = self._bursts.pop(channel_id, None)
+        if burst is not None:
+            task = asyncio.create_task(self.flush(burst))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """Annule les délais en attente et supprime immédiatement les rafales collectées."""
+        for channel_id, burst in list(self._bursts.items()):
+            burst.handle.cancel()
+            self._schedule_flush(channel_id)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def flush(self, burst: _Burst):
+        """Supprime les messages de la rafale par lots et envoie un récapitulatif."""
+        ids = burst.message_ids
+        calls = 0
+        deleted = 0
+        for start in range(0, len(ids), BULK_DELETE_LIMIT):
+            chunk = [discord.Object(id=message_id) for message_id in ids[start:start + BULK_DELETE_LIMIT]]
+            try:
+                await burst.channel.delete_messages(chunk, reason="Rafale de messages filtrés")
+                deleted += len(chunk)
+            except discord.HTTPException as e:
+                logger.error(f"❌ Suppression groupée impossible dans '{burst.channel}' : {e}")
+            calls += 1
+
+        self.coalesced += deleted
+        self.requests += calls
+        reasons = ", ".join(f"{reason} ({count})" for reason, count in burst.reasons.most_common())
+        embed = discord.Embed(
+            title="🧹 Rafale de messages supprimée",
+            description=(
+                f"**{deleted}** message(s) de **{len(burst.authors)}** utilisateur(s) "
+                f"supprimé(s) en **{calls}** requête(s).\n"
+                f"📝 **Motifs** : {reasons}"
+            ),
+            color=discord.Color.dark_purple(),
+        )
+        try:
+            await burst.channel.send(embed=embed, delete_after=10)
+        except discord.HTTPException as e:
+            logger.error(f"❌ Impossible d'envoyer le récapitulatif dans '{burst.channel}' : {e}")
+        logger.info(f"🧹 {deleted} suppression(s) regroupée(s) en {calls} requête(s) dans '{burst.channel}'.")
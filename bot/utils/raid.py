@@ -0,0 +1,225 @@
+from collections import deque
+from hashlib import blake2b
+
+DEFAULT_MIN_AUTHORS = 8
+DEFAULT_WINDOW = 30.0
+
+# Poids d'un auteur dans le décompte : un compte récent (ou arrivé depuis peu) compte
+# pleinement, un membre installé beaucoup moins (« bonne nuit à tous » ne doit pas suffire)
+NEW_ACCOUNT_AGE = 7 * 86400
+NEW_MEMBER_AGE = 86400
+ESTABLISHED_WEIGHT = 0.25
+
+SIMHASH_BITS = 64
+BANDS = 4                  # 4 bandes de 16 bits : deux empreintes à ≤ 3 bits d'écart partagent une bande
+BAND_BITS = SIMHASH_BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+SHINGLE = 4                # Taille des n-grammes de caractères
+MAX_TOKENS = 96            # Borne le coût par message, quelle que soit sa longueur
+MIN_LENGTH = 24            # Les messages courts ("gg", "joyeux anniversaire") ne sont pas suivis
+MAX_DISTANCE = 3           # Écart maximal (en bits) entre deux empreintes d'une même charge utile
+
+
+def _hash64(value):
+    return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+# Le vote de chaque bit est compté dans un champ de 8 bits d'un seul grand entier (au plus
+# MAX_TOKENS < 256 jetons) : `_SPREAD[j][octet]` place les 8 bits de l'octet `j` de l'empreinte
+# (gros-boutiste) dans leurs champs, et une empreinte s'ajoute en 8 consultations de table.
+FIELD_BITS = 8
+FIELD_MASK = (1 << FIELD_BITS) - 1
+_SPREAD = [
+    [
+        sum(1 << (((7 - j) * 8 + i) * FIELD_BITS) for i in range(8) if byte >> i & 1)
+        for byte in range(256)
+    ]
+    for j in range(8)
+]
+
+
+def simhash(tokens):
+    """Empreinte SimHash 64 bits d'une liste de jetons, en O(jetons)."""
+    t0, t1, t2, t3, t4, t5, t6, t7 = _SPREAD
+    votes = 0
+    count = 0
+    for token in set(tokens):
+        d = blake2b(token.encode(), digest_size=8).digest()
+        votes += t0[d[0]] + t1[d[1]] + t2[d[2]] + t3[d[3]] + t4[d[4]] + t5[d[5]] + t6[d[6]] + t7[d[7]]
+        count += 1
+    threshold = count // 2  # Un bit est retenu s'il est présent dans plus de la moitié des jetons
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        if (votes >> (bit * FIELD_BITS)) & FIELD_MASK > threshold:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def payload(normalized):
+    """Contenu comparé : la forme compacte sans espaces (ajouter des séparateurs ne change rien)."""
+    return normalized.compact.replace(" ", "")
+
+
+def fingerprint_keys(normalized):
+    """
+    Empreinte SimHash d'un message et ses clés de comparaison : empreinte exacte puis une
+    clé par bande. Une bande commune n'est qu'une candidate : elle est confirmée par la
+    distance entre empreintes (voir `similar`).
+    """
+    compact = payload(normalized)
+    keys = [("exact", _hash64(compact))]
+    tokens = [compact[i:i + SHINGLE] for i in range(min(len(compact) - SHINGLE + 1, MAX_TOKENS))]
+    fingerprint = simhash(tokens) if tokens else None
+    if fingerprint is not None:
+        keys.extend(("band", band, (fingerprint >> (band * BAND_BITS)) & BAND_MASK) for band in range(BANDS))
+    return fingerprint, keys
+
+
+def similar(key, fingerprint, reference):
+    """Vrai si une empreinte correspond à la charge utile suivie sous `key`."""
+    if key[0] == "exact":
+        return True
+    return fingerprint is not None and bin(fingerprint ^ reference).count("1") <= MAX_DISTANCE
+
+
+def author_weight(account_age, member_age):
+    """Poids d'un auteur selon l'âge (en secondes) de son compte et de son arrivée sur le serveur."""
+    if account_age < NEW_ACCOUNT_AGE or (member_age is not None and member_age < NEW_MEMBER_AGE):
+        return 1.0
+    return ESTABLISHED_WEIGHT
+
+
+class _Bucket:
+    __slots__ = ("start", "entries")
+
+    def __init__(self, start):
+        self.start = start
+        self.entries = []  # (clé, auteur) ajoutés pendant ce créneau
+
+
+class _GuildWindow:
+    __slots__ = ("buckets", "authors", "scores", "references", "messages", "triggered")
+
+    def __init__(self):
+        self.buckets = deque()
+        self.authors = {}     # clé -> {auteur: [occurrences dans la fenêtre, poids]}
+        self.scores = {}      # clé -> somme des poids des auteurs distincts
+        self.references = {}  # clé -> empreinte du premier message suivi sous cette clé
+        self.messages = {}    # clé -> derniers (channel_id, message_id) portant cette clé
+        self.triggered = {}   # clé -> (instant de fin du verrouillage, empreinte de référence)
+
+
+class RaidAlert:
+    __slots__ = ("key", "authors", "messages", "new")
+
+    def __init__(self, key, authors, messages, new):
+        self.key = key
+        self.authors = authors
+        self.messages = messages  # (channel_id, message_id) déjà publiés avec cette charge utile
+        self.new = new            # False si la charge utile était déjà signalée
+
+
+class RaidDetector:
+    """
+    Détecte un même contenu (ou quasi identique) publié par plusieurs auteurs.
+
+    Chaque serveur garde une fenêtre de `window` secondes découpée en créneaux ;
+    les créneaux expirés sont retirés et leurs entrées décomptées, ce qui borne
+    la mémoire et garde un coût amorti constant par message.
+    """
+
+    def __init__(self, bucket_count=6, max_entries_per_bucket=5_000, max_messages_per_key=100):
+        self.bucket_count = bucket_count
+        self.max_messages_per_key = max_messages_per_key
+        self.max_entries_per_bucket = max_entries_per_bucket
+        self._thresholds = {}  # guild_id -> (min_authors, window)
+        self._guilds = {}
+
+    def get_threshold(self, guild_id):
+        return self._thresholds.get(guild_id, (DEFAULT_MIN_AUTHORS, DEFAULT_WINDOW))
+
+    def set_threshold(self, guild_id, min_authors, window):
+        self._thresholds[guild_id] = (min_authors, float(window))
+
+    def clear_threshold(self, guild_id):
+        """Rétablit le seuil par défaut d'un serveur."""
+        self._thresholds.pop(guild_id, None)
+
+    def _expire(self, state, now, window):
+        while state.buckets and state.buckets[0].start <= now - window:
+            for key, author in state.buckets.popleft().entries:
+                authors = state.authors[key]
+                entry = authors[author]
+                entry[0] -= 1
+                if entry[0] <= 0:
+                    del authors[author]
+                    state.scores[key] -= entry[1]
+                if not authors:
+                    del state.authors[key]
+                    del state.scores[key]
+                    state.references.pop(key, None)
+                    state.messages.pop(key, None)
+        for key in [key for key, (until, _) in state.triggered.items() if until <= now]:
+            del state.triggered[key]
+
+    def active(self, guild_id, now):
+        """Vrai si un raid est encore en cours (verrouillage non expiré) sur le serveur."""
+        state = self._guilds.get(guild_id)
+        return state is not None and any(until > now for until, _ in state.triggered.values())
+
+    def observe(self, guild_id, author_id, normalized, now, message_ref=None, weight=1.0):
+        """
+        Enregistre un message et retourne une `RaidAlert` si sa charge utile a été publiée
+        par des auteurs distincts dont le poids cumulé (voir `author_weight`) atteint
+        `min_authors` dans la fenêtre.
+        """
+        if len(payload(normalized)) < MIN_LENGTH:
+            return None
+
+        min_authors, window = self.get_threshold(guild_id)
+        state = self._guilds.get(guild_id)
+        if state is None:
+            state = self._guilds[guild_id] = _GuildWindow()
+        self._expire(state, now, window)
+
+        width = window / self.bucket_count
+        if not state.buckets or now - state.buckets[-1].start >= width:
+            state.buckets.append(_Bucket(now))
+        bucket = state.buckets[-1]
+
+        fingerprint, keys = fingerprint_keys(normalized)
+        for key in keys:
+            triggered = state.triggered.get(key)
+            if triggered is not None and similar(key, fingerprint, triggered[1]):
+                state.triggered[key] = (now + window, triggered[1])
+                return RaidAlert(key, {author_id}, [], new=False)
+
+        alert = None
+        for key in keys:
+            reference = state.references.get(key)
+            if reference is not None and not similar(key, fingerprint, reference):
+                continue  # Bande partagée par hasard avec un autre contenu
+            if len(bucket.entries) >= self.max_entries_per_bucket:
+                continue
+            authors = state.authors.get(key)
+            if authors is None:
+                authors = state.authors[key] = {}
+                state.scores[key] = 0.0
+                state.references[key] = fingerprint
+                state.messages[key] = deque(maxlen=self.max_messages_per_key)
+            entry = authors.get(author_id)
+            if entry is None:
+                authors[author_id] = [1, weight]
+                state.scores[key] += weight
+            else:
+                entry[0] += 1
+            bucket.entries.append((key, author_id))
+            if message_ref is not None:
+                state.messages[key].append(message_ref)
+            if alert is None and state.scores[key] >= min_authors - 1e-9:
+                state.triggered[key] = (now + window, state.references[key])
+                alert = RaidAlert(key, set(authors), list(state.messages[key]), new=True)
+        return alert
+
+    def forget_guild(self, guild_id):
+        self._guilds.pop(guild_id, None)
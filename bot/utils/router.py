@@ -0,0 +1,141 @@
+import discord
+from utils.logger import logger
+from utils.normalize import normalize_text
+
+_UNSET = object()
+
+
+class MessageContext:
+    """
+    Analyse d'un message partagée par tous les cogs abonnés.
+
+    Chaque forme dérivée (minuscules, normalisation, entier, lettre unique) est
+    calculée à la première demande puis mise en cache pour les abonnés suivants.
+    """
+
+    __slots__ = ("message", "author_id", "channel_id", "guild_id", "_lowered", "_normalized", "_int_value")
+
+    def __init__(self, message: discord.Message):
+        self.message = message
+        self.author_id = message.author.id
+        self.channel_id = message.channel.id
+        self.guild_id = message.guild.id if message.guild else None
+        self._lowered = None
+        self._normalized = None
+        self._int_value = _UNSET
+
+    @property
+    def is_dm(self):
+        return self.guild_id is None
+
+    @property
+    def lowered(self):
+        if self._lowered is None:
+            self._lowered = self.message.content.strip().lower()
+        return self._lowered
+
+    @property
+    def normalized(self):
+        if self._normalized is None:
+            self._normalized = normalize_text(self.message.content)
+        return self._normalized
+
+    @property
+    def int_value(self):
+        """Valeur entière du message, ou None s'il ne s'agit pas d'un nombre."""
+        if self._int_value is _UNSET:
+            try:
+                self._int_value = int(self.message.content)
+            except ValueError:
+                self._int_value = None
+        return self._int_value
+
+    @property
+    def is_single_letter(self):
+        lowered = self.lowered
+        return len(lowered) == 1 and lowered.isalpha()
+
+
+class MessageRouter:
+    """
+    Point d'entrée unique des messages reçus par le bot.
+
+    Les cogs déclarent leur intérêt pour tous les messages, pour un salon ou pour
+    un auteur. Un message qui n'intéresse aucun abonné est ignoré sans analyse.
+    Les gestionnaires sont appelés dans l'ordre (globaux, attentes, salon, auteur) ;
+    un gestionnaire qui retourne True consomme le message et interrompt la diffusion.
+    """
+
+    def __init__(self, waiters=None):
+        self.waiters = waiters
+        self._global = []
+        self._channels = {}  # channel_id -> [gestionnaires]
+        self._authors = {}   # author_id -> [gestionnaires]
+
+    def subscribe(self, handler):
+        if handler not in self._global:
+            self._global.append(handler)
+
+    def unsubscribe(self, handler):
+        if handler in self._global:
+            self._global.remove(handler)
+
+    def watch_channel(self, channel_id, handler):
+        handlers = self._channels.setdefault(channel_id, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unwatch_channel(self, channel_id, handler):
+        self._unwatch(self._channels, channel_id, handler)
+
+    def watch_author(self, author_id, handler):
+        handlers = self._authors.setdefault(author_id, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unwatch_author(self, author_id, handler):
+        self._unwatch(self._authors, author_id, handler)
+
+    def unwatch_all(self, handler):
+        """Retire un gestionnaire de tous les abonnements (utile au déchargement d'un cog)."""
+        self.unsubscribe(handler)
+        for registry in (self._channels, self._authors):
+            for key in [key for key, handlers in registry.items() if handler in handlers]:
+                self._unwatch(registry, key, handler)
+
+    @staticmethod
+    def _unwatch(registry, key, handler):
+        handlers = registry.get(key)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del registry[key]
+
+    async def dispatch(self, message: discord.Message):
+        """Listener `on_message` : diffuse le message aux seuls abonnés concernés."""
+        if message.author.bot:
+            return
+
+        channel_handlers = self._channels.get(message.channel.id)
+        author_handlers = self._authors.get(message.author.id)
+        has_waiters = bool(self.waiters)
+        if not (self._global or channel_handlers or author_handlers or has_waiters):
+            return
+
+        context = MessageContext(message)
+        if await self._run(list(self._global), context):
+            return
+        if has_waiters and self.waiters.resolve(message):
+            return
+        if channel_handlers or author_handlers:
+            await self._run((channel_handlers or []) + (author_handlers or []), context)
+
+    @staticmethod
+    async def _run(handlers, context):
+        for handler in handlers:
+            try:
+                if await handler(context):
+                    return True
+            except Exception as e:
+                logger.error(f"❌ Erreur dans le gestionnaire de messages {handler.__qualname__} : {e}")
+        return False
@@ -0,0 +1,83 @@
+import asyncio
+import heapq
+import time
+
+from utils.logger import logger
+
+# Attente maximale entre deux réveils, pour suivre un éventuel changement de l'horloge système
+MAX_SLEEP = 3600
+
+
+class ExpiryScheduler:
+    """
+    Échéancier à tas-min traité par une seule tâche de fond.
+
+    Les échéances sont des horodatages absolus (`time.time()`) pour pouvoir être
+    rechargées depuis le stockage après un redémarrage ; celles déjà dépassées
+    expirent immédiatement. Planifier coûte O(log n) ; une annulation marque seulement
+    la clé, et l'entrée périmée est ignorée lorsqu'elle atteint le sommet du tas.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback  # coroutine(key) appelée à l'échéance
+        self._heap = []           # (échéance, numéro, clé)
+        self._deadlines = {}      # clé -> échéance en vigueur
+        self._counter = 0
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def __contains__(self, key):
+        return key in self._deadlines
+
+    def schedule(self, key, deadline):
+        """Planifie (ou replanifie) l'expiration de `key` à l'horodatage `deadline`."""
+        self._deadlines[key] = deadline
+        self._counter += 1
+        heapq.heappush(self._heap, (deadline, self._counter, key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()  # Nouvelle échéance la plus proche : la tâche doit se réveiller plus tôt
+
+    def cancel(self, key):
+        self._deadlines.pop(key, None)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _pop_due(self, now):
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, _, key = heapq.heappop(heap)
+            if self._deadlines.get(key) == deadline:
+                del self._deadlines[key]
+                due.append(key)
+        # Entrées annulées ou replanifiées au sommet : inutile de se réveiller pour elles
+        while heap and self._deadlines.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return due
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            for key in self._pop_due(time.time()):
+                try:
+                    await self.callback(key)
+                except Exception as e:
+                    logger.error(f"❌ Erreur lors de l'expiration de '{key}' : {e}")
+
+            timeout = min(self._heap[0][0] - time.time(), MAX_SLEEP) if self._heap else None
+            if timeout is not None and timeout <= 0:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
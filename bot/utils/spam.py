@@ -0,0 +1,85 @@
+from collections import OrderedDict, deque
+
+DEFAULT_MAX_MESSAGES = 5
+DEFAULT_WINDOW = 10.0
+
+
+class _UserWindow:
+    __slots__ = ("timestamps", "warned", "last_seen")
+
+    def __init__(self, size):
+        self.timestamps = deque(maxlen=size)
+        self.warned = False
+        self.last_seen = 0.0
+
+
+class SpamTracker:
+    """
+    Détecteur de spam à fenêtre glissante, en O(1) par message.
+
+    Chaque utilisateur dispose d'un tampon circulaire de `max_messages + 1` horodatages :
+    il y a spam dès que le plus ancien du tampon plein est encore dans la fenêtre.
+    Les utilisateurs inactifs sont évincés par ordre LRU (durée d'inactivité et capacité).
+    """
+
+    def __init__(self, idle_ttl=300.0, max_users=50_000):
+        self.idle_ttl = idle_ttl
+        self.max_users = max_users
+        self._thresholds = {}  # guild_id -> (max_messages, window)
+        self._users = OrderedDict()  # (guild_id, user_id) -> _UserWindow
+
+    def __len__(self):
+        return len(self._users)
+
+    def get_threshold(self, guild_id):
+        return self._thresholds.get(guild_id, (DEFAULT_MAX_MESSAGES, DEFAULT_WINDOW))
+
+    def set_threshold(self, guild_id, max_messages, window):
+        self._thresholds[guild_id] = (max_messages, float(window))
+
+    def clear_threshold(self, guild_id):
+        """Rétablit le seuil par défaut d'un serveur."""
+        self._thresholds.pop(guild_id, None)
+
+    def record(self, guild_id, user_id, now):
+        """
+        Enregistre un message et indique s'il dépasse le seuil du serveur.
+
+        Returns:
+            tuple[bool, bool]: (spam détecté, avertissement à envoyer)
+        """
+        max_messages, window = self.get_threshold(guild_id)
+        key = (guild_id, user_id)
+        state = self._users.get(key)
+        if state is None:
+            state = self._users[key] = _UserWindow(max_messages + 1)
+            if len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        else:
+            self._users.move_to_end(key)
+            if state.timestamps.maxlen != max_messages + 1:
+                state.timestamps = deque(state.timestamps, maxlen=max_messages + 1)
+
+        state.last_seen = now
+        timestamps = state.timestamps
+        timestamps.append(now)
+
+        if len(timestamps) == timestamps.maxlen and now - timestamps[0] < window:
+            should_warn = not state.warned
+            state.warned = True
+            return True, should_warn
+
+        state.warned = False
+        return False, False
+
+    def sweep(self, now):
+        """Évince les utilisateurs inactifs depuis plus de `idle_ttl` secondes."""
+        evicted = 0
+        users = self._users
+        while users:
+            key, state = next(iter(users.items()))
+            if now - state.last_seen < self.idle_ttl:
+                break
+            users.popitem(last=False)
+            evicted += 1
+        return evicted
@@ -0,0 +1,470 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.logger import logger
+
+SCHEMA_VERSION = 1
+DEFAULT_BANNED_WORDS = ["spam", "insulte", "mot_interdit"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace TEXT NOT NULL,
+    key       TEXT NOT NULL,
+    value     TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS banned_words (
+    word TEXT PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS warnings (
+    id           INTEGER PRIMARY KEY,
+    guild_id     INTEGER,
+    user_id      INTEGER NOT NULL,
+    moderator_id INTEGER,
+    reason       TEXT NOT NULL,
+    created_at   REAL,
+    expires_at   REAL
+);
+CREATE INDEX IF NOT EXISTS warnings_user ON warnings (user_id);
+
+-- Journal des avertissements, en ajout seul : compacté périodiquement dans `warnings`
+CREATE TABLE IF NOT EXISTS warning_journal (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    op           TEXT NOT NULL,
+    guild_id     INTEGER,
+    user_id      INTEGER NOT NULL,
+    moderator_id INTEGER,
+    reason       TEXT,
+    created_at   REAL,
+    expires_at   REAL,
+    warning_id   INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS leaderboard (
+    user_id TEXT PRIMARY KEY,
+    score   INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS guild_config (
+    guild_id INTEGER NOT NULL,
+    section  TEXT NOT NULL,
+    key      TEXT NOT NULL,
+    value    TEXT NOT NULL,
+    PRIMARY KEY (guild_id, section, key)
+) WITHOUT ROWID;
+
+-- Index des logs de messages (modifications et suppressions), partitionné par serveur
+CREATE TABLE IF NOT EXISTS message_log (
+    id          INTEGER PRIMARY KEY,
+    guild_id    INTEGER NOT NULL,
+    channel_id  INTEGER NOT NULL,
+    author_id   INTEGER,
+    message_id  INTEGER NOT NULL,
+    kind        TEXT NOT NULL,
+    content     TEXT NOT NULL,
+    new_content TEXT,
+    created_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS message_log_guild ON message_log (guild_id);
+CREATE INDEX IF NOT EXISTS message_log_author ON message_log (guild_id, author_id);
+CREATE INDEX IF NOT EXISTS message_log_channel ON message_log (guild_id, channel_id);
+
+-- Index plein texte sans contenu (le texte reste dans `message_log`). La colonne `guild`
+-- contient un jeton par serveur : une recherche ne parcourt que les documents du serveur.
+CREATE VIRTUAL TABLE IF NOT EXISTS message_log_fts USING fts5(
+    text, guild, content='', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS message_log_insert AFTER INSERT ON message_log BEGIN
+    INSERT INTO message_log_fts (rowid, text, guild)
+        VALUES (new.id, new.content || ' ' || coalesce(new.new_content, ''), 'g' || new.guild_id);
+END;
+CREATE TRIGGER IF NOT EXISTS message_log_delete AFTER DELETE ON message_log BEGIN
+    INSERT INTO message_log_fts (message_log_fts, rowid, text, guild)
+        VALUES ('delete', old.id, old.content || ' ' || coalesce(old.new_content, ''), 'g' || old.guild_id);
+END;
+
+-- Séries d'activité (compteurs de messages en tableaux circulaires), une ligne par palier
+CREATE TABLE IF NOT EXISTS activity (
+    guild_id INTEGER NOT NULL,
+    kind     TEXT NOT NULL,
+    key      INTEGER NOT NULL,
+    tier     INTEGER NOT NULL,
+    head     INTEGER NOT NULL,
+    data     BLOB NOT NULL,
+    PRIMARY KEY (guild_id, kind, key, tier)
+) WITHOUT ROWID;
+"""
+
+# Requêtes constantes : sqlite3 garde les instructions préparées en cache par texte SQL
+SQL_KV_GET = "SELECT value FROM kv WHERE namespace = ? AND key = ?"
+SQL_KV_NAMESPACE = "SELECT key, value FROM kv WHERE namespace = ?"
+SQL_KV_SET = (
+    "INSERT INTO kv (namespace, key, value) VALUES (?, ?, ?) "
+    "ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value"
+)
+SQL_KV_DELETE = "DELETE FROM kv WHERE namespace = ? AND key = ?"
+SQL_WORDS_ALL = "SELECT word FROM banned_words ORDER BY rowid"
+SQL_WORD_ADD = "INSERT OR IGNORE INTO banned_words (word) VALUES (?)"
+SQL_WARNINGS_ALL = (
+    "SELECT id, guild_id, user_id, moderator_id, reason, created_at, expires_at FROM warnings ORDER BY id"
+)
+SQL_WARNING_SNAPSHOT = (
+    "INSERT OR REPLACE INTO warnings (id, guild_id, user_id, moderator_id, reason, created_at, expires_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_WARNINGS_CLEAR = "DELETE FROM warnings WHERE user_id = ? AND (guild_id = ? OR guild_id IS NULL)"
+SQL_WARNING_EXPIRE = "DELETE FROM warnings WHERE id = ?"
+SQL_JOURNAL_ALL = (
+    "SELECT seq, op, guild_id, user_id, moderator_id, reason, created_at, expires_at, warning_id "
+    "FROM warning_journal ORDER BY seq"
+)
+SQL_JOURNAL_APPEND = (
+    "INSERT INTO warning_journal (op, guild_id, user_id, moderator_id, reason, created_at, expires_at, warning_id) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_JOURNAL_TRUNCATE = "DELETE FROM warning_journal WHERE seq <= ?"
+SQL_GUILD_VALUES = "SELECT section, key, value FROM guild_config WHERE guild_id = ?"
+SQL_GUILD_SET = (
+    "INSERT INTO guild_config (guild_id, section, key, value) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (guild_id, section, key) DO UPDATE SET value = excluded.value"
+)
+SQL_GUILD_DELETE = "DELETE FROM guild_config WHERE guild_id = ? AND section = ? AND key = ?"
+SQL_LOG_APPEND = (
+    "INSERT INTO message_log (guild_id, channel_id, author_id, message_id, kind, content, new_content, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_LOG_COLUMNS = "l.id, l.channel_id, l.author_id, l.message_id, l.kind, l.content, l.new_content, l.created_at"
+SQL_LOG_FIRST_FRESH = "SELECT id FROM message_log WHERE created_at >= ? ORDER BY id LIMIT 1"
+SQL_LOG_PRUNE_BEFORE = (
+    "DELETE FROM message_log WHERE id IN (SELECT id FROM message_log WHERE id < ? ORDER BY id LIMIT ?)"
+)
+SQL_LOG_GUILD_CUTOFF = "SELECT id FROM message_log WHERE guild_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?"
+SQL_LOG_PRUNE_GUILD = (
+    "DELETE FROM message_log WHERE id IN "
+    "(SELECT id FROM message_log WHERE guild_id = ? AND id <= ? ORDER BY id LIMIT ?)"
+)
+SQL_ACTIVITY_ALL = "SELECT guild_id, kind, key, tier, head, data FROM activity"
+SQL_ACTIVITY_SET = (
+    "INSERT INTO activity (guild_id, kind, key, tier, head, data) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (guild_id, kind, key, tier) DO UPDATE SET head = excluded.head, data = excluded.data"
+)
+SQL_ACTIVITY_DELETE_GUILD = "DELETE FROM activity WHERE guild_id = ?"
+SQL_ACTIVITY_DELETE_SERIES = "DELETE FROM activity WHERE guild_id = ? AND kind = ? AND key = ?"
+SQL_SCORES_ALL = "SELECT user_id, score FROM leaderboard"
+SQL_SCORE_SET = (
+    "INSERT INTO leaderboard (user_id, score) VALUES (?, ?) "
+    "ON CONFLICT (user_id) DO UPDATE SET score = excluded.score"
+)
+
+
+class Storage:
+    """
+    Stockage SQLite unique pour tous les cogs.
+
+    Une seule connexion (mode WAL) est utilisée depuis un exécuteur à un thread :
+    les accès disque ne bloquent jamais la boucle d'événements et sont sérialisés
+    sans verrou. Chaque modification est une écriture d'une ligne dans sa propre
+    transaction, au lieu de la réécriture complète d'un fichier JSON.
+    """
+
+    def __init__(self, path="data/bot.db"):
+        self.path = path
+        self._conn = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage")
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def open(self):
+        await self._run(self._open)
+        logger.info(f"☑️ Base de données ouverte : '{self.path}'.")
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=128)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn = conn
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            # Une seule transaction explicite : `executescript` validerait au passage et laisserait,
+            # en cas d'échec, une base à moitié créée avec l'ancienne version
+            conn.execute("BEGIN")
+            try:
+                for statement in _statements(SCHEMA):
+                    conn.execute(statement)
+                if version == 0:
+                    conn.executemany(SQL_WORD_ADD, [(word,) for word in DEFAULT_BANNED_WORDS])
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        self._migrate_legacy_files()
+
+    async def close(self):
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+            logger.info("☑️ Base de données fermée.")
+        self._executor.shutdown(wait=True)
+
+    # --- Accès génériques -------------------------------------------------
+
+    def _write(self, sql, params):
+        with self._conn:
+            self._conn.execute(sql, params)
+
+    def _write_many(self, sql, rows):
+        with self._conn:
+            self._conn.executemany(sql, rows)
+
+    def _insert(self, sql, params):
+        with self._conn:
+            return self._conn.execute(sql, params).lastrowid
+
+    def _delete(self, sql, params):
+        with self._conn:
+            return self._conn.execute(sql, params).rowcount
+
+    def _read(self, sql, params):
+        return self._conn.execute(sql, params).fetchall()
+
+    async def execute(self, sql, params=()):
+        await self._run(self._write, sql, params)
+
+    async def executemany(self, sql, rows):
+        await self._run(self._write_many, sql, list(rows))
+
+    async def fetchall(self, sql, params=()):
+        return await self._run(self._read, sql, params)
+
+    # --- Clé/valeur (configuration des cogs) ------------------------------
+
+    async def get_value(self, namespace, key, default=None):
+        rows = await self.fetchall(SQL_KV_GET, (namespace, key))
+        return json.loads(rows[0][0]) if rows else default
+
+    async def get_namespace(self, namespace):
+        rows = await self.fetchall(SQL_KV_NAMESPACE, (namespace,))
+        return {key: json.loads(value) for key, value in rows}
+
+    async def set_value(self, namespace, key, value):
+        await self.execute(SQL_KV_SET, (namespace, key, json.dumps(value, ensure_ascii=False)))
+
+    async def delete_value(self, namespace, key):
+        await self.execute(SQL_KV_DELETE, (namespace, key))
+
+    # --- Configuration par serveur ---------------------------------------
+
+    async def guild_values(self, guild_id):
+        """Retourne les valeurs définies pour un serveur sous forme de (section, clé, valeur)."""
+        rows = await self.fetchall(SQL_GUILD_VALUES, (guild_id,))
+        return [(section, key, json.loads(value)) for section, key, value in rows]
+
+    async def set_guild_value(self, guild_id, section, key, value):
+        await self.execute(SQL_GUILD_SET, (guild_id, section, key, json.dumps(value, ensure_ascii=False)))
+
+    async def delete_guild_value(self, guild_id, section, key):
+        await self.execute(SQL_GUILD_DELETE, (guild_id, section, key))
+
+    # --- Mots interdits ---------------------------------------------------
+
+    async def banned_words(self):
+        return [word for (word,) in await self.fetchall(SQL_WORDS_ALL)]
+
+    # --- Avertissements ---------------------------------------------------
+
+    async def warning_snapshot(self):
+        return await self.fetchall(SQL_WARNINGS_ALL)
+
+    async def warning_journal(self):
+        return await self.fetchall(SQL_JOURNAL_ALL)
+
+    async def append_warning_event(self, op, guild_id, user_id, moderator_id=None, reason=None,
+                                   created_at=None, expires_at=None, warning_id=None):
+        """Ajoute un événement au journal et retourne son numéro de séquence."""
+        return await self._run(self._insert, SQL_JOURNAL_APPEND, (
+            op, guild_id, user_id, moderator_id, reason, created_at, expires_at, warning_id
+        ))
+
+    async def compact_warnings(self):
+        """Reporte le journal dans l'instantané `warnings` puis le vide. Retourne le nombre d'événements."""
+        return await self._run(self._compact_warnings)
+
+    def _compact_warnings(self):
+        with self._conn:
+            events = self._conn.execute(SQL_JOURNAL_ALL).fetchall()
+            for seq, op, guild_id, user_id, moderator_id, reason, created_at, expires_at, warning_id in events:
+                if op == "warn":
+                    self._conn.execute(SQL_WARNING_SNAPSHOT, (
+                        seq, guild_id, user_id, moderator_id, reason, created_at, expires_at
+                    ))
+                elif op == "clear":
+                    self._conn.execute(SQL_WARNINGS_CLEAR, (user_id, guild_id))
+                elif op == "expire":
+                    self._conn.execute(SQL_WARNING_EXPIRE, (warning_id,))
+            if events:
+                self._conn.execute(SQL_JOURNAL_TRUNCATE, (events[-1][0],))
+        return len(events)
+
+    # --- Index des logs de messages ---------------------------------------
+
+    async def append_message_logs(self, rows):
+        """Ajoute des entrées (guild_id, channel_id, author_id, message_id, kind, content, new_content, created_at)."""
+        await self.executemany(SQL_LOG_APPEND, rows)
+
+    async def search_message_logs(self, guild_id, terms=None, author_id=None, channel_id=None,
+                                  since=None, until=None, before_id=None, limit=10):
+        """
+        Entrées d'un serveur, de la plus récente à la plus ancienne. La pagination se fait
+        par curseur : `before_id` est l'identifiant de la dernière entrée de la page précédente.
+        """
+        conditions, params = ["l.guild_id = ?"], [guild_id]
+        for column, value in (("l.author_id = ?", author_id), ("l.channel_id = ?", channel_id),
+                              ("l.created_at >= ?", since), ("l.created_at < ?", until), ("l.id < ?", before_id)):
+            if value is not None:
+                conditions.append(column)
+                params.append(value)
+
+        # Chaque terme est cité : la saisie ne peut pas injecter la syntaxe FTS5. Un terme sans
+        # lettre ni chiffre (`*`, `-`) ne donne aucun mot indexable et est ignoré.
+        phrases = " ".join(
+            '"' + term.rstrip("*").replace('"', '""') + '"' + ("*" if term.endswith("*") else "")
+            for term in terms or () if any(char.isalnum() for char in term)
+        )
+        if phrases:
+            sql = (
+                f"SELECT {SQL_LOG_COLUMNS} FROM message_log_fts JOIN message_log l ON l.id = message_log_fts.rowid "
+                f"WHERE message_log_fts MATCH ? AND {' AND '.join(conditions)} "
+                "ORDER BY message_log_fts.rowid DESC LIMIT ?"
+            )
+            params = [f'guild : "g{guild_id}" AND text : ({phrases})', *params]
+        else:
+            sql = f"SELECT {SQL_LOG_COLUMNS} FROM message_log l WHERE {' AND '.join(conditions)} ORDER BY l.id DESC LIMIT ?"
+        return await self.fetchall(sql, (*params, limit))
+
+    async def prune_message_logs(self, max_age, max_rows, guild_ids=(), chunk=5000):
+        """
+        Applique la rétention : supprime les entrées plus anciennes que `max_age` secondes et,
+        pour chaque serveur de `guild_ids`, celles au-delà des `max_rows` plus récentes.
+        Les suppressions se font par tranches pour ne pas bloquer les autres accès.
+        Retourne le nombre d'entrées supprimées.
+        """
+        deleted = 0
+        fresh = await self.fetchall(SQL_LOG_FIRST_FRESH, (time.time() - max_age,))
+        # Les identifiants suivent l'ordre d'insertion : tout ce qui précède la première entrée récente est périmé
+        boundary = fresh[0][0] if fresh else None
+        if boundary is None:
+            boundary = ((await self.fetchall("SELECT max(id) FROM message_log"))[0][0] or 0) + 1
+        while True:
+            count = await self._run(self._delete, SQL_LOG_PRUNE_BEFORE, (boundary, chunk))
+            deleted += count
+            if count < chunk:
+                break
+        for guild_id in guild_ids:
+            cutoff = await self.fetchall(SQL_LOG_GUILD_CUTOFF, (guild_id, max_rows))
+            if not cutoff:
+                continue
+            while True:
+                count = await self._run(self._delete, SQL_LOG_PRUNE_GUILD, (guild_id, cutoff[0][0], chunk))
+                deleted += count
+                if count < chunk:
+                    break
+        return deleted
+
+    # --- Activité des serveurs -------------------------------------------
+
+    async def activity_series(self):
+        return await self.fetchall(SQL_ACTIVITY_ALL)
+
+    async def save_activity(self, rows):
+        await self.executemany(SQL_ACTIVITY_SET, rows)
+
+    async def delete_activity(self, guild_id):
+        await self.execute(SQL_ACTIVITY_DELETE_GUILD, (guild_id,))
+
+    async def delete_activity_series(self, keys):
+        """Supprime les séries `(guild_id, type, clé)` données (tous leurs paliers)."""
+        await self.executemany(SQL_ACTIVITY_DELETE_SERIES, keys)
+
+    # --- Classement Trivia ------------------------------------------------
+
+    async def scores(self):
+        return dict(await self.fetchall(SQL_SCORES_ALL))
+
+    async def update_scores(self, scores):
+        await self.executemany(SQL_SCORE_SET, scores.items())
+
+    # --- Migration unique des anciens fichiers JSON -----------------------
+
+    def _migrate_legacy_files(self):
+        for path, importer in LEGACY_FILES:
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                with self._conn:
+                    importer(self._conn, data)
+                os.replace(path, f"{path}.migrated")
+                logger.info(f"☑️ '{path}' importé dans la base de données.")
+            except (OSError, ValueError, sqlite3.Error) as e:
+                logger.error(f"❌ Erreur lors de la migration de '{path}' : {e}")
+
+
+def _statements(script):
+    """Découpe un script SQL en instructions complètes (les déclencheurs contiennent des `;`)."""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement.strip()
+            statement = ""
+
+
+def _import_namespace(namespace):
+    def importer(conn, data):
+        conn.executemany(SQL_KV_SET, [
+            (namespace, key, json.dumps(value, ensure_ascii=False)) for key, value in data.items()
+        ])
+    return importer
+
+
+def _import_banned_words(conn, words):
+    conn.execute("DELETE FROM banned_words")
+    conn.executemany(SQL_WORD_ADD, [(word,) for word in words])
+
+
+def _import_warnings(conn, warnings):
+    conn.executemany(SQL_JOURNAL_APPEND, [
+        ("warn", None, int(user_id), None, reason, None, None, None)
+        for user_id, reasons in warnings.items() for reason in reasons
+    ])
+
+
+def _import_leaderboard(conn, scores):
+    conn.executemany(SQL_SCORE_SET, scores.items())
+
+
+def _import_default_roles(conn, roles):
+    conn.execute(SQL_KV_SET, ("roles", "default_roles", json.dumps(roles, ensure_ascii=False)))
+
+
+LEGACY_FILES = [
+    ("data/warnings.json", _import_warnings),
+    ("data/banned_words.json", _import_banned_words),
+    ("data/leaderboard.json", _import_leaderboard),
+    ("data/twitch_config.json", _import_namespace("twitch")),
+    ("data/welcome_config.json", _import_namespace("welcome")),
+    ("data/log_config.json", _import_namespace("message_logs")),
+    ("data/default_roles.json", _import_default_roles),
+    ("blague_config.json", _import_namespace("blague")),
+]
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import os
+import random
+from collections import OrderedDict, deque
+
+from utils.logger import logger
+
+
+class _CategoryPool:
+    __slots__ = ("fresh", "archive", "known", "seen", "refill_task", "backoff", "retry_at")
+
+    def __init__(self):
+        self.fresh = deque()         # Questions jamais servies
+        self.archive = []            # Questions déjà servies, réutilisées quand l'API ne fournit plus rien
+        self.known = set()           # Textes de toutes les questions connues (dédoublonnage)
+        self.seen = OrderedDict()    # user_id -> textes déjà posés à cet utilisateur (du moins récent au plus récent)
+        self.refill_task = None
+        self.backoff = 0.0           # Délai avant le prochain rechargement après un échec ou un lot sans nouveauté
+        self.retry_at = 0.0          # Instant (horloge de la boucle) avant lequel aucun rechargement n'est lancé
+
+
+class TriviaPool:
+    """
+    Réserve de questions Trivia par catégorie, servies localement.
+
+    Les questions jamais posées sont servies en priorité ; sous `low_water`, une tâche
+    de fond recharge la réserve depuis l'API. Quand l'API ne fournit plus de nouveautés
+    (ou est indisponible), les questions archivées sont réutilisées sans jamais reposer
+    une question à un même utilisateur avant qu'il ait fait le tour de la réserve.
+    La réserve est sauvegardée sur disque pour redémarrer à chaud.
+
+    Les appels à l'API sont espacés d'au moins `min_interval` secondes (OpenTDB accepte
+    une requête toutes les 5 s) ; un rechargement qui échoue ou n'apporte rien de neuf
+    double le délai avant le suivant, jusqu'à `max_backoff`.
+    """
+
+    def __init__(self, fetch, path, low_water=10, max_archive=1_000, min_interval=5.0, max_backoff=600.0,
+                 max_users=5_000):
+        self.fetch = fetch  # coroutine(category) -> liste de questions ou None
+        self.path = path
+        self.low_water = low_water
+        self.max_archive = max_archive
+        self.min_interval = min_interval
+        self.max_backoff = max_backoff
+        self.max_users = max_users  # Utilisateurs dont les questions vues sont suivies, par catégorie
+        self._pools = {}
+        self._fetch_lock = asyncio.Lock()
+        self._last_fetch = None
+
+    def _pool(self, category):
+        pool = self._pools.get(category)
+        if pool is None:
+            pool = self._pools[category] = _CategoryPool()
+        return pool
+
+    def _add(self, pool, questions, archived=False):
+        added = 0
+        for question in questions:
+            key = question["question"]
+            if key in pool.known:
+                continue
+            pool.known.add(key)
+            (pool.archive if archived else pool.fresh).append(question)
+            added += 1
+        return added
+
+    def _archive(self, pool, question):
+        pool.archive.append(question)
+        if len(pool.archive) > self.max_archive:
+            pool.known.discard(pool.archive.pop(0)["question"])
+
+    def take(self, category, user_id):
+        """Retourne une question inédite pour `user_id`, ou None si la réserve est vide."""
+        pool = self._pool(category)
+        seen = pool.seen.pop(user_id, None)
+        if seen is None or len(seen) >= self.max_archive:
+            seen = set()  # Les plus anciennes questions vues ont quitté l'archive : nouveau cycle
+        pool.seen[user_id] = seen
+        if len(pool.seen) > self.max_users:
+            pool.seen.popitem(last=False)
+        question = None
+
+        # Une question jamais servie ne peut pas avoir été vue par l'utilisateur
+        if pool.fresh:
+            question = pool.fresh.popleft()
+            self._archive(pool, question)
+        elif pool.archive:
+            candidates = [q for q in pool.archive if q["question"] not in seen]
+            if not candidates:
+                seen.clear()  # L'utilisateur a fait le tour : la réserve recommence un cycle
+                candidates = pool.archive
+            question = random.choice(candidates)
+
+        if len(pool.fresh) < self.low_water:
+            self.schedule_refill(category)
+        if question is not None:
+            seen.add(question["question"])
+        return question
+
+    def schedule_refill(self, category):
+        """Lance un rechargement si aucun n'est en cours ni en attente de reprise ; retourne la dernière tâche."""
+        pool = self._pool(category)
+        if pool.refill_task is not None and (
+            not pool.refill_task.done() or asyncio.get_running_loop().time() < pool.retry_at
+        ):
+            return pool.refill_task
+        pool.refill_task = asyncio.create_task(self.refill(category))
+        return pool.refill_task
+
+    async def refill(self, category):
+        """Recharge la réserve d'une catégorie depuis l'API puis la sauvegarde."""
+        pool = self._pool(category)
+        loop = asyncio.get_running_loop()
+        questions = None
+        async with self._fetch_lock:
+            if self._last_fetch is not None:
+                await asyncio.sleep(max(self._last_fetch + self.min_interval - loop.time(), 0))
+            try:
+                questions = await self.fetch(category)
+            except Exception as e:
+                logger.error(f"❌ Erreur lors du rechargement des questions Trivia ({category}) : {e}")
+            finally:
+                self._last_fetch = loop.time()
+
+        added = self._add(pool, questions) if questions else 0
+        if added:
+            pool.backoff = 0.0
+        else:
+            pool.backoff = min(max(pool.backoff * 2, self.min_interval), self.max_backoff)
+        pool.retry_at = loop.time() + pool.backoff
+        if questions:
+            logger.info(f"☑️ Réserve Trivia ({category}) : {added} nouvelle(s) question(s).")
+        if added:
+            await loop.run_in_executor(None, self.write, self.snapshot())
+        return added
+
+    def size(self, category):
+        pool = self._pool(category)
+        return len(pool.fresh), len(pool.archive)
+
+    def load(self):
+        """Recharge la réserve sauvegardée (démarrage à chaud)."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"❌ Erreur lors de la lecture de '{self.path}' : {e}")
+            return
+        for category, saved in data.items():
+            pool = self._pool(int(category))
+            self._add(pool, saved.get("fresh", []))
+            self._add(pool, saved.get("archive", []), archived=True)
+        logger.info(f"☑️ Réserve Trivia rechargée depuis '{self.path}'.")
+
+    def snapshot(self):
+        """Copie de la réserve, à prendre depuis la boucle d'événements avant écriture."""
+        return {
+            str(category): {"fresh": list(pool.fresh), "archive": list(pool.archive)}
+            for category, pool in self._pools.items()
+        }
+
+    def save(self):
+        self.write(self.snapshot())
+
+    def write(self, data):
+        """Écrit la réserve de façon atomique (fichier temporaire puis renommage)."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"❌ Erreur lors de la sauvegarde de '{self.path}' : {e}")
@@ -0,0 +1,69 @@
+import asyncio
+
+
+class _Waiter:
+    __slots__ = ("future", "check")
+
+    def __init__(self, future, check):
+        self.future = future
+        self.check = check
+
+
+class WaiterRegistry:
+    """
+    Remplace `bot.wait_for("message", check=...)` pour les attentes liées à un joueur.
+
+    discord.py évalue chaque prédicat en attente pour chaque message reçu ; ici les
+    attentes sont indexées par (salon, auteur), si bien qu'un message ne réveille que
+    les attentes qui le concernent, en O(1) quel que soit le nombre de parties en cours.
+    Une attente sans salon (`channel_id=None`) accepte un message de l'auteur n'importe où.
+    """
+
+    def __init__(self):
+        self._waiters = {}  # (channel_id | None, author_id) -> [_Waiter]
+
+    def __bool__(self):
+        return bool(self._waiters)
+
+    def __len__(self):
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def register(self, author_id, channel_id=None, check=None):
+        """Enregistre une attente et retourne le futur résolu par le prochain message correspondant."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault((channel_id, author_id), []).append(_Waiter(future, check))
+        return future
+
+    def discard(self, author_id, channel_id, future):
+        key = (channel_id, author_id)
+        waiters = self._waiters.get(key)
+        if not waiters:
+            return
+        waiters[:] = [waiter for waiter in waiters if waiter.future is not future]
+        if not waiters:
+            del self._waiters[key]
+
+    async def wait_for(self, author_id, channel_id=None, check=None, timeout=None):
+        """Attend le prochain message de `author_id` (dans `channel_id` si précisé)."""
+        future = self.register(author_id, channel_id, check)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.discard(author_id, channel_id, future)
+
+    def resolve(self, message) -> bool:
+        """Transmet un message aux attentes correspondantes. Retourne True s'il a été consommé."""
+        if not self._waiters:
+            return False
+        author_id = message.author.id
+        for key in ((message.channel.id, author_id), (None, author_id)):
+            waiters = self._waiters.get(key)
+            if not waiters:
+                continue
+            for waiter in waiters:
+                if waiter.future.done():
+                    continue
+                if waiter.check is None or waiter.check(message):
+                    waiter.future.set_result(message)
+                    return True
+        return False
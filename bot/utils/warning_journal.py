@@ -0,0 +1,127 @@
+import time
+
+from utils.logger import logger
+
+
+class WarningRecord:
+    __slots__ = ("id", "guild_id", "user_id", "moderator_id", "reason", "created_at", "expires_at")
+
+    def __init__(self, id, guild_id, user_id, moderator_id, reason, created_at, expires_at=None):
+        self.id = id
+        self.guild_id = guild_id
+        self.user_id = user_id
+        self.moderator_id = moderator_id
+        self.reason = reason
+        self.created_at = created_at
+        self.expires_at = expires_at  # None : l'avertissement n'expire jamais
+
+
+class WarningJournal:
+    """
+    Avertissements en mémoire, persistés par un journal en ajout seul.
+
+    Chaque avertissement, effacement ou expiration ajoute une seule ligne au journal. Au démarrage,
+    l'état est reconstruit en rejouant le journal par-dessus le dernier instantané ;
+    `compact()` reporte périodiquement le journal dans l'instantané pour borner le rejeu.
+    Les avertissements importés de l'ancien fichier JSON n'ont pas de serveur
+    (`guild_id` à None) : ils comptent sur tous les serveurs jusqu'à leur effacement.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._warnings = {}  # (guild_id, user_id) -> [WarningRecord]
+        self._by_id = {}     # id -> WarningRecord
+        self.pending = 0     # Événements du journal pas encore compactés
+
+    def __len__(self):
+        return sum(len(warnings) for warnings in self._warnings.values())
+
+    def get(self, guild_id, user_id):
+        """Avertissements d'un membre sur un serveur, du plus ancien au plus récent."""
+        own = self._warnings.get((guild_id, user_id), [])
+        legacy = self._warnings.get((None, user_id))
+        return legacy + own if legacy else list(own)
+
+    def expiring(self):
+        """Avertissements ayant une échéance (pour replanifier après un redémarrage)."""
+        return [warning for warning in self._by_id.values() if warning.expires_at is not None]
+
+    def _remove(self, warnings):
+        for warning in warnings:
+            self._by_id.pop(warning.id, None)
+        return warnings
+
+    def _apply(self, seq, op, guild_id, user_id, moderator_id=None, reason=None,
+               created_at=None, expires_at=None, warning_id=None):
+        if op == "warn":
+            warning = WarningRecord(seq, guild_id, user_id, moderator_id, reason, created_at, expires_at)
+            self._warnings.setdefault((guild_id, user_id), []).append(warning)
+            self._by_id[seq] = warning
+            return [warning]
+        if op == "clear":
+            return self._remove(
+                self._warnings.pop((guild_id, user_id), []) + self._warnings.pop((None, user_id), [])
+            )
+        if op == "expire":
+            warning = self._by_id.get(warning_id)
+            if warning is None:
+                return []
+            key = (warning.guild_id, warning.user_id)
+            remaining = [other for other in self._warnings.get(key, []) if other.id != warning_id]
+            if remaining:
+                self._warnings[key] = remaining
+            else:
+                self._warnings.pop(key, None)
+            return self._remove([warning])
+        return []
+
+    async def load(self):
+        """Reconstruit l'état : instantané puis rejeu du journal."""
+        self._warnings.clear()
+        self._by_id.clear()
+        for id, guild_id, user_id, moderator_id, reason, created_at, expires_at in await self.storage.warning_snapshot():
+            self._apply(id, "warn", guild_id, user_id, moderator_id, reason, created_at, expires_at)
+        events = await self.storage.warning_journal()
+        for event in events:
+            self._apply(*event)
+        self.pending = len(events)
+        logger.info(f"☑️ Avertissements rechargés : {len(self)} actif(s), {self.pending} événement(s) rejoué(s).")
+
+    async def warn(self, guild_id, user_id, moderator_id, reason, lifetime=None):
+        """Enregistre un avertissement (expirant après `lifetime` secondes si précisé) et le retourne."""
+        created_at = time.time()
+        expires_at = created_at + lifetime if lifetime else None
+        seq = await self.storage.append_warning_event(
+            "warn", guild_id, user_id, moderator_id, reason, created_at, expires_at
+        )
+        self.pending += 1
+        return self._apply(seq, "warn", guild_id, user_id, moderator_id, reason, created_at, expires_at)[0]
+
+    async def clear(self, guild_id, user_id, moderator_id):
+        """Efface les avertissements d'un membre sur un serveur et retourne ceux effacés."""
+        if not self.get(guild_id, user_id):
+            return []
+        await self.storage.append_warning_event("clear", guild_id, user_id, moderator_id, None, time.time())
+        self.pending += 1
+        return self._apply(None, "clear", guild_id, user_id)
+
+    async def expire(self, warning_id):
+        """Retire un avertissement arrivé à échéance et le retourne (None s'il n'existe plus)."""
+        warning = self._by_id.get(warning_id)
+        if warning is None:
+            return None
+        await self.storage.append_warning_event(
+            "expire", warning.guild_id, warning.user_id, created_at=time.time(), warning_id=warning_id
+        )
+        self.pending += 1
+        self._apply(None, "expire", warning.guild_id, warning.user_id, warning_id=warning_id)
+        return warning
+
+    async def compact(self):
+        """Reporte le journal dans l'instantané. Retourne le nombre d'événements compactés."""
+        if not self.pending:
+            return 0
+        compacted = await self.storage.compact_warnings()
+        self.pending = max(self.pending - compacted, 0)
+        logger.info(f"☑️ Journal des avertissements compacté ({compacted} événement(s)).")
+        return compacted